@@ -1,6 +1,25 @@
 """Atomate2 is a library of computational materials science workflows."""
 
 from atomate2._version import __version__
-from atomate2.settings import Atomate2Settings
 
-SETTINGS = Atomate2Settings()
+
+def __getattr__(name: str):
+    """
+    Lazily load the atomate2 settings.
+
+    The settings are only instantiated (and the settings file read) the first time
+    they are accessed, after which they are cached on the module.
+    """
+    if name == "SETTINGS":
+        from atomate2.settings import Atomate2Settings
+
+        settings = Atomate2Settings()
+        globals()["SETTINGS"] = settings
+        return settings
+
+    if name == "Atomate2Settings":
+        from atomate2.settings import Atomate2Settings
+
+        return Atomate2Settings
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
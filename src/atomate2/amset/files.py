@@ -5,14 +5,17 @@ from __future__ import annotations
 import logging
 from pathlib import Path
 
-from monty.serialization import loadfn
+from monty.serialization import dumpfn, loadfn
 
-from atomate2 import SETTINGS
-from atomate2.common.files import copy_files, get_zfile, gunzip_files, rename_files
+from atomate2.common.files import copy_files, get_zfile, gunzip_files
 from atomate2.utils.file_client import FileClient, auto_fileclient
 from atomate2.utils.path import strip_hostname
+from atomate2.vasp.summary import SUMMARY_FILENAME
 
-__all__ = ["copy_amset_files"]
+__all__ = ["copy_amset_files", "write_band_structure_data"]
+
+BAND_STRUCTURE_DATA_FILENAME = "band_structure_data.json"
+CONVERGENCE_FILENAME = "convergence.json"
 
 
 logger = logging.getLogger(__name__)
@@ -27,7 +30,9 @@ def copy_amset_files(
     """
     Copy AMSET files to current directory.
 
-    This function will gunzip any gzipped files.
+    This function will gunzip any gzipped files. If the source directory contains a
+    band_structure_data.json file, it is used instead of the vasprun.xml as it is much
+    faster to load.
 
     Parameters
     ----------
@@ -46,20 +51,32 @@ def copy_amset_files(
     logger.info(f"Copying AMSET inputs from {src_dir}")
     directory_listing = file_client.listdir(src_dir, host=src_host)
 
+    bs_data_file = get_zfile(
+        directory_listing, BAND_STRUCTURE_DATA_FILENAME, allow_missing=True
+    )
+    input_file = "vasprun.xml" if bs_data_file is None else BAND_STRUCTURE_DATA_FILENAME
+
     # find optional files
     files = []
     for file in (
         "settings.yaml",
-        "vasprun.xml",
-        "band_structure_data.json",
+        input_file,
         "wavefunction.h5",
         "deformation.h5",
-        "transport.json",
+        CONVERGENCE_FILENAME,
     ):
         found_file = get_zfile(directory_listing, file, allow_missing=True)
         if found_file is not None:
             files.append(found_file)
 
+    # the VASP summary is only valid alongside the vasprun.xml it was written with
+    if input_file == "vasprun.xml" and (
+        get_zfile(directory_listing, "vasprun.xml", allow_missing=True) is not None
+    ):
+        found_file = get_zfile(directory_listing, SUMMARY_FILENAME, allow_missing=True)
+        if found_file is not None:
+            files.append(found_file)
+
     copy_files(
         src_dir,
         src_host=src_host,
@@ -73,7 +90,6 @@ def copy_amset_files(
         file_client=file_client,
     )
 
-    rename_files({"transport.json": "transport.prev.json"}, allow_missing=True)
     logger.info("Finished copying inputs")
 
 
@@ -94,6 +110,8 @@ def write_amset_settings(settings_updates: dict, from_prev: bool = False):
     """
     from amset.io import write_settings
 
+    from atomate2 import SETTINGS
+
     if from_prev:
         settings = loadfn("settings.yaml")
         settings.update(settings_updates)
@@ -104,3 +122,41 @@ def write_amset_settings(settings_updates: dict, from_prev: bool = False):
         settings.update(SETTINGS.AMSET_SETTINGS_UPDATE)
 
     write_settings(settings, "settings.yaml")
+
+
+def write_band_structure_data():
+    """
+    Convert the vasprun.xml in the current directory to an AMSET band structure file.
+
+    The band_structure_data.json file contains only the data needed by AMSET and is
+    much faster to load than the vasprun.xml, so can be reused by subsequent AMSET
+    calculations. As AMSET only detects spin-orbit coupling from the vasprun.xml, the
+    "soc" setting is also written to settings.yaml.
+
+    Nothing is written if the band structure file already exists or there is no
+    vasprun.xml in the current directory.
+    """
+    from amset.constants import defaults
+    from amset.electronic_structure.common import get_band_structure
+    from amset.io import write_settings
+    from pymatgen.io.vasp import Vasprun
+
+    directory_listing = list(Path.cwd().iterdir())
+    vasprun_file = get_zfile(directory_listing, "vasprun.xml", allow_missing=True)
+    bs_data_file = get_zfile(
+        directory_listing, BAND_STRUCTURE_DATA_FILENAME, allow_missing=True
+    )
+    if vasprun_file is None or bs_data_file is not None:
+        return
+
+    settings = loadfn("settings.yaml")
+    zwk_mode = settings.get("zero_weighted_kpoints", defaults["zero_weighted_kpoints"])
+
+    # this mirrors the way amset loads the vasprun.xml
+    vasprun = Vasprun(str(vasprun_file), parse_projected_eigen=True)
+    band_structure = get_band_structure(vasprun, zero_weighted=zwk_mode)
+    data = {"nelect": vasprun.parameters["NELECT"], "band_structure": band_structure}
+    dumpfn(data, BAND_STRUCTURE_DATA_FILENAME)
+
+    settings["soc"] = vasprun.parameters["LSORBIT"]
+    write_settings(settings, "settings.yaml")
@@ -7,14 +7,25 @@ from dataclasses import dataclass, field
 from pathlib import Path
 
 from jobflow import Maker, Response, job
-from monty.serialization import loadfn
+from monty.serialization import dumpfn, loadfn
 from monty.shutil import gzip_dir
 
-from atomate2.amset.files import copy_amset_files, write_amset_settings
-from atomate2.amset.run import check_converged, run_amset
+from atomate2.amset.files import (
+    CONVERGENCE_FILENAME,
+    copy_amset_files,
+    write_amset_settings,
+    write_band_structure_data,
+)
+from atomate2.amset.run import (
+    get_convergence_error,
+    get_next_interpolation_factor,
+    get_transport_averages,
+    run_amset,
+    run_amset_sweep,
+)
 from atomate2.amset.schemas import AmsetTaskDocument
 
-__all__ = ["AmsetMaker"]
+__all__ = ["AmsetMaker", "AmsetSweepMaker"]
 
 logger = logging.getLogger(__name__)
 
@@ -31,13 +42,19 @@ class AmsetMaker(Maker):
     resubmit : bool
         Whether to resubmit an new calculation with a denser interpolation factor if the
         transport results are not converged. Note, checking for convergence requires
-        a previous AMSET directory.
+        a previous AMSET directory. The convergence history is kept across
+        resubmissions and used to extrapolate the interpolation factor needed for
+        convergence. See :obj:`.get_next_interpolation_factor`.
+    convergence_tolerance : float
+        Relative tolerance on the averaged transport properties used to decide whether
+        the calculation is converged.
     task_document_kwargs : dict
         Keyword arguments passed to :obj:`.AmsetTaskDocument.from_directory`.
     """
 
     name: str = "amset"
     resubmit: bool = False
+    convergence_tolerance: float = 0.1
     task_document_kwargs: dict = field(default_factory=dict)
 
     @job(output_schema=AmsetTaskDocument, data=["transport", "mesh"])
@@ -69,21 +86,9 @@ class AmsetMaker(Maker):
         """
         # copy previous inputs
         from_prev = prev_amset_dir is not None
-        if prev_amset_dir is not None:
-            copy_amset_files(prev_amset_dir)
-        else:
-            if bandstructure_dir is None:
-                raise ValueError(
-                    "Either prev_amset_dir or bandstructure_dir must be set"
-                )
-
-            copy_amset_files(bandstructure_dir)
-
-            if deformation_dir is not None:
-                copy_amset_files(deformation_dir)
-
-            if wavefunction_dir is not None:
-                copy_amset_files(wavefunction_dir)
+        _copy_inputs(
+            prev_amset_dir, wavefunction_dir, deformation_dir, bandstructure_dir
+        )
 
         # write amset settings
         write_amset_settings(settings, from_prev=from_prev)
@@ -94,13 +99,21 @@ class AmsetMaker(Maker):
 
         converged = None
         if self.resubmit:
-            prev_transport_file = Path("transport.prev.json")
-            if not prev_transport_file.exists():
+            history = _update_convergence_history()
+            error = history[-1]["error"]
+            if len(history) == 1:
                 logger.info("No previous transport calculations found.")
                 converged = False
+            elif error is None:
+                logger.info("No transport properties to compare, skipping...")
+                converged = True
             else:
-                transport_data = loadfn(next(Path().glob("transport_*.json")))
-                converged = check_converged(transport_data, loadfn(prev_transport_file))
+                logger.info(f"Maximum transport difference: {error * 100:.2f} %")
+                converged = error <= self.convergence_tolerance
+
+            if not converged:
+                # reuse the parsed band structure in the next calculation
+                write_band_structure_data()
 
         if "include_mesh" not in self.task_document_kwargs:
             self.task_document_kwargs["include_mesh"] = converged is not False
@@ -117,9 +130,148 @@ class AmsetMaker(Maker):
         # handle resubmission for non-converged calculations
         replace = None
         if self.resubmit and not converged:
+            factor = get_next_interpolation_factor(
+                history, tolerance=self.convergence_tolerance
+            )
+            logger.info(f"Resubmitting with interpolation factor: {factor}")
             replace = self.make(
-                {"interpolation_factor": settings.get("interpolation_factor", 10) + 5},
+                {"interpolation_factor": factor},
                 prev_amset_dir=task_doc.dir_name,
             )
 
         return Response(output=task_doc, replace=replace)
+
+
+@dataclass
+class AmsetSweepMaker(Maker):
+    """
+    Maker to run several AMSET calculations that share a band interpolation.
+
+    Each settings variant is run in the same job. The band structure interpolation is
+    only fit once and the wavefunction coefficients are only loaded once, making this
+    much cheaper than running separate AMSET jobs when, for example, scanning doping
+    concentrations, temperatures, or materials parameters. Variants that change the
+    interpolation factor require a new fit.
+
+    Parameters
+    ----------
+    name : str
+        Name of jobs produced by this maker.
+    task_document_kwargs : dict
+        Keyword arguments passed to :obj:`.AmsetTaskDocument.from_directory`.
+    """
+
+    name: str = "amset sweep"
+    task_document_kwargs: dict = field(default_factory=dict)
+
+    @job(data=["transport", "mesh"])
+    def make(
+        self,
+        settings: dict,
+        variants: list[dict],
+        prev_amset_dir: str | Path = None,
+        wavefunction_dir: str | Path = None,
+        deformation_dir: str | Path = None,
+        bandstructure_dir: str | Path = None,
+    ):
+        """
+        Run a sweep of AMSET calculations.
+
+        Parameters
+        ----------
+        settings : dict
+            Amset settings shared by all variants.
+        variants : list of dict
+            The settings for each calculation, applied on top of ``settings``.
+        prev_amset_dir : str or Path
+            A previous AMSET calculation directory to copy output files from. For
+            example, a converged calculation from :obj:`AmsetMaker`.
+        wavefunction_dir : str or Path
+            A directory containing a wavefunction.h5 file.
+        deformation_dir : str or Path
+            A directory containing a deformation.h5 file.
+        bandstructure_dir : str or Path
+            A directory containing the dense band structure file (vasprun.xml or
+            band_structure_data.json).
+
+        Returns
+        -------
+        list of AmsetTaskDocument
+            A task document for each variant, in the same order as ``variants``.
+        """
+        # copy previous inputs
+        from_prev = prev_amset_dir is not None
+        _copy_inputs(
+            prev_amset_dir, wavefunction_dir, deformation_dir, bandstructure_dir
+        )
+
+        # write amset settings
+        write_amset_settings(settings, from_prev=from_prev)
+
+        # run amset
+        logger.info(f"Running AMSET sweep over {len(variants)} variants")
+        variant_dirs = run_amset_sweep(variants)
+
+        # parse amset outputs
+        task_docs = [
+            AmsetTaskDocument.from_directory(d, **self.task_document_kwargs)
+            for d in variant_dirs
+        ]
+
+        # gzip folder
+        gzip_dir(".")
+
+        return Response(output=task_docs)
+
+
+def _copy_inputs(
+    prev_amset_dir: str | Path | None,
+    wavefunction_dir: str | Path | None,
+    deformation_dir: str | Path | None,
+    bandstructure_dir: str | Path | None,
+):
+    """Copy the AMSET inputs to the current directory."""
+    if prev_amset_dir is not None:
+        copy_amset_files(prev_amset_dir)
+        return
+
+    if bandstructure_dir is None:
+        raise ValueError("Either prev_amset_dir or bandstructure_dir must be set")
+
+    copy_amset_files(bandstructure_dir)
+
+    if deformation_dir is not None:
+        copy_amset_files(deformation_dir)
+
+    if wavefunction_dir is not None:
+        copy_amset_files(wavefunction_dir)
+
+
+def _update_convergence_history() -> list[dict]:
+    """Add the current calculation to the convergence history in the current dir."""
+    from amset.constants import defaults
+
+    history_file = Path(CONVERGENCE_FILENAME)
+    history = loadfn(history_file) if history_file.exists() else []
+
+    settings = loadfn("settings.yaml")
+    transport_file = next(Path().glob("transport_*.json"))
+    mesh = transport_file.stem.split("_")[-1]
+    averages = get_transport_averages(loadfn(transport_file))
+
+    error = None
+    if len(history) > 0:
+        error = get_convergence_error(averages, history[-1]["averages"])
+
+    history.append(
+        {
+            "interpolation_factor": settings.get(
+                "interpolation_factor", defaults["interpolation_factor"]
+            ),
+            "kpoint_mesh": [int(i) for i in mesh.split("x")],
+            "error": error,
+            "averages": averages,
+        }
+    )
+    dumpfn(history, history_file)
+    return history
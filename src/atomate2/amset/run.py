@@ -3,16 +3,29 @@
 from __future__ import annotations
 
 import logging
+import math
 import subprocess
+import sys
+from pathlib import Path
 
 import numpy as np
+from monty.serialization import dumpfn
 from pydash import get
 
-__all__ = ["run_amset", "check_converged"]
+__all__ = [
+    "run_amset",
+    "run_amset_sweep",
+    "check_converged",
+    "get_transport_averages",
+    "get_convergence_error",
+    "get_next_interpolation_factor",
+]
 
 logger = logging.getLogger(__name__)
 _CONVERGENCE_PROPERTIES = ("mobility.overall", "seebeck")
 
+SWEEP_FILENAME = "amset_sweep.json"
+
 
 def run_amset():
     """Run amset in the current directory."""
@@ -22,6 +35,50 @@ def run_amset():
         subprocess.call(["amset", "run"], stdout=f_std, stderr=f_err)
 
 
+def run_amset_sweep(variants: list[dict]) -> list[Path]:
+    """
+    Run several AMSET calculations in the current directory.
+
+    The variants are run in a single process that fits the band structure
+    interpolation and loads the wavefunction coefficients only once. See
+    :obj:`atomate2.amset.sweep.run_sweep` for details of the outputs.
+
+    Parameters
+    ----------
+    variants : list of dict
+        The settings for each calculation. These are applied on top of the settings
+        in the settings.yaml file in the current directory.
+
+    Returns
+    -------
+    list of Path
+        The directory of each variant.
+
+    Raises
+    ------
+    RuntimeError
+        If the sweep process fails. The message includes the contents of the
+        std_err.log file.
+    """
+    dumpfn(variants, SWEEP_FILENAME)
+
+    # Run in a separate process as running AMSET from python can cause issues with
+    # multiprocessing
+    with open("std_out.log", "w") as f_std, open("std_err.log", "w") as f_err:
+        return_code = subprocess.call(
+            [sys.executable, "-m", "atomate2.amset.sweep"],
+            stdout=f_std,
+            stderr=f_err,
+        )
+
+    if return_code != 0:
+        std_err = Path("std_err.log").read_text()
+        raise RuntimeError(
+            f"AMSET sweep failed with return code {return_code}:\n{std_err}"
+        )
+    return [Path.cwd() / f"variant_{i}" for i in range(len(variants))]
+
+
 def check_converged(
     new_transport: dict,
     old_transport: dict,
@@ -57,15 +114,10 @@ def check_converged(
             logger.info(f"'{prop}' not in new or old transport data, skipping...")
             continue
 
-        new_avg = tensor_average(new_prop)
-        old_avg = tensor_average(old_prop)
-        diff = np.abs((new_avg - old_avg) / new_avg)
-        diff[~np.isfinite(diff)] = 0
-
-        # don't check convergence of very small numbers due to numerical noise
-        less_than_one = (np.abs(new_avg) < 1) & (np.abs(old_avg) < 1)
-        element_converged = less_than_one | (diff <= tolerance)
-        if not np.all(element_converged):
+        diff = _get_relative_difference(
+            tensor_average(new_prop), tensor_average(old_prop)
+        )
+        if not np.all(diff <= tolerance):
             logger.info(f"{prop} is not converged - max diff: {np.max(diff) * 100} %")
             converged = False
 
@@ -75,6 +127,131 @@ def check_converged(
     return converged
 
 
+def get_transport_averages(
+    transport: dict, properties: tuple[str, ...] = _CONVERGENCE_PROPERTIES
+) -> dict[str, list]:
+    """
+    Get the averaged transport properties used to assess convergence.
+
+    Parameters
+    ----------
+    transport : dict
+        The transport data.
+    properties : tuple of str
+        The properties to average. See :obj:`check_converged` for the options.
+
+    Returns
+    -------
+    dict
+        The average of the tensor eigenvalues for each property, with the shape
+        (ntemperatures, ndoping). Property names are given with "." replaced by "_",
+        e.g., "mobility_overall".
+    """
+    averages = {}
+    for prop in properties:
+        value = get(transport, prop, None)
+        if value is not None:
+            averages[prop.replace(".", "_")] = tensor_average(value).tolist()
+    return averages
+
+
+def get_convergence_error(new_averages: dict, old_averages: dict) -> float | None:
+    """
+    Get the maximum relative difference between two sets of averaged properties.
+
+    Parameters
+    ----------
+    new_averages : dict
+        The new averaged transport properties, as from
+        :obj:`get_transport_averages`.
+    old_averages : dict
+        The old averaged transport properties.
+
+    Returns
+    -------
+    float or None
+        The maximum relative difference across all properties, or ``None`` if there
+        are no properties in common.
+    """
+    errors = []
+    for prop, new_avg in new_averages.items():
+        if prop in old_averages:
+            diff = _get_relative_difference(
+                np.array(new_avg), np.array(old_averages[prop])
+            )
+            errors.append(float(np.max(diff, initial=0)))
+    return max(errors) if len(errors) > 0 else None
+
+
+def get_next_interpolation_factor(
+    history: list[dict],
+    tolerance: float = 0.1,
+    min_step: float = 5,
+    max_scale: float = 2,
+) -> int:
+    """
+    Extrapolate the interpolation factor needed to converge the transport.
+
+    The relative difference between consecutive calculations is assumed to decay as a
+    power law of the interpolation factor, error ~ factor^(-order). The order is fit to
+    the last two errors in the history, or taken as 1 if only one error is available.
+
+    Parameters
+    ----------
+    history : list of dict
+        The convergence history, ordered from the first calculation. Each entry should
+        have the keys "interpolation_factor" and "error" (the relative difference to
+        the previous calculation, or ``None`` for the first calculation).
+    tolerance : float
+        The relative convergence tolerance.
+    min_step : float
+        The minimum increase in the interpolation factor.
+    max_scale : float
+        The maximum factor by which the interpolation factor can be increased.
+
+    Returns
+    -------
+    int
+        The next interpolation factor.
+    """
+    current = history[-1]["interpolation_factor"]
+    lower = current + min_step
+    upper = max(current * max_scale, lower)
+
+    points = [
+        (h["interpolation_factor"], h["error"])
+        for h in history
+        if h.get("error") is not None and h["error"] > 0
+    ]
+    if history[-1].get("error") is None or len(points) == 0:
+        return math.ceil(lower)
+
+    order = 1.0
+    if len(points) > 1:
+        (factor1, error1), (factor2, error2) = points[-2:]
+        if factor2 == factor1:
+            return math.ceil(upper)
+        order = -math.log(error2 / error1) / math.log(factor2 / factor1)
+
+    if order <= 0:
+        # the error is not decreasing, take the largest step allowed
+        logger.info("Transport error is not decreasing with interpolation factor")
+        return math.ceil(upper)
+
+    factor = current * (points[-1][1] / tolerance) ** (1 / order)
+    return math.ceil(min(max(factor, lower), upper))
+
+
+def _get_relative_difference(new_avg: np.ndarray, old_avg: np.ndarray) -> np.ndarray:
+    diff = np.abs((new_avg - old_avg) / new_avg)
+    diff[~np.isfinite(diff)] = 0
+
+    # don't check convergence of very small numbers due to numerical noise
+    less_than_one = (np.abs(new_avg) < 1) & (np.abs(old_avg) < 1)
+    diff[less_than_one] = 0
+    return diff
+
+
 def tensor_average(tensor: list | np.ndarray) -> float | np.ndarray:
     """Calculate the average of the tensor eigenvalues.
 
@@ -12,10 +12,16 @@ from pydantic import BaseModel, Field
 from pymatgen.core import Structure
 
 from atomate2 import __version__
-from atomate2.common.schemas.math import Matrix3D, Vector3D
+from atomate2.common.schemas.math import (
+    ChunkedArray,
+    Matrix3D,
+    PackedArray,
+    Vector3D,
+)
 from atomate2.common.schemas.structure import StructureMetadata
 from atomate2.utils.datetime import datetime_str
 from atomate2.utils.path import get_uri
+from atomate2.vasp.summary import get_summary_structure, load_vasp_summary
 
 try:
     import amset
@@ -72,18 +78,26 @@ class UsageStats(BaseModel):
 
 
 class MeshData(BaseModel):
-    """Definition of full AMSET mesh data."""
+    """
+    Definition of full AMSET mesh data.
 
-    energies: Dict[str, List[List[float]]] = Field(
+    Large arrays are stored in a compressed binary format. The energies and velocities
+    are chunked by band and the scattering rates by scattering type, doping and
+    temperature, so that single slices can be unpacked without decompressing the full
+    array. Use :obj:`MeshData.get_array` and :obj:`MeshData.get_scattering_rates` to
+    access the data as numpy arrays.
+    """
+
+    energies: Union[Dict[str, ChunkedArray], Dict[str, List[List[float]]]] = Field(
         None, description="Band structure energies in eV on the irreducible mesh."
     )
-    kpoints: List[Vector3D] = Field(
+    kpoints: Union[PackedArray, List[Vector3D]] = Field(
         None, description="K-points in fractional coordinates"
     )
-    ir_kpoints: List[Vector3D] = Field(
+    ir_kpoints: Union[PackedArray, List[Vector3D]] = Field(
         None, description="Irreducible k-points in fractional coordinates"
     )
-    ir_to_full_kpoint_mapping: List[int] = Field(
+    ir_to_full_kpoint_mapping: Union[PackedArray, List[int]] = Field(
         None, description="Mapping from irreducible to full k-points"
     )
     efermi: float = Field(None, description="Intrinsic Fermi level from band structure")
@@ -91,10 +105,12 @@ class MeshData(BaseModel):
         None, description="Index of highest valence band for each spin"
     )
     num_electrons: float = Field(None, description="Number of electrons in the system")
-    velocities: Dict[str, List[List[Vector3D]]] = Field(
+    velocities: Union[Dict[str, ChunkedArray], Dict[str, List[List[Vector3D]]]] = Field(
         None, description="Band velocities for each irreducible k-point."
     )
-    scattering_rates: Dict[str, List[List[List[List[List[float]]]]]] = Field(
+    scattering_rates: Union[
+        Dict[str, ChunkedArray], Dict[str, List[List[List[List[List[float]]]]]]
+    ] = Field(
         None,
         description="Scattering rates in s^-1, given as "
         "{spin: (nscattering_types, ndoping, ntemps, nbands, nkpoints)}",
@@ -105,6 +121,117 @@ class MeshData(BaseModel):
         "given as (min_cutoff, max_cutoff) where each cutoff is given"
         "as (ndoping, ntemps)",
     )
+    shapes: Dict[str, List[int]] = Field(
+        None,
+        description="The shape of each array, given as {key: shape}. Spin dependent "
+        "arrays are given with the key 'name.spin', e.g., 'energies.up'",
+    )
+
+    @classmethod
+    def from_mesh(cls, mesh: Dict[str, Any]) -> "MeshData":
+        """
+        Create mesh data from an AMSET mesh, storing the arrays in a packed format.
+
+        Parameters
+        ----------
+        mesh : dict
+            The mesh data, as loaded by :obj:`amset.io.load_mesh`.
+
+        Returns
+        -------
+        MeshData
+            The mesh data.
+        """
+        # number of leading axes to chunk each spin dependent array along
+        chunked = {"energies": 1, "velocities": 1, "scattering_rates": 3}
+        packed = ("kpoints", "ir_kpoints", "ir_to_full_kpoint_mapping")
+
+        data: Dict[str, Any] = {}
+        shapes = {}
+        for key, chunk_ndim in chunked.items():
+            if mesh.get(key) is None:
+                continue
+            data[key] = {}
+            for spin, value in mesh[key].items():
+                spin_name = getattr(spin, "name", spin)
+                data[key][spin_name] = ChunkedArray.from_array(value, chunk_ndim)
+                shapes[f"{key}.{spin_name}"] = list(np.shape(value))
+
+        for key in packed:
+            if mesh.get(key) is not None:
+                data[key] = PackedArray.from_array(np.asarray(mesh[key]))
+                shapes[key] = list(np.shape(mesh[key]))
+
+        if mesh.get("vb_idx") is not None:
+            data["vb_idx"] = {
+                getattr(s, "name", s): int(i) for s, i in mesh["vb_idx"].items()
+            }
+        for key in ("efermi", "num_electrons"):
+            if mesh.get(key) is not None:
+                data[key] = float(mesh[key])
+        if mesh.get("fd_cutoffs") is not None:
+            data["fd_cutoffs"] = np.asarray(mesh["fd_cutoffs"]).tolist()
+
+        return cls(shapes=shapes, **data)
+
+    def get_array(self, name: str, spin: str = None) -> np.ndarray:
+        """
+        Get mesh data as a numpy array.
+
+        Parameters
+        ----------
+        name : str
+            The name of the mesh data, e.g., "energies" or "kpoints".
+        spin : str or None
+            The spin channel ("up" or "down"), required for spin dependent data.
+
+        Returns
+        -------
+        numpy.ndarray
+            The mesh data.
+        """
+        data = getattr(self, name)
+        if isinstance(data, dict):
+            if spin is None:
+                raise ValueError(f"spin must be specified to get {name}")
+            data = data[spin]
+        if isinstance(data, (PackedArray, ChunkedArray)):
+            return data.to_array()
+        return np.array(data)
+
+    def get_scattering_rates(
+        self, spin: str, doping_idx: int, temperature_idx: int
+    ) -> np.ndarray:
+        """
+        Get the scattering rates for a single doping and temperature.
+
+        Only the chunks for the requested doping and temperature are unpacked.
+
+        Parameters
+        ----------
+        spin : str
+            The spin channel ("up" or "down").
+        doping_idx : int
+            The doping index.
+        temperature_idx : int
+            The temperature index.
+
+        Returns
+        -------
+        numpy.ndarray
+            The scattering rates in s^-1 with the shape
+            (nscattering_types, nbands, nkpoints).
+        """
+        rates = self.scattering_rates[spin]
+        if not isinstance(rates, ChunkedArray):
+            return np.array(rates)[:, doping_idx, temperature_idx]
+
+        return np.array(
+            [
+                rates.get_chunk(i, doping_idx, temperature_idx)
+                for i in range(rates.shape[0])
+            ]
+        )
 
 
 class AmsetTaskDocument(StructureMetadata):
@@ -125,6 +252,11 @@ class AmsetTaskDocument(StructureMetadata):
     converged: bool = Field(
         None, description="Whether the transport results are converged within 10 %"
     )
+    convergence_history: List[Dict[str, Any]] = Field(
+        None,
+        description="Interpolation factor, k-point mesh and relative difference to the "
+        "previous calculation for each calculation in a convergence series",
+    )
     kpoint_mesh: Vector3D = Field(None, description="Interpolated k-point mesh used")
     nkpoints: int = Field(None, description="Total number of interpolated k-points")
     log: str = Field(None, description="Full AMSET running log")
@@ -166,45 +298,54 @@ class AmsetTaskDocument(StructureMetadata):
             A task document for the amset calculation.
         """
         from amset.io import load_mesh
-        from amset.util import cast_dict_list
 
         additional_fields = {} if additional_fields is None else additional_fields
         dir_name = Path(dir_name)
 
-        settings = loadfn("settings.yaml")
-        transport_file = next(Path(".").glob("*transport_*"))
+        settings = loadfn(dir_name / "settings.yaml")
+        transport_file = next(dir_name.glob("*transport_*"))
         inter_mesh = re.findall(r"transport_(\d+)x(\d+)x(\d+)\.", transport_file.name)
         inter_mesh = list(map(int, inter_mesh[0]))
-        log = Path("amset.log").read_text()
+        log = (dir_name / "amset.log").read_text()
 
         transport = loadfn(transport_file)
-        timing = loadfn("timing.json.gz") if Path("timing.json.gz").exists() else None
+        timing_file = dir_name / "timing.json.gz"
+        timing = loadfn(timing_file) if timing_file.exists() else None
+
+        convergence_history = None
+        if (dir_name / "convergence.json").exists():
+            # the averaged properties are only needed to extend the history
+            convergence_history = [
+                {k: v for k, v in h.items() if k != "averages"}
+                for h in loadfn(dir_name / "convergence.json")
+            ]
 
         # insert mesh if calculation is converged or convergence is not known
         mesh_kwargs = {}
-        mesh_files = list(Path(".").glob("*mesh_*"))
+        mesh_files = list(dir_name.glob("*mesh_*"))
         if len(mesh_files) > 0:
-            mesh = load_mesh(mesh_files[0])
-            mesh_kwargs = {
-                "is_metal": mesh.pop("is_metal"),
-                "scattering_labels": mesh.pop("scattering_labels"),
-                "soc": mesh.pop("soc"),
-            }
+            # only read the full mesh if it is needed
+            mesh_kwargs = _read_mesh_attributes(mesh_files[0])
             if include_mesh:
+                mesh = load_mesh(mesh_files[0])
+
                 # remove duplicated data
                 for k in ("doping", "temperatures", "fermi_levels", "structure"):
                     mesh.pop(k)
+                for k in mesh_kwargs:
+                    mesh.pop(k)
 
-                mesh_kwargs["mesh"] = cast_dict_list(mesh)
+                mesh_kwargs["mesh"] = MeshData.from_mesh(mesh)
 
         doc = cls.from_structure(
-            structure=_get_structure(),
+            structure=_get_structure(dir_name),
             include_structure=True,
             dir_name=get_uri(dir_name),
             completed_at=datetime_str(),
             input=settings,
             transport=transport,
             usage_stats=timing,
+            convergence_history=convergence_history,
             kpoint_mesh=inter_mesh,
             nkpoints=np.product(inter_mesh),
             log=log,
@@ -214,16 +355,72 @@ class AmsetTaskDocument(StructureMetadata):
         return doc
 
 
-def _get_structure() -> Structure:
-    """Find amset input file in current directory and extract structure."""
-    vr_files = list(Path(".").glob("*vasprun.xml*"))
-    bs_files = list(Path(".").glob("*band_structure_data*"))
-
-    if len(vr_files) > 0:
-        from pymatgen.io.vasp import BSVasprun
-
-        return BSVasprun(str(vr_files[0])).get_band_structure().structure
+def _get_structure(directory: Union[Path, str] = ".") -> Structure:
+    """
+    Find amset input file in a directory and extract structure.
+
+    The structure is obtained from the cheapest source available, in order: a POSCAR
+    file, the VASP summary copied along with the vasprun.xml, the header of the
+    vasprun.xml, and finally the band_structure_data.json file.
+    """
+    directory = Path(directory)
+    poscar_files = list(directory.glob("POSCAR*"))
+    vr_files = list(directory.glob("*vasprun.xml*"))
+    bs_files = list(directory.glob("*band_structure_data*"))
+
+    summary = load_vasp_summary(directory)
+    if len(poscar_files) > 0:
+        from pymatgen.io.vasp import Poscar
+
+        return Poscar.from_file(poscar_files[0]).structure
+    elif len(vr_files) > 0 and summary is not None:
+        # summary of the VASP calculation copied along with the vasprun.xml
+        return get_summary_structure(summary)
+    elif len(vr_files) > 0:
+        return _read_vasprun_structure(vr_files[0])
     elif len(bs_files) > 0:
         return loadfn(bs_files[0])["band_structure"].structure
 
-    raise ValueError("Could not find amset input in current directory.")
+    raise ValueError(f"Could not find amset input in {directory}.")
+
+
+def _read_vasprun_structure(filename: Union[Path, str]) -> Structure:
+    """
+    Read the initial structure from the header of a vasprun.xml file.
+
+    The file is parsed incrementally and parsing stops as soon as the initial structure
+    has been read, so the eigenvalues and projections are never loaded. AMSET inputs
+    are non-self-consistent calculations, so the initial and final structures are the
+    same.
+    """
+    from xml.etree.ElementTree import iterparse
+
+    from monty.io import zopen
+
+    species = None
+    with zopen(filename, "rb") as f:
+        for _, elem in iterparse(f):
+            if elem.tag == "array" and elem.attrib.get("name") == "atoms":
+                species = [rc.find("c").text.strip() for rc in elem.find("set")]
+            elif elem.tag == "structure" and elem.attrib.get("name") == "initialpos":
+                lattice = _read_varray(elem.find("crystal/varray[@name='basis']"))
+                coords = _read_varray(elem.find("varray[@name='positions']"))
+                return Structure(lattice, species, coords)
+
+    raise ValueError(f"Could not find initial structure in {filename}")
+
+
+def _read_varray(elem) -> List[List[float]]:
+    return [[float(x) for x in v.text.split()] for v in elem.findall("v")]
+
+
+def _read_mesh_attributes(filename: Union[Path, str]) -> Dict[str, Any]:
+    """Read the scalar attributes from an AMSET mesh file without loading the mesh."""
+    import h5py
+
+    with h5py.File(filename, "r") as f:
+        return {
+            "is_metal": bool(f["is_metal"][()]),
+            "scattering_labels": f["scattering_labels"][()].astype("U13").tolist(),
+            "soc": bool(f["soc"][()]),
+        }
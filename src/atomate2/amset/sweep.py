@@ -0,0 +1,166 @@
+"""
+Driver for running several AMSET calculations that share a band interpolation.
+
+This module is run in a separate process by :obj:`.run_amset_sweep`, in the same way
+that AMSET calculations are run from the command line by :obj:`.run_amset`.
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from pathlib import Path
+from typing import Any
+
+from amset.core.run import Runner
+from amset.interpolation.bandstructure import Interpolator
+from amset.interpolation.projections import ProjectionOverlapCalculator
+from amset.interpolation.wavefunction import (
+    UnityWavefunctionOverlap,
+    WavefunctionOverlapCalculator,
+)
+from amset.io import write_settings
+from amset.log import log_banner
+from amset.scattering.calculate import basic_scatterers
+from monty.serialization import dumpfn, loadfn
+from pymatgen.io.vasp import Poscar
+
+from atomate2.amset.run import SWEEP_FILENAME
+
+__all__ = ["SweepRunner", "run_sweep"]
+
+logger = logging.getLogger(__name__)
+
+
+class SweepRunner(Runner):
+    """
+    An AMSET runner that reuses the band interpolation and wavefunction overlaps.
+
+    The interpolator (containing the fitted band structure coefficients) and the
+    overlap calculator are stored in a cache shared between runners, so that only the
+    first calculation in a sweep performs the band structure fit and loads the
+    wavefunction coefficients. The interpolated k-point mesh is still generated for
+    each calculation, as it depends on the scissor and band gap settings.
+
+    Parameters
+    ----------
+    band_structure : BandStructure
+        The band structure to interpolate.
+    num_electrons : int
+        The number of electrons in the system.
+    settings : dict
+        The AMSET settings.
+    cache : dict
+        The cache shared between runners.
+    """
+
+    def __init__(self, band_structure, num_electrons, settings, cache: dict):
+        super().__init__(band_structure, num_electrons, settings)
+        self._cache = cache
+
+    def _do_interpolation(self):
+        # this follows Runner._do_interpolation but takes the interpolator and overlap
+        # calculator from the cache when they have already been calculated
+        log_banner("INTERPOLATION")
+        t0 = time.perf_counter()
+
+        interpolator_key = (
+            "interpolator",
+            self.settings["interpolation_factor"],
+            self.settings["soc"],
+        )
+        if interpolator_key not in self._cache:
+            self._cache[interpolator_key] = Interpolator(
+                self._band_structure,
+                num_electrons=self._num_electrons,
+                interpolation_factor=self.settings["interpolation_factor"],
+                soc=self.settings["soc"],
+            )
+        else:
+            logger.info("Reusing band structure interpolation")
+
+        amset_data = self._cache[interpolator_key].get_amset_data(
+            energy_cutoff=self.settings["energy_cutoff"],
+            scissor=self.settings["scissor"],
+            bandgap=self.settings["bandgap"],
+            symprec=self.settings["symprec"],
+            nworkers=self.settings["nworkers"],
+        )
+
+        if set(self.settings["scattering_type"]).issubset(set(basic_scatterers)):
+            overlap_calculator = None
+        elif self.settings["unity_overlap"]:
+            overlap_calculator = UnityWavefunctionOverlap()
+        elif self.settings["use_projections"]:
+            overlap_key = (
+                "projections",
+                self.settings["energy_cutoff"],
+                self.settings["symprec"],
+            )
+            if overlap_key not in self._cache:
+                calculator = ProjectionOverlapCalculator.from_band_structure(
+                    self._band_structure,
+                    energy_cutoff=self.settings["energy_cutoff"],
+                    symprec=self.settings["symprec"],
+                )
+                self._cache[overlap_key] = calculator
+            overlap_calculator = self._cache[overlap_key]
+        else:
+            overlap_key = ("wavefunction", self.settings["wavefunction_coefficients"])
+            if overlap_key not in self._cache:
+                self._cache[overlap_key] = WavefunctionOverlapCalculator.from_file(
+                    self.settings["wavefunction_coefficients"]
+                )
+            overlap_calculator = self._cache[overlap_key]
+        amset_data.set_overlap_calculator(overlap_calculator)
+
+        return amset_data, time.perf_counter() - t0
+
+
+def run_sweep(directory: str | Path = ".") -> list[Path]:
+    """
+    Run the AMSET settings variants given in the sweep file.
+
+    The settings.yaml file in the directory gives the settings shared by all
+    variants. Each variant is run in its own subdirectory named "variant_<i>",
+    containing the merged settings, the AMSET outputs, the timing and memory usage, and
+    a POSCAR of the structure.
+
+    Parameters
+    ----------
+    directory : str or Path
+        The directory containing the AMSET inputs and sweep file.
+
+    Returns
+    -------
+    list of Path
+        The directory of each variant.
+    """
+    directory = Path(directory)
+    variants: list[dict[str, Any]] = loadfn(directory / SWEEP_FILENAME)
+
+    # load the band structure once; this also detects spin-orbit coupling
+    base = Runner.from_directory(directory)
+    base_settings = loadfn(directory / "settings.yaml")
+    base_settings["soc"] = base.settings["soc"]
+
+    cache: dict = {}
+    variant_dirs = []
+    for i, variant in enumerate(variants):
+        variant_dir = directory / f"variant_{i}"
+        variant_dir.mkdir(exist_ok=True)
+
+        settings = dict(base_settings, **variant)
+        write_settings(settings, variant_dir / "settings.yaml")
+        Poscar(base._band_structure.structure).write_file(variant_dir / "POSCAR")
+
+        runner = SweepRunner(base._band_structure, base._num_electrons, settings, cache)
+        _, usage_stats = runner.run(directory=variant_dir, return_usage_stats=True)
+        dumpfn(usage_stats, variant_dir / "timing.json.gz")
+        variant_dirs.append(variant_dir)
+
+    return variant_dirs
+
+
+if __name__ == "__main__":
+    run_sweep()
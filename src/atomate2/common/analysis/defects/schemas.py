@@ -1,12 +1,27 @@
 import logging
-from typing import Any, Callable, List, Optional, Tuple, Type
+from concurrent.futures import ProcessPoolExecutor
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
 
 import numpy as np
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 from pymatgen.core import Structure
 from pymatgen.entries.computed_entries import ComputedStructureEntry
 
 from atomate2.vasp.schemas.task import TaskDocument
+from atomate2.vasp.summary import get_summary_task_document, load_vasp_summary
+
+if TYPE_CHECKING:
+    from jobflow import JobStore
 
 logger = logging.getLogger(__name__)
 
@@ -77,6 +92,9 @@ class CCDDocument(BaseModel):
         "relaxed charge state (q2).",
     )
 
+    # task documents obtained from the calculation directories, keyed by directory
+    _taskdocs: Dict[str, TaskDocument] = PrivateAttr(default_factory=dict)
+
     @classmethod
     def from_task_outputs(
         cls,
@@ -173,10 +191,6 @@ class CCDDocument(BaseModel):
                     return itr, entry
             raise ValueError(f"Could not find entry with UUID: {uuid}")
 
-        def dQ_entries(e1, e2):
-            """Get the displacement between two entries."""
-            return get_dQ(e1.structure, e2.structure)
-
         # ensure the "dir_name" is provided for each entry
         if any(e.data.get("dir_name", None) is None for e in entries1 + entries2):
             raise ValueError("[dir_name] must be provided for all entries.")
@@ -187,11 +201,17 @@ class CCDDocument(BaseModel):
         idx1, ent_r1 = find_entry(entries1, relaxed_uuid1)
         idx2, ent_r2 = find_entry(entries2, relaxed_uuid2)
 
-        s_entries1, distortions1 = sort_pos_dist(
-            entries1, ent_r1, ent_r2, dist=dQ_entries
+        # displacements of all entries from both relaxed structures, in one batch
+        structures = [e.structure for e in entries1 + entries2]
+        dQs = get_dQs(structures, [ent_r1.structure, ent_r2.structure])
+        dQ0 = get_dQ(ent_r1.structure, ent_r2.structure)
+        dQs1, dQs2 = dQs[: len(entries1)], dQs[len(entries1) :]
+
+        s_entries1, distortions1 = _sort_by_distances(
+            entries1, dQs1[:, 0], dQs1[:, 1], dQ0
         )
-        s_entries2, distortions2 = sort_pos_dist(
-            entries2, ent_r1, ent_r2, dist=dQ_entries
+        s_entries2, distortions2 = _sort_by_distances(
+            entries2, dQs2[:, 0], dQs2[:, 1], dQ0
         )
 
         energies1 = [entry.energy for entry in s_entries1]
@@ -200,6 +220,9 @@ class CCDDocument(BaseModel):
         sdirs1 = [e.data["dir_name"] for e in s_entries1]
         sdirs2 = [e.data["dir_name"] for e in s_entries2]
 
+        suuids1 = [e.data["uuid"] for e in s_entries1]
+        suuids2 = [e.data["uuid"] for e in s_entries2]
+
         obj = cls(
             q1=ent_r1.structure.charge,
             q2=ent_r2.structure.charge,
@@ -211,28 +234,113 @@ class CCDDocument(BaseModel):
             energies2=energies2,
             static_dirs1=sdirs1,
             static_dirs2=sdirs2,
+            static_uuids1=suuids1,
+            static_uuids2=suuids2,
             relaxed_index1=idx1,
             relaxed_index2=idx2,
         )
 
         return obj
 
-    def get_taskdocs(self):
-        """Get the distorted task documents."""
-
-        def remove_host_name(dir_name):
-            return dir_name.split(":")[-1]
-
-        return [
-            [
-                TaskDocument.from_directory(remove_host_name(dir_name))
-                for dir_name in self.static_dirs1
-            ],
-            [
-                TaskDocument.from_directory(remove_host_name(dir_name))
-                for dir_name in self.static_dirs2
-            ],
-        ]
+    def get_taskdocs(
+        self,
+        store: Optional["JobStore"] = None,
+        nworkers: int = 1,
+        use_cache: bool = True,
+    ) -> List[List[TaskDocument]]:
+        """
+        Get the distorted task documents.
+
+        If a job store is given, the task documents are fetched by ``static_uuids``
+        in a single query. Any task documents not found in the store are obtained from
+        the calculation directories: from the VASP summary if it includes the task
+        document, otherwise by parsing the directory. Task documents obtained from the
+        directories are cached on this document.
+
+        Parameters
+        ----------
+        store
+            A job store containing the outputs of the static calculations.
+        nworkers
+            The number of processes used to parse directories without a summary. By
+            default, directories are parsed serially.
+        use_cache
+            Whether to use task documents previously obtained from the same
+            directories by this document.
+
+        Returns
+        -------
+        list of list of TaskDocument
+            The task documents for charge state (q1) and charge state (q2).
+        """
+        static_dirs = self.static_dirs1 + self.static_dirs2
+        dir_names = [_remove_host_name(d) for d in static_dirs]
+        uuids = (self.static_uuids1 or []) + (self.static_uuids2 or [])
+
+        task_docs: List[Optional[TaskDocument]] = [None] * len(dir_names)
+        if store is not None and len(uuids) == len(dir_names):
+            stored_docs = _query_task_documents(store, uuids)
+            task_docs = [stored_docs.get(uuid) for uuid in uuids]
+
+        missing = [i for i, doc in enumerate(task_docs) if doc is None]
+        if use_cache:
+            for i in missing:
+                task_docs[i] = self._taskdocs.get(dir_names[i])
+            missing = [i for i in missing if task_docs[i] is None]
+
+        # summaries are quick to load; only parse the remaining directories
+        for i in missing:
+            task_docs[i] = _get_summary_taskdoc(dir_names[i])
+        unparsed = [i for i in missing if task_docs[i] is None]
+
+        unparsed_dirs = [dir_names[i] for i in unparsed]
+        if nworkers > 1 and len(unparsed_dirs) > 1:
+            nworkers = min(nworkers, len(unparsed_dirs))
+            with ProcessPoolExecutor(max_workers=nworkers) as executor:
+                parsed = list(executor.map(TaskDocument.from_directory, unparsed_dirs))
+        else:
+            parsed = [TaskDocument.from_directory(d) for d in unparsed_dirs]
+
+        for i, task_doc in zip(unparsed, parsed):
+            task_docs[i] = task_doc
+        for i in missing:
+            self._taskdocs[dir_names[i]] = task_docs[i]
+
+        nstatic1 = len(self.static_dirs1)
+        return [task_docs[:nstatic1], task_docs[nstatic1:]]
+
+
+def _remove_host_name(dir_name: str) -> str:
+    return dir_name.split(":")[-1]
+
+
+def _get_summary_taskdoc(dir_name: str) -> Optional[TaskDocument]:
+    """Get the task document stored in the VASP summary of a directory, if any."""
+    summary = load_vasp_summary(dir_name)
+    if summary is None:
+        return None
+    return get_summary_task_document(summary)
+
+
+def _query_task_documents(store: "JobStore", uuids: List[str]) -> Dict[str, Any]:
+    """Get the task documents for several jobs from a job store in one query."""
+    docs = store.query(
+        {"uuid": {"$in": list(set(uuids))}},
+        properties=["uuid", "index", "output"],
+        load=True,
+    )
+
+    # keep the output of the latest run of each job
+    outputs: Dict[str, Tuple[int, Any]] = {}
+    for doc in docs:
+        if doc["uuid"] not in outputs or doc["index"] > outputs[doc["uuid"]][0]:
+            outputs[doc["uuid"]] = (doc["index"], doc["output"])
+
+    return {
+        uuid: TaskDocument.parse_obj(output)
+        for uuid, (_, output) in outputs.items()
+        if output is not None
+    }
 
 
 def sort_pos_dist(
@@ -268,15 +376,20 @@ def sort_pos_dist(
     d1 = [dist(s, s1) for s in list_in]
     d2 = [dist(s, s2) for s in list_in]
     D0 = dist(s1, s2)
+    return _sort_by_distances(list_in, d1, d2, D0)
 
-    d_vs_s = []
-    for q1, q2, s in zip(d1, d2, list_in):
-        sign = +1
-        if q1 < q2 and q2 > D0:
-            sign = -1
-        d_vs_s.append((sign * q1, s))
-    d_vs_s.sort()
-    return [s for _, s in d_vs_s], [d for d, _ in d_vs_s]
+
+def _sort_by_distances(
+    list_in: List[Any], d1: Sequence[float], d2: Sequence[float], D0: float
+) -> Tuple[List[Any], List[float]]:
+    """Sort a list using its distances to two reference points; see sort_pos_dist."""
+    d1 = np.asarray(d1, dtype=float)
+    d2 = np.asarray(d2, dtype=float)
+    signed = np.where((d1 < d2) & (d2 > D0), -d1, d1)
+
+    # stable sort, so items at the same distance keep their order
+    order = np.argsort(signed, kind="stable")
+    return [list_in[i] for i in order], signed[order].tolist()
 
 
 def get_dQ(ref: Structure, distorted: Structure) -> float:
@@ -285,9 +398,9 @@ def get_dQ(ref: Structure, distorted: Structure) -> float:
 
     Parameters
     ----------
-    ground : pymatgen.core.structure.Structure
+    ref : pymatgen.core.structure.Structure
         A pymatgen structure corresponding to the ground (final) state.
-    excited : pymatgen.core.structure.Structure
+    distorted : pymatgen.core.structure.Structure
         A pymatgen structure corresponding to the excited (initial) state.
 
     Returns
@@ -295,11 +408,42 @@ def get_dQ(ref: Structure, distorted: Structure) -> float:
     float
         The dQ value (amu^{1/2} Angstrom).
     """
-    return np.sqrt(
-        np.sum(
-            [
-                x[0].distance(x[1]) ** 2 * x[0].specie.atomic_mass
-                for x in zip(ref, distorted)
-            ]
-        )
-    )
+    return float(get_dQs([ref], [distorted])[0, 0])
+
+
+def get_dQs(refs: List[Structure], distorted: List[Structure]) -> np.ndarray:
+    """
+    Calculate dQ between every pair of reference and distorted structures.
+
+    The displacement of each site is found using the minimum image convention on the
+    fractional coordinates, which is exact for displacements smaller than half a
+    lattice vector. The lattice and atomic masses are taken from the reference
+    structures.
+
+    Parameters
+    ----------
+    refs : list of pymatgen.core.structure.Structure
+        The reference structures.
+    distorted : list of pymatgen.core.structure.Structure
+        The distorted structures. Must have the same sites, in the same order, as the
+        reference structures.
+
+    Returns
+    -------
+    numpy.ndarray
+        The dQ values (amu^{1/2} Angstrom) with the shape (len(refs),
+        len(distorted)).
+    """
+    if len({len(s) for s in refs + distorted}) > 1:
+        raise ValueError("All structures must have the same number of sites.")
+
+    ref_coords = np.array([s.frac_coords for s in refs])
+    distorted_coords = np.array([s.frac_coords for s in distorted])
+    lattices = np.array([s.lattice.matrix for s in refs])
+    masses = np.array([[sp.atomic_mass for sp in s.species] for s in refs])
+
+    # (nrefs, ndistorted, nsites, 3)
+    frac_diff = distorted_coords[None, :] - ref_coords[:, None]
+    frac_diff -= np.round(frac_diff)
+    cart_diff = np.einsum("rdsi,rij->rdsj", frac_diff, lattices)
+    return np.sqrt(np.einsum("rs,rds->rd", masses, np.sum(cart_diff**2, axis=-1)))
@@ -2,7 +2,37 @@
 
 from __future__ import annotations
 
-__all__ = ["get_default_strain_states"]
+import itertools
+import time
+from math import factorial
+
+import numpy as np
+from pymatgen.analysis.elasticity import (
+    Deformation,
+    ElasticTensor,
+    ElasticTensorExpansion,
+    Stress,
+)
+from pymatgen.core import Structure
+from pymatgen.core.operations import SymmOp
+from pymatgen.core.tensors import TensorMapping
+from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
+from scipy.sparse.linalg import lsqr
+
+__all__ = [
+    "get_default_strain_states",
+    "get_symmetry_reduced_deformations",
+    "expand_deformations",
+    "is_born_stable",
+    "get_green_lagrange_strains",
+    "get_pk2_stresses",
+    "get_symmetry_adapted_basis",
+    "fit_elastic_tensor_least_squares",
+]
+
+_VOIGT_MAP = ((0, 0), (1, 1), (2, 2), (1, 2), (0, 2), (0, 1))
+_VOIGT_INDEX = np.array([[0, 5, 4], [5, 1, 3], [4, 3, 2]])
+_ENGINEERING_SCALE = np.array([1, 1, 1, 2, 2, 2])
 
 
 def get_default_strain_states(order: int) -> list[tuple[int, int, int, int, int, int]]:
@@ -50,3 +80,374 @@ def get_default_strain_states(order: int) -> list[tuple[int, int, int, int, int,
     raise ValueError(
         "only deformations for 2nd and 3rd order elastic tensors are supported."
     )
+
+
+def get_symmetry_reduced_deformations(
+    deformations: list[Deformation],
+    structure: Structure,
+    symprec: float | None = None,
+    tol: float = 1e-5,
+) -> tuple[list[Deformation], dict]:
+    """
+    Reduce a list of deformations to an irreducible set using symmetry.
+
+    In addition to the irreducible deformations, a compact symmetry-expansion map is
+    returned. This lists the (Cartesian) rotations of the structure's point group once,
+    and, for each irreducible deformation, the indices of the rotations that generate
+    symmetry-equivalent independent deformations. The map can be passed to
+    :obj:`.ElasticDocument.from_stresses` to expand the stresses without having to
+    re-derive the symmetry operations of the structure.
+
+    Parameters
+    ----------
+    deformations : list of Deformation
+        The full list of deformations.
+    structure : Structure
+        The (undeformed) structure.
+    symprec : float or None
+        Symmetry precision used to determine the symmetry operations. Defaults to the
+        ``SYMPREC`` setting.
+    tol : float
+        Numerical tolerance for deciding whether two deformations are equivalent.
+
+    Returns
+    -------
+    tuple of (list of Deformation, dict)
+        The irreducible deformations and the symmetry-expansion map. The map has the
+        keys "rotations" (a list of 3x3 rotation matrices) and "images" (a list of
+        lists of rotation indices, one for each irreducible deformation).
+    """
+    if symprec is None:
+        from atomate2 import SETTINGS
+
+        symprec = SETTINGS.SYMPREC
+
+    sga = SpacegroupAnalyzer(structure, symprec=symprec)
+    rotations: list[np.ndarray] = []
+    for symmop in sga.get_symmetry_operations(cartesian=True):
+        rotation = symmop.rotation_matrix
+        if not any(np.allclose(rotation, r, atol=tol) for r in rotations):
+            rotations.append(rotation)
+    symmops = [SymmOp.from_rotation_and_translation(r) for r in rotations]
+
+    # mapping of every deformation seen so far to its irreducible representative
+    seen = TensorMapping(tol=tol)
+    reduced = []
+    images = []
+    for deformation in deformations:
+        deformation = Deformation(deformation)
+        if deformation in seen:
+            continue
+
+        seen[deformation] = len(reduced)
+        deformation_images = []
+        for i, symmop in enumerate(symmops):
+            rotated_deformation = deformation.transform(symmop)
+            if rotated_deformation in seen:
+                continue
+
+            seen[rotated_deformation] = len(reduced)
+
+            # only independent deformations are used when fitting the tensor
+            if Deformation(rotated_deformation).is_independent():
+                deformation_images.append(i)
+
+        reduced.append(deformation)
+        images.append(deformation_images)
+
+    symmetry_map = {"rotations": [r.tolist() for r in rotations], "images": images}
+    return reduced, symmetry_map
+
+
+def expand_deformations(
+    deformations: list[Deformation],
+    stresses: list[Stress],
+    uuids: list[str],
+    job_dirs: list[str],
+    symmetry_map: dict,
+) -> tuple[list[Deformation], list[Stress], list[str], list[str]]:
+    """
+    Expand deformations and stresses using a symmetry-expansion map.
+
+    Parameters
+    ----------
+    deformations : list of Deformation
+        The irreducible deformations.
+    stresses : list of Stress
+        The stresses, one for each deformation.
+    uuids : list of str
+        The uuids of the deformation calculations.
+    job_dirs : list of str
+        The directories of the deformation calculations.
+    symmetry_map : dict
+        The symmetry-expansion map, as generated by
+        :obj:`get_symmetry_reduced_deformations`. The "images" entry must be aligned
+        with ``deformations``.
+
+    Returns
+    -------
+    tuple of (list of Deformation, list of Stress, list of str, list of str)
+        The expanded deformations, stresses, uuids, and job directories.
+    """
+    if len(symmetry_map["images"]) != len(deformations):
+        raise ValueError("symmetry map does not match the number of deformations.")
+
+    symmops = [
+        SymmOp.from_rotation_and_translation(r) for r in symmetry_map["rotations"]
+    ]
+
+    full_deformations = list(deformations)
+    full_stresses = list(stresses)
+    full_uuids = list(uuids)
+    full_job_dirs = list(job_dirs)
+    for i, images in enumerate(symmetry_map["images"]):
+        for image in images:
+            full_deformations.append(deformations[i].transform(symmops[image]))
+            full_stresses.append(Stress(stresses[i].transform(symmops[image])))
+            full_uuids.append(uuids[i])
+            full_job_dirs.append(job_dirs[i])
+
+    return full_deformations, full_stresses, full_uuids, full_job_dirs
+
+
+def is_born_stable(elastic_tensor, tol: float = 0) -> bool:
+    """
+    Check whether an elastic tensor satisfies the Born mechanical stability criteria.
+
+    The generic criterion is used, i.e., that the elastic tensor in Voigt notation is
+    positive definite.
+
+    Parameters
+    ----------
+    elastic_tensor : list of list of float
+        The elastic tensor in Voigt notation (6x6).
+    tol : float
+        Tolerance on the smallest eigenvalue of the elastic tensor.
+
+    Returns
+    -------
+    bool
+        Whether the elastic tensor is mechanically stable.
+    """
+    voigt = np.asarray(elastic_tensor, dtype=float)
+    eigenvalues = np.linalg.eigvalsh(0.5 * (voigt + voigt.T))
+    return bool(np.all(eigenvalues > tol))
+
+
+def get_green_lagrange_strains(deformations) -> np.ndarray:
+    """
+    Calculate the Green-Lagrange strains for a stack of deformations.
+
+    Parameters
+    ----------
+    deformations : list of Deformation or numpy.ndarray
+        The deformation gradients, as an (N, 3, 3) array.
+
+    Returns
+    -------
+    numpy.ndarray
+        The Green-Lagrange strains, as an (N, 3, 3) array.
+    """
+    deformations = np.asarray(deformations, dtype=float).reshape(-1, 3, 3)
+    return 0.5 * (np.einsum("nki,nkj->nij", deformations, deformations) - np.eye(3))
+
+
+def get_pk2_stresses(stresses, deformations) -> np.ndarray:
+    """
+    Calculate the second Piola-Kirchoff stresses for a stack of Cauchy stresses.
+
+    Parameters
+    ----------
+    stresses : list of Stress or numpy.ndarray
+        The Cauchy stresses, as an (N, 3, 3) array.
+    deformations : list of Deformation or numpy.ndarray
+        The deformation gradients, as an (N, 3, 3) array.
+
+    Returns
+    -------
+    numpy.ndarray
+        The second Piola-Kirchoff stresses, as an (N, 3, 3) array.
+    """
+    stresses = np.asarray(stresses, dtype=float).reshape(-1, 3, 3)
+    deformations = np.asarray(deformations, dtype=float).reshape(-1, 3, 3)
+
+    if not np.allclose(stresses, stresses.transpose(0, 2, 1), atol=1e-5):
+        raise ValueError(
+            "The stress tensor is not symmetric, PK stress is based on a symmetric "
+            "stress tensor."
+        )
+
+    inverse = np.linalg.inv(deformations)
+    determinant = np.linalg.det(deformations)
+    pk2 = np.einsum("nij,njk,nlk->nil", inverse, stresses, inverse)
+    return determinant[:, None, None] * pk2
+
+
+def get_symmetry_adapted_basis(
+    nvoigt: int, rotations: list | None = None, tol: float = 1e-8
+) -> np.ndarray:
+    """
+    Get a basis for Voigt-symmetric tensors that are invariant under rotations.
+
+    The basis spans the independent components of an elastic tensor (in Voigt
+    notation) that are allowed by the symmetry of the crystal.
+
+    Parameters
+    ----------
+    nvoigt : int
+        The number of Voigt indices of the tensor, i.e., 2 for the second order elastic
+        tensor and 3 for the third order elastic tensor.
+    rotations : list of list of list of float or None
+        The Cartesian rotation matrices of the crystal point group. If None, only the
+        Voigt symmetry will be used.
+    tol : float
+        Tolerance for the rank of the basis, relative to its largest singular value.
+
+    Returns
+    -------
+    numpy.ndarray
+        The basis tensors, as an (N, 6, ..., 6) array.
+    """
+    basis = []
+    for indices in itertools.combinations_with_replacement(range(6), nvoigt):
+        voigt = np.zeros((6,) * nvoigt)
+        for permutation in set(itertools.permutations(indices)):
+            voigt[permutation] = 1
+        basis.append(voigt)
+    basis = np.array(basis)
+
+    if rotations is None or len(rotations) == 0:
+        return basis
+
+    # average the full tensors over the point group; all basis tensors are rotated at
+    # once, one index at a time
+    unique_rotations = np.unique(np.round(rotations, 8), axis=0)
+    tensors = _voigt_to_full(basis)
+    average = np.zeros_like(tensors)
+    for rotation in unique_rotations:
+        rotated = tensors
+        for axis in range(1, tensors.ndim):
+            rotated = np.tensordot(rotated, rotation, axes=([axis], [1]))
+            rotated = np.moveaxis(rotated, -1, axis)
+        average += rotated
+    average /= len(unique_rotations)
+    projected = _full_to_voigt(average).reshape(len(basis), -1)
+
+    _, singular_values, vt = np.linalg.svd(projected, full_matrices=False)
+    rank = int(np.sum(singular_values > tol * singular_values[0]))
+    return vt[:rank].reshape((rank,) + (6,) * nvoigt)
+
+
+def fit_elastic_tensor_least_squares(
+    strains,
+    stresses,
+    order: int = 2,
+    eq_stress=None,
+    rotations: list | None = None,
+    regularization: float = 1e-8,
+) -> tuple[ElasticTensor | ElasticTensorExpansion, dict]:
+    """
+    Fit an elastic tensor expansion using regularised linear least squares.
+
+    A design matrix is constructed over the symmetry-adapted independent components of
+    the elastic tensors (see :obj:`get_symmetry_adapted_basis`) and solved using LSQR
+    with Tikhonov damping. The design matrix is dense, as each strain generally
+    contributes to every independent component. Its columns are normalised before
+    solving, so the regularization is dimensionless.
+
+    Parameters
+    ----------
+    strains : list of Strain or numpy.ndarray
+        The Green-Lagrange strains, as an (N, 3, 3) array.
+    stresses : list of Stress or numpy.ndarray
+        The second Piola-Kirchoff stresses, as an (N, 3, 3) array.
+    order : int
+        Order of the tensor expansion to be fitted.
+    eq_stress : Stress or None
+        The equilibrium stress, subtracted from the stresses before fitting.
+    rotations : list of list of list of float or None
+        The Cartesian rotation matrices of the crystal point group, used to reduce the
+        number of independent components. If None, only the Voigt symmetry is used.
+    regularization : float
+        The damping parameter of the regularised least-squares solver.
+
+    Returns
+    -------
+    tuple of (ElasticTensor or ElasticTensorExpansion, dict)
+        The fitted tensor (an :obj:`ElasticTensor` if ``order=2``) and a dictionary
+        of fitting information with the keys "residual" (relative root-mean-square
+        residual), "ncomponents" (number of independent components), and "time"
+        (wall time in seconds).
+    """
+    start_time = time.perf_counter()
+
+    strains = np.asarray(strains, dtype=float).reshape(-1, 3, 3)
+    stresses = np.asarray(stresses, dtype=float).reshape(-1, 3, 3)
+    if eq_stress is not None:
+        stresses = stresses - np.asarray(eq_stress, dtype=float)
+
+    rows, cols = zip(*_VOIGT_MAP)
+    voigt_strains = strains[:, rows, cols] * _ENGINEERING_SCALE
+    voigt_stresses = stresses[:, rows, cols]
+
+    bases = [get_symmetry_adapted_basis(n, rotations) for n in range(2, order + 1)]
+    blocks = []
+    for basis in bases:
+        # contract the basis tensors with the strain for each strain order
+        nvoigt = len(basis.shape) - 1
+        block = np.einsum("ki...j,mj->mki...", basis, voigt_strains)
+        for _ in range(nvoigt - 2):
+            block = np.einsum("mk...j,mj->mk...", block, voigt_strains)
+        block /= factorial(nvoigt - 1)
+        blocks.append(block.transpose(0, 2, 1).reshape(-1, len(basis)))
+
+    design = np.hstack(blocks)
+    target = voigt_stresses.ravel()
+
+    norms = np.linalg.norm(design, axis=0)
+    norms[norms == 0] = 1
+    solution = lsqr(design / norms, target, damp=regularization, atol=1e-12, btol=1e-12)
+    coefficients = solution[0] / norms
+
+    voigts = []
+    for basis, block_coefficients in zip(
+        bases, np.split(coefficients, np.cumsum([len(b) for b in bases])[:-1])
+    ):
+        voigts.append(np.tensordot(block_coefficients, basis, axes=1))
+
+    if order == 2:
+        result = ElasticTensor.from_voigt(voigts[0])
+    else:
+        result = ElasticTensorExpansion.from_voigt(voigts)
+
+    norm = np.linalg.norm(target)
+    residual = np.linalg.norm(target - design @ coefficients)
+    info = {
+        "residual": float(residual / norm) if norm > 0 else 0.0,
+        "ncomponents": len(coefficients),
+        "time": time.perf_counter() - start_time,
+    }
+    return result, info
+
+
+def _voigt_to_full(voigt: np.ndarray) -> np.ndarray:
+    """Convert a stack of tensors from Voigt notation to full (3x3x...) notation."""
+    nvoigt = voigt.ndim - 1
+    indices = []
+    for i in range(nvoigt):
+        shape = [1] * (2 * nvoigt)
+        shape[2 * i : 2 * i + 2] = [3, 3]
+        indices.append(_VOIGT_INDEX.reshape(shape))
+    return voigt[(slice(None), *indices)]
+
+
+def _full_to_voigt(tensors: np.ndarray) -> np.ndarray:
+    """Convert a stack of tensors from full (3x3x...) notation to Voigt notation."""
+    nvoigt = (tensors.ndim - 1) // 2
+    rows, cols = (np.array(x) for x in zip(*_VOIGT_MAP))
+    indices = []
+    for i in range(nvoigt):
+        shape = [1] * nvoigt
+        shape[i] = 6
+        indices.extend([rows.reshape(shape), cols.reshape(shape)])
+    return tensors[(slice(None), *indices)]
@@ -2,22 +2,26 @@
 
 from __future__ import annotations
 
-from jobflow import Response, job
+from typing import Any
+
+from jobflow import CURRENT_JOB, Job, OnMissing, Response, job
 from pymatgen.core import Structure
 from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
 
-from atomate2 import SETTINGS
+from atomate2.utils.references import resolve_references_in_bulk
 
 __all__ = [
     "structure_to_primitive",
     "structure_to_conventional",
     "retrieve_structure_from_materials_project",
+    "collect_outputs",
+    "get_output_collector",
 ]
 
 
 @job
 def structure_to_primitive(
-    structure: Structure, symprec: float = SETTINGS.SYMPREC
+    structure: Structure, symprec: float | None = None
 ) -> Structure:
     """
     Job that creates a standard primitive structure.
@@ -26,21 +30,26 @@ def structure_to_primitive(
     ----------
     structure: Structure object
         input structure that will be transformed
-    symprec: float
-        precision to determine symmetry
+    symprec: float or None
+        precision to determine symmetry, defaults to the ``SYMPREC`` setting
 
     Returns
     -------
     .Structure
 
     """
+    if symprec is None:
+        from atomate2 import SETTINGS
+
+        symprec = SETTINGS.SYMPREC
+
     sga = SpacegroupAnalyzer(structure, symprec=symprec)
     return sga.get_primitive_standard_structure()
 
 
 @job
 def structure_to_conventional(
-    structure: Structure, symprec: float = SETTINGS.SYMPREC
+    structure: Structure, symprec: float | None = None
 ) -> Structure:
     """
     Job hat creates a standard conventional structure.
@@ -49,14 +58,19 @@ def structure_to_conventional(
     ----------
     structure: Structure object
         input structure that will be transformed
-    symprec: float
-        precision to determine symmetry
+    symprec: float or None
+        precision to determine symmetry, defaults to the ``SYMPREC`` setting
 
     Returns
     -------
     .Structure
 
     """
+    if symprec is None:
+        from atomate2 import SETTINGS
+
+        symprec = SETTINGS.SYMPREC
+
     sga = SpacegroupAnalyzer(structure, symprec=symprec)
     return sga.get_conventional_standard_structure()
 
@@ -143,3 +157,52 @@ def retrieve_structure_from_materials_project(
         output=structure,
         stored_data={"task_id": task_id, "database_version": database_version},
     )
+
+
+@job
+def collect_outputs(outputs: Any) -> Any:
+    """
+    Collect the outputs of many jobs, resolving the references in bulk.
+
+    This job must be run with ``resolve_references=False`` and ``expose_store=True``
+    in its config. Use :obj:`get_output_collector` to create a correctly configured
+    job.
+
+    Parameters
+    ----------
+    outputs : Any
+        An object (e.g., a list or dict) containing output references.
+
+    Returns
+    -------
+    Any
+        The object with all references resolved.
+    """
+    return resolve_references_in_bulk(
+        outputs,
+        CURRENT_JOB.store,
+        on_missing=CURRENT_JOB.job.config.on_missing_references,
+    )
+
+
+def get_output_collector(outputs: Any, on_missing: OnMissing = OnMissing.ERROR) -> Job:
+    """
+    Get a job that collects the outputs of many jobs with a single store query.
+
+    Parameters
+    ----------
+    outputs : Any
+        An object (e.g., a list or dict) containing output references.
+    on_missing : OnMissing
+        What to do if a referenced output is missing, e.g. because a job failed.
+
+    Returns
+    -------
+    Job
+        The collector job.
+    """
+    collector = collect_outputs(outputs)
+    collector.config.resolve_references = False
+    collector.config.expose_store = True
+    collector.config.on_missing_references = on_missing
+    return collector
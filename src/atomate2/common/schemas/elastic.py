@@ -1,8 +1,12 @@
 """Schemas for elastic tensor fitting and related properties."""
 
+import logging
+import time
 from copy import deepcopy
-from typing import List, Optional
+from math import factorial
+from typing import List, Optional, Union
 
+import numpy as np
 from pydantic import BaseModel, Field
 from pymatgen.analysis.elasticity import (
     Deformation,
@@ -14,8 +18,16 @@ from pymatgen.core import Structure
 from pymatgen.core.tensors import TensorMapping
 from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
 
-from atomate2 import SETTINGS
-from atomate2.common.schemas.math import Matrix3D, MatrixVoigt
+from atomate2.common.analysis.elastic import (
+    expand_deformations,
+    fit_elastic_tensor_least_squares,
+    get_green_lagrange_strains,
+    get_pk2_stresses,
+)
+from atomate2.common.schemas.math import Matrix3D, MatrixVoigt, PackedArray
+from atomate2.settings import SETTINGS_DEFAULT
+
+logger = logging.getLogger(__name__)
 
 __all__ = [
     "DerivedProperties",
@@ -82,16 +94,16 @@ class DerivedProperties(BaseModel):
 class FittingData(BaseModel):
     """Data used to fit elastic tensors."""
 
-    cauchy_stresses: List[Matrix3D] = Field(
+    cauchy_stresses: Union[PackedArray, List[Matrix3D]] = Field(
         None, description="The Cauchy stresses used to fit the elastic tensor."
     )
-    strains: List[Matrix3D] = Field(
+    strains: Union[PackedArray, List[Matrix3D]] = Field(
         None, description="The strains used to fit the elastic tensor."
     )
-    pk_stresses: List[Matrix3D] = Field(
+    pk_stresses: Union[PackedArray, List[Matrix3D]] = Field(
         None, description="The Piola-Kirchoff stresses used to fit the elastic tensor."
     )
-    deformations: List[Matrix3D] = Field(
+    deformations: Union[PackedArray, List[Matrix3D]] = Field(
         None, description="The deformations corresponding to each strain state."
     )
     uuids: List[str] = Field(None, description="The uuids of the deformation jobs.")
@@ -99,12 +111,75 @@ class FittingData(BaseModel):
         None, description="The directories where the deformation jobs were run."
     )
 
+    def get_array(self, name: str) -> np.ndarray:
+        """
+        Get fitting data as a numpy array.
+
+        Parameters
+        ----------
+        name : str
+            The name of the fitting data, e.g., "strains" or "pk_stresses".
+
+        Returns
+        -------
+        numpy.ndarray
+            The fitting data as an (N, 3, 3) array.
+        """
+        data = getattr(self, name)
+        if isinstance(data, PackedArray):
+            return data.to_array()
+        return np.array(data)
+
 
 class ElasticTensorDocument(BaseModel):
     """Raw and standardized elastic tensors."""
 
     raw: MatrixVoigt = Field(None, description="Raw elastic tensor.")
     ieee_format: MatrixVoigt = Field(None, description="Elastic tensor in IEEE format.")
+    higher_order_raw: List[PackedArray] = Field(
+        None,
+        description="Raw 3rd and higher order elastic tensors in Voigt notation, if "
+        "a higher order expansion was fitted.",
+    )
+    higher_order_ieee_format: List[PackedArray] = Field(
+        None,
+        description="3rd and higher order elastic tensors in Voigt notation and IEEE "
+        "format, if a higher order expansion was fitted.",
+    )
+
+    @classmethod
+    def from_tensors(
+        cls,
+        raw: Union[ElasticTensor, ElasticTensorExpansion],
+        ieee_format: Union[ElasticTensor, ElasticTensorExpansion],
+    ) -> "ElasticTensorDocument":
+        """
+        Create a document from a fitted elastic tensor or tensor expansion.
+
+        Parameters
+        ----------
+        raw : ElasticTensor or ElasticTensorExpansion
+            The fitted elastic tensor.
+        ieee_format : ElasticTensor or ElasticTensorExpansion
+            The fitted elastic tensor in IEEE format.
+
+        Returns
+        -------
+        ElasticTensorDocument
+            The elastic tensor document. For an expansion, ``raw`` and
+            ``ieee_format`` contain the 2nd order tensor.
+        """
+        if isinstance(raw, ElasticTensor):
+            return cls(raw=raw.voigt.tolist(), ieee_format=ieee_format.voigt.tolist())
+
+        return cls(
+            raw=raw[0].voigt.tolist(),
+            ieee_format=ieee_format[0].voigt.tolist(),
+            higher_order_raw=[PackedArray.from_array(t.voigt) for t in raw[1:]],
+            higher_order_ieee_format=[
+                PackedArray.from_array(t.voigt) for t in ieee_format[1:]
+            ],
+        )
 
 
 class ElasticDocument(BaseModel):
@@ -135,6 +210,14 @@ class ElasticDocument(BaseModel):
     order: int = Field(
         None, description="Order of the expansion of the elastic tensor."
     )
+    fitting_residual: float = Field(
+        None,
+        description="Relative root-mean-square residual between the stresses "
+        "predicted by the fitted tensor and the calculated stresses.",
+    )
+    fitting_time: float = Field(
+        None, description="Wall time taken to fit the elastic tensor in seconds."
+    )
 
     @classmethod
     def from_stresses(
@@ -144,10 +227,11 @@ class ElasticDocument(BaseModel):
         deformations: List[Deformation],
         uuids: List[str],
         job_dirs: List[str],
-        fitting_method: str = SETTINGS.ELASTIC_FITTING_METHOD,
+        fitting_method: Optional[str] = None,
         order: Optional[int] = None,
         equilibrium_stress: Optional[Matrix3D] = None,
-        symprec: float = SETTINGS.SYMPREC,
+        symprec: Optional[float] = SETTINGS_DEFAULT,
+        symmetry_map: Optional[dict] = None,
     ):
         """
         Create an elastic document from strains and stresses.
@@ -164,21 +248,44 @@ class ElasticDocument(BaseModel):
             A list of uuids, one for each deformation calculation.
         job_dirs : list of str
             A list of job directories, one for each deformation calculation.
-        fitting_method : str
-            The method used to fit the elastic tensor. See pymatgen for more details on
-            the methods themselves. The options are:
-            - "finite_difference" (note this is required if fitting a 3rd order tensor)
+        fitting_method : str or None
+            The method used to fit the elastic tensor. Defaults to the
+            ``ELASTIC_FITTING_METHOD`` setting. See pymatgen for more details on the
+            methods themselves. The options are:
+            - "finite_difference" (note this is the default if fitting a 3rd order
+              tensor)
             - "independent"
             - "pseudoinverse"
+            - "least_squares" (regularised least squares over the symmetry-adapted
+              independent components, suitable for 3rd order tensors and large sets of
+              strains; see :obj:`.fit_elastic_tensor_least_squares`)
         order : int or None
             Order of the tensor expansion to be fitted. Can be either 2 or 3.
         equilibrium_stress : list of list of float
             The stress on the equilibrium (relaxed) structure.
-        symprec : float
+        symprec : float or None
             Symmetry precision for deriving symmetry equivalent deformations. If
-            ``symprec=None``, then no symmetry operations will be applied.
+            ``symprec=None``, then no symmetry operations will be applied. Defaults to
+            the ``SYMPREC`` setting.
+        symmetry_map : dict or None
+            A symmetry-expansion map, as generated by
+            :obj:`.get_symmetry_reduced_deformations`, with one entry in "images" for
+            each deformation. If provided, this will be used to expand the deformations
+            instead of deriving the symmetry operations from the structure and
+            ``symprec`` will be ignored.
         """
-        if symprec is not None:
+        from atomate2 import SETTINGS
+
+        if fitting_method is None:
+            fitting_method = SETTINGS.ELASTIC_FITTING_METHOD
+        if symprec is SETTINGS_DEFAULT:
+            symprec = SETTINGS.SYMPREC
+
+        if symmetry_map is not None:
+            deformations, stresses, uuids, job_dirs = expand_deformations(
+                deformations, stresses, uuids, job_dirs, symmetry_map
+            )
+        elif symprec is not None:
             deformations, stresses, uuids, job_dirs = _expand_deformations(
                 structure, deformations, stresses, uuids, job_dirs, symprec
             )
@@ -187,15 +294,37 @@ class ElasticDocument(BaseModel):
         if equilibrium_stress:
             eq_stress = -0.1 * Stress(equilibrium_stress)
 
-        strains = [d.green_lagrange_strain for d in deformations]
-        stresses = [-0.1 * s for s in stresses]
-        pk_stresses = [s.piola_kirchoff_2(d) for s, d in zip(stresses, deformations)]
+        deformations = np.array(deformations, dtype=float)
+        stresses = -0.1 * np.array(stresses, dtype=float)
+        strains = get_green_lagrange_strains(deformations)
+        pk_stresses = get_pk2_stresses(stresses, deformations)
 
         if order is None:
             order = 2 if len(stresses) < 70 else 3  # TODO: Figure this out better
 
-        if order > 2 or fitting_method == "finite_difference":
-            # force finite diff if order > 2
+        start_time = time.perf_counter()
+        if fitting_method == "least_squares":
+            rotations = None
+            if symmetry_map is not None:
+                rotations = symmetry_map["rotations"]
+            elif symprec is not None:
+                sga = SpacegroupAnalyzer(structure, symprec=symprec)
+                symmops = sga.get_symmetry_operations(cartesian=True)
+                rotations = [op.rotation_matrix for op in symmops]
+
+            result, fitting_info = fit_elastic_tensor_least_squares(
+                strains,
+                pk_stresses,
+                order=order,
+                eq_stress=eq_stress,
+                rotations=rotations,
+            )
+            logger.info(
+                f"Fitted {fitting_info['ncomponents']} independent components using "
+                f"least squares (residual: {fitting_info['residual']:.3g})"
+            )
+        elif order > 2 or fitting_method == "finite_difference":
+            # force finite diff if order > 2 and not using least squares
             result = ElasticTensorExpansion.from_diff_fit(
                 strains, pk_stresses, eq_stress=eq_stress, order=order
             )
@@ -209,12 +338,16 @@ class ElasticDocument(BaseModel):
             )
         else:
             raise ValueError(f"Unsupported elastic fitting method {fitting_method}")
+        fitting_time = time.perf_counter() - start_time
 
         ieee = result.convert_to_ieee(structure)
         property_tensor = ieee if order == 2 else ElasticTensor(ieee[0])
         property_dict = property_tensor.get_structure_property_dict(structure)
         derived_properties = DerivedProperties(**property_dict)
 
+        fitting_residual = _get_fitting_residual(
+            result, strains, pk_stresses, eq_stress
+        )
         eq_stress = eq_stress.tolist() if eq_stress is not None else eq_stress
 
         return cls(
@@ -224,20 +357,47 @@ class ElasticDocument(BaseModel):
             formula_pretty=structure.composition.reduced_formula,
             fitting_method=fitting_method,
             order=order,
-            elastic_tensor=ElasticTensorDocument(
-                raw=result.voigt.tolist(), ieee_format=ieee.voigt.tolist()
-            ),
+            fitting_residual=fitting_residual,
+            fitting_time=fitting_time,
+            elastic_tensor=ElasticTensorDocument.from_tensors(result, ieee),
             fitting_data=FittingData(
-                cauchy_stresses=[s.tolist() for s in stresses],
-                strains=[s.tolist() for s in strains],
-                pk_stresses=[p.tolist() for p in pk_stresses],
-                deformations=[d.tolist() for d in deformations],
+                cauchy_stresses=PackedArray.from_array(stresses),
+                strains=PackedArray.from_array(strains),
+                pk_stresses=PackedArray.from_array(pk_stresses),
+                deformations=PackedArray.from_array(deformations),
                 uuids=uuids,
                 job_dirs=job_dirs,
             ),
         )
 
 
+def _get_fitting_residual(result, strains, pk_stresses, eq_stress):
+    """Get the relative RMS residual between the fitted and calculated stresses."""
+    tensors = [result] if isinstance(result, ElasticTensor) else list(result)
+
+    # vectorised version of ElasticTensorExpansion.calculate_stress
+    predicted = np.zeros_like(pk_stresses)
+    for tensor in tensors:
+        rank = len(tensor.shape)
+        subscripts = "abcdefgh"[:rank]
+        for i in range(2, rank, 2):
+            subscripts += f",z{'abcdefgh'[i:i + 2]}"
+        subscripts += "->zab"
+        norder = rank // 2 - 1
+        predicted += np.einsum(subscripts, tensor, *[strains] * norder) / factorial(
+            norder
+        )
+
+    calculated = np.array(pk_stresses)
+    if eq_stress is not None:
+        calculated = calculated - np.array(eq_stress)
+
+    norm = np.linalg.norm(calculated)
+    if norm == 0:
+        return 0.0
+    return float(np.linalg.norm(calculated - predicted) / norm)
+
+
 def _expand_deformations(structure, deformations, stresses, uuids, job_dirs, symprec):
     """Use symmetry to expand deformations."""
     sga = SpacegroupAnalyzer(structure, symprec=symprec)
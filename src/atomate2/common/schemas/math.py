@@ -1,8 +1,20 @@
 """Schemas for matrices and vectors."""
 
-from typing import Tuple
+import base64
+import zlib
+from typing import List, Tuple
 
-__all__ = ["Vector3D", "Vector6D", "Matrix3D", "MatrixVoigt"]
+import numpy as np
+from pydantic import BaseModel, Field
+
+__all__ = [
+    "Vector3D",
+    "Vector6D",
+    "Matrix3D",
+    "MatrixVoigt",
+    "PackedArray",
+    "ChunkedArray",
+]
 
 
 Vector3D = Tuple[float, float, float]
@@ -16,3 +28,142 @@ Vector6D.__doc__ = "6D Voigt matrix component"  # type: ignore
 
 MatrixVoigt = Tuple[Vector6D, Vector6D, Vector6D, Vector6D, Vector6D, Vector6D]
 Vector6D.__doc__ = "Voigt representation of a 3x3x3x3 tensor"  # type: ignore
+
+
+class PackedArray(BaseModel):
+    """A compact binary representation of a numpy array."""
+
+    data: str = Field(None, description="Base64 encoded, zlib compressed array data.")
+    dtype: str = Field(None, description="The numpy data type of the array.")
+    shape: List[int] = Field(None, description="The shape of the array.")
+
+    @classmethod
+    def from_array(cls, array: np.ndarray) -> "PackedArray":
+        """
+        Pack a numpy array.
+
+        Parameters
+        ----------
+        array : numpy.ndarray
+            The array to pack.
+
+        Returns
+        -------
+        PackedArray
+            The packed array.
+        """
+        array = np.ascontiguousarray(array)
+        return cls(data=_pack(array), dtype=array.dtype.str, shape=list(array.shape))
+
+    def to_array(self) -> np.ndarray:
+        """
+        Unpack the array.
+
+        Returns
+        -------
+        numpy.ndarray
+            The unpacked array.
+        """
+        return _unpack(self.data, self.dtype, self.shape)
+
+
+class ChunkedArray(BaseModel):
+    """
+    A compact binary representation of a numpy array, split into chunks.
+
+    The array is split along its leading ``chunk_ndim`` axes and each chunk is
+    compressed separately, so that a single slice can be unpacked without
+    decompressing the full array.
+    """
+
+    chunks: List[str] = Field(
+        None,
+        description="Base64 encoded, zlib compressed array data for each chunk, in "
+        "row-major order of the chunked axes.",
+    )
+    dtype: str = Field(None, description="The numpy data type of the array.")
+    shape: List[int] = Field(None, description="The shape of the array.")
+    chunk_ndim: int = Field(
+        None, description="The number of leading axes the array is chunked along."
+    )
+
+    @classmethod
+    def from_array(cls, array: np.ndarray, chunk_ndim: int = 1) -> "ChunkedArray":
+        """
+        Pack a numpy array into chunks.
+
+        Parameters
+        ----------
+        array : numpy.ndarray
+            The array to pack.
+        chunk_ndim : int
+            The number of leading axes to chunk the array along. For example, an
+            array with the shape (2, 3, 100) and ``chunk_ndim=2`` is stored as 6 chunks
+            with the shape (100, ).
+
+        Returns
+        -------
+        ChunkedArray
+            The chunked array.
+        """
+        array = np.asarray(array)
+        if not 0 <= chunk_ndim <= array.ndim:
+            raise ValueError(f"chunk_ndim must be between 0 and {array.ndim}")
+
+        chunk_shape = array.shape[chunk_ndim:]
+        chunks = [
+            _pack(np.ascontiguousarray(chunk))
+            for chunk in array.reshape((-1, *chunk_shape))
+        ]
+        return cls(
+            chunks=chunks,
+            dtype=array.dtype.str,
+            shape=list(array.shape),
+            chunk_ndim=chunk_ndim,
+        )
+
+    def get_chunk(self, *index: int) -> np.ndarray:
+        """
+        Unpack a single chunk of the array.
+
+        Parameters
+        ----------
+        *index : int
+            The index of the chunk along each of the chunked axes.
+
+        Returns
+        -------
+        numpy.ndarray
+            The unpacked chunk, equivalent to ``array[index]``.
+        """
+        if len(index) != self.chunk_ndim:
+            raise ValueError(f"Expected {self.chunk_ndim} indices, got {len(index)}")
+
+        flat_index = 0
+        if self.chunk_ndim > 0:
+            flat_index = np.ravel_multi_index(index, self.shape[: self.chunk_ndim])
+        chunk_shape = self.shape[self.chunk_ndim :]
+        return _unpack(self.chunks[flat_index], self.dtype, chunk_shape)
+
+    def to_array(self) -> np.ndarray:
+        """
+        Unpack the full array.
+
+        Returns
+        -------
+        numpy.ndarray
+            The unpacked array.
+        """
+        chunk_shape = self.shape[self.chunk_ndim :]
+        chunks = [_unpack(chunk, self.dtype, chunk_shape) for chunk in self.chunks]
+        return np.array(chunks, dtype=self.dtype).reshape(self.shape)
+
+
+def _pack(array: np.ndarray) -> str:
+    return base64.b64encode(zlib.compress(array.tobytes())).decode("ascii")
+
+
+def _unpack(data: str, dtype: str, shape: List[int]) -> np.ndarray:
+    # use a bytearray so the array is writable, as np.frombuffer on bytes is read-only
+    data = bytearray(zlib.decompress(base64.b64decode(data)))
+    return np.frombuffer(data, dtype=dtype).reshape(shape)
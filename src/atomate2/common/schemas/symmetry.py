@@ -1,14 +1,12 @@
 """Schemas for crystal symmetry."""
 
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 from jobflow.utils import ValueEnum
 from pydantic import BaseModel, Field
 from pymatgen.core import Structure
 from pymatgen.symmetry.analyzer import SpacegroupAnalyzer, spglib
 
-from atomate2 import SETTINGS
-
 __all__ = ["CrystalSystem", "SymmetryData"]
 
 
@@ -64,7 +62,7 @@ class SymmetryData(BaseModel):
 
     @classmethod
     def from_structure(
-        cls, structure: Structure, symprec: float = SETTINGS.SYMPREC
+        cls, structure: Structure, symprec: Optional[float] = None
     ) -> "SymmetryData":
         """
         Create a symmetry data model from a structure.
@@ -73,14 +71,19 @@ class SymmetryData(BaseModel):
         ----------
         structure : .Structure
             A pymatgen structure.
-        symprec : float
-            The symmetry precision.
+        symprec : float or None
+            The symmetry precision. Defaults to the ``SYMPREC`` setting.
 
         Returns
         -------
         SymmetryData
             A symmetry data model.
         """
+        if symprec is None:
+            from atomate2 import SETTINGS
+
+            symprec = SETTINGS.SYMPREC
+
         sg = SpacegroupAnalyzer(structure, symprec=symprec)
         symmetry: Dict[str, Any] = {"symprec": symprec}
         if not sg.get_symmetry_dataset():
@@ -1,7 +1,7 @@
 """Settings for atomate2."""
 
 from pathlib import Path
-from typing import Optional, Tuple, Union
+from typing import Any, Optional, Tuple, Union
 
 from pydantic import BaseSettings, Field, root_validator
 
@@ -81,6 +81,22 @@ class Atomate2Settings(BaseSettings):
         description="Whether to run the Bader program when parsing VASP calculations."
         "Requires the bader executable to be on the path.",
     )
+    VASP_AUTO_PARALLEL: bool = Field(
+        False,
+        description="Whether to estimate the resources needed by VASP calculations "
+        "and automatically set KPAR and NCORE based on the available cores.",
+    )
+    VASP_CONVERGENCE_TREND_HANDLER: bool = Field(
+        False,
+        description="Whether to include the ConvergenceTrendHandler in the default "
+        "custodian handlers, stopping VASP early when the electronic or ionic loops "
+        "are not making progress.",
+    )
+    VASP_WARM_START: bool = Field(
+        False,
+        description="Whether VASP jobs started from a previous calculation should "
+        "reuse its WAVECAR or CHGCAR when the calculations are compatible.",
+    )
 
     # Elastic constant settings
     ELASTIC_FITTING_METHOD: str = Field(
@@ -117,3 +133,19 @@ class Atomate2Settings(BaseSettings):
 
         new_values.update(values)
         return new_values
+
+
+class _SettingsDefault:
+    """
+    Marker for arguments that default to a value in the atomate2 settings.
+
+    Used in place of ``None`` for arguments where ``None`` already has a meaning (for
+    example ``symprec=None`` disables symmetry), so that the settings are only read
+    when the function is called rather than when the module is imported.
+    """
+
+    def __repr__(self) -> str:
+        return "SETTINGS_DEFAULT"
+
+
+SETTINGS_DEFAULT: Any = _SettingsDefault()
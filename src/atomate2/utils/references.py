@@ -0,0 +1,193 @@
+"""Tools for resolving job output references."""
+
+from __future__ import annotations
+
+from importlib import import_module
+from typing import Any
+
+from jobflow import JobStore, OnMissing, OutputReference
+from jobflow.core.reference import find_and_get_references
+from monty.json import MontyDecoder
+from pydantic import BaseModel
+
+__all__ = ["resolve_references_in_bulk"]
+
+
+def resolve_references_in_bulk(
+    arg: Any, store: JobStore, on_missing: OnMissing = OnMissing.ERROR
+) -> Any:
+    """
+    Resolve all output references in an object using a single store query.
+
+    Jobflow resolves references one job at a time, loading the full output document of
+    each job. Here, the outputs of all referenced jobs are instead retrieved with a
+    single ``$in`` query, projected onto only the fields that are referenced.
+
+    Attributes of serialised objects (other than pydantic documents) cannot be read
+    from a projected document, e.g., the ``lattice`` of a ``Structure`` output. For
+    such references, the nearest serialised ancestor is retrieved in full with a
+    second query, decoded, and the remaining attributes accessed on the object.
+
+    Parameters
+    ----------
+    arg : Any
+        An object containing output references, e.g., a list or dict.
+    store : JobStore
+        The job store from which to retrieve the outputs.
+    on_missing : OnMissing
+        What to do if a referenced output is not in the store.
+
+    Returns
+    -------
+    Any
+        The object with all references replaced by their values.
+    """
+    references = find_and_get_references(arg)
+    if len(references) == 0:
+        return arg
+
+    paths = []
+    for ref in references:
+        attributes = _get_attributes(ref)
+        paths.append(_get_projection(attributes))
+
+        # the class of each ancestor is needed to know whether it must be decoded
+        for i in range(len(attributes)):
+            ancestor = _get_projection(attributes[:i])
+            paths.extend([f"{ancestor}.@module", f"{ancestor}.@class"])
+
+    outputs = _query_outputs(store, references, paths)
+
+    resolved = {}
+    pending = {}
+    for ref in references:
+        if ref.uuid not in outputs:
+            if on_missing == OnMissing.ERROR:
+                raise ValueError(
+                    f"Could not resolve reference - {ref.uuid} not in store or cache"
+                )
+            resolved[_get_key(ref)] = None if on_missing == OnMissing.NONE else ref
+            continue
+
+        data, depth = _walk(outputs[ref.uuid], _get_attributes(ref))
+        if depth is None:
+            resolved[_get_key(ref)] = MontyDecoder().process_decoded(data)
+        elif "blob_uuid" in data:
+            # data is held in an additional store; fall back to jobflow resolution
+            resolved[_get_key(ref)] = ref.resolve(store, on_missing=on_missing)
+        else:
+            pending[_get_key(ref)] = (ref, depth)
+
+    if len(pending) > 0:
+        ancestor_paths = [
+            _get_projection(_get_attributes(ref)[:depth])
+            for ref, depth in pending.values()
+        ]
+        ancestor_outputs = _query_outputs(
+            store, [ref for ref, _ in pending.values()], ancestor_paths
+        )
+        for key, (ref, _) in pending.items():
+            data, _ = _walk(
+                ancestor_outputs[ref.uuid], _get_attributes(ref), decode=True
+            )
+            resolved[key] = MontyDecoder().process_decoded(data)
+
+    return _replace_references(arg, resolved)
+
+
+def _query_outputs(
+    store: JobStore, references: list[OutputReference], paths: list[str]
+) -> dict[str, Any]:
+    """Get the (projected) outputs of the referenced jobs, keyed by uuid."""
+    # overlapping projections are not allowed, keep only the shortest paths
+    paths = set(paths)
+    properties = ["uuid", "index"] + [
+        path
+        for path in paths
+        if not any(path.startswith(f"{other}.") for other in paths)
+    ]
+    docs = store.query(
+        criteria={"uuid": {"$in": list({ref.uuid for ref in references})}},
+        properties=properties,
+        sort={"index": 1},
+    )
+
+    # docs are sorted by index so the most recent output takes precedence
+    return {doc["uuid"]: doc.get("output") for doc in docs}
+
+
+def _get_attributes(reference: OutputReference) -> list:
+    """Get the attributes of a reference as a list of keys and indices."""
+    # attributes are stored as ("a", name) or ("i", index) pairs, which become lists
+    # when the reference is serialised
+    return [
+        attr[1]
+        if isinstance(attr, (list, tuple)) and len(attr) == 2 and attr[0] in ("a", "i")
+        else attr
+        for attr in reference.attributes
+    ]
+
+
+def _get_key(reference: OutputReference) -> tuple:
+    """Get a hashable key for a reference."""
+    return reference.uuid, tuple(_get_attributes(reference))
+
+
+def _get_projection(attributes: list) -> str:
+    """Get the store projection needed to access a list of attributes."""
+    keys = ["output"]
+    for attr in attributes:
+        if not isinstance(attr, str):
+            # array indices cannot be projected
+            break
+        keys.append(attr)
+    return ".".join(keys)
+
+
+def _walk(data: Any, attributes: list, decode: bool = False) -> tuple[Any, int | None]:
+    """
+    Access a list of attributes of a (projected) output document.
+
+    Returns the value and None, or, if an ancestor is held in an additional store or
+    must be decoded to access its attributes, the ancestor and its depth. If
+    ``decode`` is True, ancestors are decoded instead.
+    """
+    for i, attr in enumerate(attributes):
+        if isinstance(data, dict) and ("blob_uuid" in data or _is_opaque(data)):
+            if not decode or "blob_uuid" in data:
+                return data, i
+            data = MontyDecoder().process_decoded(data)
+
+        if isinstance(data, (dict, list, tuple)):
+            data = data[attr]
+        else:
+            data = getattr(data, attr)
+
+    if isinstance(data, dict) and "blob_uuid" in data:
+        return data, len(attributes)
+    return data, None
+
+
+def _is_opaque(data: dict) -> bool:
+    """Whether the attributes of a serialised object differ from its dict keys."""
+    if "@module" not in data or "@class" not in data:
+        return False
+
+    try:
+        cls = getattr(import_module(data["@module"]), data["@class"])
+    except (ImportError, AttributeError):
+        return True
+
+    # pydantic documents are serialised with a key for each field
+    return not (isinstance(cls, type) and issubclass(cls, BaseModel))
+
+
+def _replace_references(arg: Any, resolved: dict) -> Any:
+    """Replace all references in an object by their resolved values."""
+    if isinstance(arg, OutputReference):
+        return resolved[_get_key(arg)]
+    if isinstance(arg, dict):
+        return {k: _replace_references(v, resolved) for k, v in arg.items()}
+    if isinstance(arg, (list, tuple)):
+        return type(arg)(_replace_references(v, resolved) for v in arg)
+    return arg
@@ -10,8 +10,8 @@ from maggma.core import Store
 from pydash import get
 from pymatgen.analysis.elasticity import Deformation, Stress
 
-from atomate2 import SETTINGS
 from atomate2.common.schemas.elastic import ElasticDocument
+from atomate2.settings import SETTINGS_DEFAULT
 
 
 class ElasticBuilder(Builder):
@@ -32,14 +32,17 @@ class ElasticBuilder(Builder):
         Store for final elastic documents.
     query : dict
         Dictionary query to limit tasks to be analyzed.
-    sympec : float
-        Symmetry precision for desymmetrising deformations.
-    fitting_method : str
-        The method used to fit the elastic tensor. See pymatgen for more details on the
+    sympec : float or None
+        Symmetry precision for desymmetrising deformations. Defaults to the
+        ``SYMPREC`` setting.
+    fitting_method : str or None
+        The method used to fit the elastic tensor. Defaults to the
+        ``ELASTIC_FITTING_METHOD`` setting. See pymatgen for more details on the
         methods themselves. The options are:
-        - "finite_difference" (note this is required if fitting a 3rd order tensor)
+        - "finite_difference" (note this is the default if fitting a 3rd order tensor)
         - "independent"
         - "pseudoinverse"
+        - "least_squares"
     structure_match_tol : float
         Numerical tolerance for structure equivalence.
     **kwargs
@@ -51,11 +54,17 @@ class ElasticBuilder(Builder):
         tasks: Store,
         elasticity: Store,
         query: dict = None,
-        symprec: float = SETTINGS.SYMPREC,
-        fitting_method: str = SETTINGS.ELASTIC_FITTING_METHOD,
+        symprec: float | None = SETTINGS_DEFAULT,
+        fitting_method: str | None = None,
         structure_match_tol: float = 1e-5,
         **kwargs,
     ):
+        from atomate2 import SETTINGS
+
+        if symprec is SETTINGS_DEFAULT:
+            symprec = SETTINGS.SYMPREC
+        if fitting_method is None:
+            fitting_method = SETTINGS.ELASTIC_FITTING_METHOD
 
         self.tasks = tasks
         self.elasticity = elasticity
@@ -237,9 +246,10 @@ def _get_elastic_document(
     fitting_method : str
         The method used to fit the elastic tensor. See pymatgen for more details on the
         methods themselves. The options are:
-        - "finite_difference" (note this is required if fitting a 3rd order tensor)
+        - "finite_difference" (note this is the default if fitting a 3rd order tensor)
         - "independent"
         - "pseudoinverse"
+        - "least_squares"
 
     Returns
     -------
@@ -5,17 +5,38 @@ from __future__ import annotations
 import logging
 import re
 from pathlib import Path
-from typing import Sequence
+from typing import Any, Sequence
 
+import numpy as np
+from monty.json import jsanitize
+from monty.serialization import dumpfn
 from pymatgen.core import Structure
+from pymatgen.io.vasp import Incar, Kpoints, Poscar
 
-from atomate2 import SETTINGS
 from atomate2.common.files import copy_files, get_zfile, gunzip_files, rename_files
 from atomate2.utils.file_client import FileClient, auto_fileclient
 from atomate2.utils.path import strip_hostname
+from atomate2.vasp.resources import (
+    apply_resource_estimate,
+    estimate_resources,
+    get_available_cores,
+)
+from atomate2.vasp.schemas.calculation import WarmStart
 from atomate2.vasp.sets.base import VaspInputGenerator
+from atomate2.vasp.summary import (
+    SUMMARY_FILENAME,
+    get_summary_structure,
+    load_vasp_summary,
+)
 
-__all__ = ["copy_vasp_outputs", "get_largest_relax_extension"]
+__all__ = [
+    "WARM_START_FILENAME",
+    "copy_vasp_outputs",
+    "get_largest_relax_extension",
+    "apply_warm_start",
+]
+
+WARM_START_FILENAME = "warm_start.json"
 
 
 logger = logging.getLogger(__name__)
@@ -57,7 +78,13 @@ def copy_vasp_outputs(
 
     logger.info(f"Copying VASP inputs from {src_dir}")
 
-    relax_ext = get_largest_relax_extension(src_dir, src_host, file_client=file_client)
+    summary = load_vasp_summary(src_dir) if src_host is None else None
+    if summary is not None:
+        relax_ext = summary["relax_extension"]
+    else:
+        relax_ext = get_largest_relax_extension(
+            src_dir, src_host, file_client=file_client
+        )
     directory_listing = file_client.listdir(src_dir, host=src_host)
 
     # find required files
@@ -66,8 +93,9 @@ def copy_vasp_outputs(
 
     # find optional files; do not fail if KPOINTS is missing, this might be KSPACING
     # note: POTCAR files never have the relax extension, whereas KPOINTS files should
+    # the summary of the previous calculation is used to speed up writing inputs
     optional_files = []
-    for file in ["POTCAR", "POTCAR.spec", "KPOINTS" + relax_ext]:
+    for file in ["POTCAR", "POTCAR.spec", "KPOINTS" + relax_ext, SUMMARY_FILENAME]:
         found_file = get_zfile(directory_listing, file, allow_missing=True)
         if found_file is not None:
             optional_files.append(found_file)
@@ -149,6 +177,8 @@ def write_vasp_input_set(
     apply_incar_updates: bool = True,
     potcar_spec: bool = False,
     clean_prev: bool = True,
+    auto_parallel: bool | None = None,
+    vasp_cmd: str | None = None,
     **kwargs,
 ):
     """
@@ -170,9 +200,22 @@ def write_vasp_input_set(
         Whether to use the POTCAR.spec file instead of the POTCAR file.
     clean_prev : bool
         Remove previous KPOINTS, INCAR, POSCAR, and POTCAR before writing new inputs.
+    auto_parallel : bool or None
+        Whether to estimate the resources needed by the calculation and set KPAR and
+        NCORE based on the available cores. See :obj:`.estimate_resources`. Defaults
+        to the ``VASP_AUTO_PARALLEL`` setting.
+    vasp_cmd : str or None
+        The command that will be used to run VASP, used to determine the number of
+        available cores when ``auto_parallel`` is set. Defaults to the ``VASP_CMD``
+        setting.
     **kwargs
         Keyword arguments that will be passed to :obj:`.VaspInputSet.write_input`.
     """
+    from atomate2 import SETTINGS
+
+    if auto_parallel is None:
+        auto_parallel = SETTINGS.VASP_AUTO_PARALLEL
+
     prev_dir = "." if from_prev else None
     vis = input_set_generator.get_input_set(
         structure, prev_dir=prev_dir, potcar_spec=potcar_spec
@@ -181,6 +224,14 @@ def write_vasp_input_set(
     if apply_incar_updates:
         vis.incar.update(SETTINGS.VASP_INCAR_UPDATES)
 
+    if auto_parallel:
+        nelect = vis.incar.get("NELECT")
+        if nelect is None:
+            nelect = input_set_generator.get_nelect(vis.poscar.structure)
+        cores = get_available_cores(vasp_cmd)
+        estimate = estimate_resources(vis, cores=cores, nelect=nelect)
+        apply_resource_estimate(vis, estimate, directory=directory)
+
     if clean_prev:
         # remove previous inputs (prevents old KPOINTS file from overriding KSPACING)
         for filename in ("POSCAR", "KPOINTS", "POTCAR", "INCAR"):
@@ -189,3 +240,227 @@ def write_vasp_input_set(
 
     logger.info("Writing VASP input set.")
     vis.write_input(directory, potcar_spec=potcar_spec, **kwargs)
+
+
+@auto_fileclient
+def apply_warm_start(
+    src_dir: Path | str,
+    src_host: str | None = None,
+    directory: str | Path = ".",
+    wavecar: bool = True,
+    chgcar: bool = True,
+    lattice_tol: float = 0.05,
+    file_client: FileClient | None = None,
+) -> WarmStart:
+    """
+    Start a VASP calculation from the wavefunction or charge density of a previous one.
+
+    The inputs must already have been written to ``directory``. If the calculations
+    are compatible (same ENCUT, NBANDS, ISPIN, ISYM, k-points and species, and a
+    similar lattice), the
+    WAVECAR (preferred) or CHGCAR of the previous calculation is copied and ISTART or
+    ICHARG set accordingly. Nothing is changed if the INCAR already sets ISTART or
+    ICHARG, e.g., for non-self-consistent calculations. A record of the warm start is
+    written to a warm_start.json file which is parsed into the task document, where
+    the number of SCF steps saved is recorded.
+
+    Parameters
+    ----------
+    src_dir : str or Path
+        The previous calculation directory.
+    src_host : str or None
+        The source hostname used to specify a remote filesystem. If ``None``, the
+        local filesystem will be used as the source.
+    directory : str or Path
+        The directory containing the new inputs.
+    wavecar : bool
+        Whether to reuse the WAVECAR.
+    chgcar : bool
+        Whether to reuse the CHGCAR if no WAVECAR is available.
+    lattice_tol : float
+        The maximum relative change in the lattice matrix (Frobenius norm).
+    file_client : .FileClient
+        A file client to use for performing file operations.
+
+    Returns
+    -------
+    WarmStart
+        A record of the warm start.
+    """
+    src_dir = strip_hostname(src_dir)
+    directory = Path(directory)
+    incar = Incar.from_file(directory / "INCAR")
+    structure = Poscar.from_file(directory / "POSCAR").structure
+    kpoints = None
+    if (directory / "KPOINTS").exists():
+        kpoints = Kpoints.from_file(directory / "KPOINTS")
+
+    relax_ext = get_largest_relax_extension(src_dir, src_host, file_client=file_client)
+    directory_listing = file_client.listdir(src_dir, host=src_host)
+    parent_inputs = _get_parent_inputs(
+        src_dir, src_host, relax_ext, directory_listing, directory, file_client
+    )
+    parent_incar, parent_structure, parent_kpoints, parent_scf_steps = parent_inputs
+
+    warm_start = WarmStart(source_dir=str(src_dir), files=[], reasons=[])
+    warm_start.parent_scf_steps = parent_scf_steps
+    if "ISTART" in incar or "ICHARG" in incar:
+        warm_start.reasons.append("ISTART or ICHARG already set")
+    else:
+        warm_start.reasons.extend(
+            _get_incompatibilities(
+                incar,
+                structure,
+                kpoints,
+                parent_incar,
+                parent_structure,
+                parent_kpoints,
+                lattice_tol,
+            )
+        )
+
+    if len(warm_start.reasons) == 0:
+        settings = {"WAVECAR": {"ISTART": 1}, "CHGCAR": {"ICHARG": 1}}
+        use_files = {"WAVECAR": wavecar, "CHGCAR": chgcar}
+        for name, setting in settings.items():
+            src_file = get_zfile(
+                directory_listing, name + relax_ext, allow_missing=True
+            )
+            if not use_files[name] or src_file is None:
+                continue
+
+            dest_file = directory / name
+            if not _copy_file(src_dir, src_host, src_file, dest_file, file_client):
+                continue
+
+            incar.update(setting)
+            incar.write_file(directory / "INCAR")
+            warm_start.files = [name]
+            warm_start.istart = setting.get("ISTART")
+            warm_start.icharg = setting.get("ICHARG")
+            logger.info(f"Warm starting from {name} in {src_dir}")
+            break
+        else:
+            warm_start.reasons.append("no WAVECAR or CHGCAR available")
+
+    dumpfn(warm_start.dict(), directory / WARM_START_FILENAME)
+    return warm_start
+
+
+def _get_parent_inputs(
+    src_dir: Path,
+    src_host: str | None,
+    relax_ext: str,
+    directory_listing: list[Path],
+    directory: Path,
+    file_client: FileClient,
+) -> tuple[dict[str, Any], Structure, Kpoints | None, int | None]:
+    """Get the INCAR, structure, KPOINTS and initial SCF steps of a calculation."""
+    summary = load_vasp_summary(src_dir) if src_host is None else None
+    if summary is not None:
+        kpoints = summary["kpoints"]
+        return (
+            summary["incar"],
+            get_summary_structure(summary),
+            None if kpoints is None else Kpoints.from_dict(kpoints),
+            summary.get("initial_scf_steps"),
+        )
+
+    # fall back to reading the INCAR, CONTCAR and KPOINTS, copied to temporary files
+    inputs = []
+    for name, reader in (
+        ("INCAR", Incar.from_file),
+        ("CONTCAR", Poscar.from_file),
+        ("KPOINTS", Kpoints.from_file),
+    ):
+        # the KPOINTS file is not needed when using KSPACING
+        src_file = get_zfile(
+            directory_listing, name + relax_ext, allow_missing=name == "KPOINTS"
+        )
+        if src_file is None:
+            inputs.append(None)
+            continue
+        tmp_file = directory / f"parent.{name}"
+        _copy_file(src_dir, src_host, src_file, tmp_file, file_client)
+        inputs.append(reader(tmp_file))
+        tmp_file.unlink()
+    return inputs[0], inputs[1].structure, inputs[2], None
+
+
+def _copy_file(
+    src_dir: Path,
+    src_host: str | None,
+    src_file: Path,
+    dest_file: Path,
+    file_client: FileClient,
+) -> bool:
+    """Copy and gunzip a file, returning whether the copied file is not empty."""
+    is_gzipped = src_file.name.endswith(".gz")
+    gz_file = dest_file.with_name(dest_file.name + ".gz") if is_gzipped else dest_file
+    file_client.copy(Path(src_dir) / src_file, gz_file, src_host=src_host)
+    if is_gzipped:
+        file_client.gunzip(gz_file, force=True)
+
+    # VASP writes an empty WAVECAR when LWAVE = False
+    if dest_file.stat().st_size == 0:
+        dest_file.unlink()
+        return False
+    return True
+
+
+def _get_incompatibilities(
+    incar: dict[str, Any],
+    structure: Structure,
+    kpoints: Kpoints | None,
+    parent_incar: dict[str, Any],
+    parent_structure: Structure,
+    parent_kpoints: Kpoints | None,
+    lattice_tol: float,
+) -> list[str]:
+    """Get the reasons a calculation cannot reuse the wavefunction of another."""
+    reasons = []
+    for key, default in (
+        ("ENCUT", None),
+        ("NBANDS", None),
+        ("ISPIN", 1),
+        ("LNONCOLLINEAR", False),
+        ("LSORBIT", False),
+    ):
+        if incar.get(key, default) != parent_incar.get(key, default):
+            reasons.append(f"different {key}")
+
+    # the irreducible k-points depend on the symmetry; VASP uses ISYM = 3 by default
+    # for hybrid functionals and ISYM = 2 otherwise
+    if _get_isym(incar) != _get_isym(parent_incar):
+        reasons.append("different ISYM")
+
+    # a KPOINTS file takes precedence over KSPACING
+    kspacing = incar.get("KSPACING", 0.5)
+    if _get_kpoints_data(kpoints) != _get_kpoints_data(parent_kpoints):
+        reasons.append("different KPOINTS")
+    elif kpoints is None and kspacing != parent_incar.get("KSPACING", 0.5):
+        reasons.append("different KSPACING")
+
+    if structure.species != parent_structure.species:
+        reasons.append("different species")
+    else:
+        matrix = structure.lattice.matrix
+        parent_matrix = parent_structure.lattice.matrix
+        change = np.linalg.norm(matrix - parent_matrix) / np.linalg.norm(parent_matrix)
+        if change > lattice_tol:
+            reasons.append(f"lattice changed by {change:.1%}")
+    return reasons
+
+
+def _get_isym(incar: dict[str, Any]) -> int:
+    """Get the symmetry setting used by VASP, including the default."""
+    return incar.get("ISYM", 3 if incar.get("LHFCALC", False) else 2)
+
+
+def _get_kpoints_data(kpoints: Kpoints | None) -> dict | None:
+    """Get the k-point settings of a KPOINTS file, ignoring the comment."""
+    if kpoints is None:
+        return None
+    data = jsanitize(kpoints.as_dict())
+    data.pop("comment", None)
+    return data
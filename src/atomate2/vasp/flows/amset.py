@@ -10,8 +10,8 @@ import numpy as np
 from jobflow import Flow, Maker, job
 from pymatgen.core.structure import Structure
 
-from atomate2 import SETTINGS
-from atomate2.amset.jobs import AmsetMaker
+import atomate2
+from atomate2.amset.jobs import AmsetMaker, AmsetSweepMaker
 from atomate2.vasp.flows.core import DoubleRelaxMaker
 from atomate2.vasp.flows.elastic import ElasticMaker
 from atomate2.vasp.jobs.amset import (
@@ -67,14 +67,15 @@ class DeformationPotentialMaker(Maker):
     ----------
     name : str
         Name of the flows produced by this maker.
-    symprec : float
-        Symmetry precision to use in the reduction of symmetry.
+    symprec : float or None
+        Symmetry precision to use in the reduction of symmetry. Set to None for no
+        symmetry reduction. Defaults to the ``SYMPREC`` setting.
     elastic_relax_maker : .BaseVaspMaker
         Maker used to generate elastic relaxations.
     """
 
     name: str = "deformation potential"
-    symprec: float = SETTINGS.SYMPREC
+    symprec: float | None = field(default_factory=lambda: atomate2.SETTINGS.SYMPREC)
     static_deformation_maker: BaseVaspMaker = field(
         default_factory=StaticDeformationMaker
     )
@@ -106,7 +107,7 @@ class DeformationPotentialMaker(Maker):
 
         # all deformation calculations need to be on the same k-point mesh, to achieve
         # this we override user_kpoints_settings with the desired k-points
-        bulk_kpoints = bulk.output.output.orig_inputs.kpoints
+        bulk_kpoints = bulk.output.orig_inputs["kpoints"]
         deformation_maker = deepcopy(self.static_deformation_maker)
         deformation_maker.input_set_generator.user_kpoints_settings = bulk_kpoints
 
@@ -115,7 +116,7 @@ class DeformationPotentialMaker(Maker):
             bulk.output.structure,
             symprec=self.symprec,
             prev_vasp_dir=bulk.output.dir_name,
-            static_deformation_maker=self.static_deformation_maker,
+            static_deformation_maker=deformation_maker,
         )
 
         # generate the deformation.h5 file
@@ -172,6 +173,13 @@ class VaspAmsetMaker(Maker):
         only used if ``use_hse_gap=True``.
     amset_maker : .AmsetMaker
         The maker to use for running AMSET calculations.
+    amset_variants : list of dict or None
+        AMSET settings variants (e.g., different doping or scissor settings) to run
+        after the main AMSET calculation. The variants are run in a single job on top
+        of the final settings of the main calculation, reusing its band interpolation.
+        If set, the flow output is the list of task documents for each variant.
+    amset_sweep_maker : .AmsetSweepMaker
+        The maker to use for running the AMSET settings variants.
     """
 
     name: str = "VASP amset"
@@ -197,6 +205,8 @@ class VaspAmsetMaker(Maker):
         )
     )
     amset_maker: AmsetMaker = field(default_factory=lambda: AmsetMaker(resubmit=True))
+    amset_variants: list[dict] | None = None
+    amset_sweep_maker: AmsetSweepMaker = field(default_factory=AmsetSweepMaker)
 
     def make(
         self,
@@ -316,8 +326,17 @@ class VaspAmsetMaker(Maker):
             bandstructure_dir=dense_bs.output.dir_name,
         )
         jobs.append(amset)
+        output = amset.output
 
-        return Flow(jobs, output=amset.output, name=self.name)
+        # amset settings variants, reusing the final amset calculation
+        if self.amset_variants is not None:
+            sweep = self.amset_sweep_maker.make(
+                {}, self.amset_variants, prev_amset_dir=amset.output.dir_name
+            )
+            jobs.append(sweep)
+            output = sweep.output
+
+        return Flow(jobs, output=output, name=self.name)
 
 
 @dataclass
@@ -358,6 +377,13 @@ class HSEVaspAmsetMaker(Maker):
         The maker to use for calculating acoustic deformation potentials.
     amset_maker : .AmsetMaker
         The maker to use for running AMSET calculations.
+    amset_variants : list of dict or None
+        AMSET settings variants (e.g., different doping or scissor settings) to run
+        after the main AMSET calculation. The variants are run in a single job on top
+        of the final settings of the main calculation, reusing its band interpolation.
+        If set, the flow output is the list of task documents for each variant.
+    amset_sweep_maker : .AmsetSweepMaker
+        The maker to use for running the AMSET settings variants.
     """
 
     name: str = "hse VASP amset"
@@ -379,6 +405,8 @@ class HSEVaspAmsetMaker(Maker):
         default_factory=lambda: ElasticMaker(bulk_relax_maker=None)
     )
     amset_maker: AmsetMaker = field(default_factory=lambda: AmsetMaker(resubmit=True))
+    amset_variants: list[dict] | None = None
+    amset_sweep_maker: AmsetSweepMaker = field(default_factory=AmsetSweepMaker)
 
     def make(
         self,
@@ -489,5 +517,14 @@ class HSEVaspAmsetMaker(Maker):
             bandstructure_dir=dense_bs.output.dir_name,
         )
         jobs.append(amset)
+        output = amset.output
+
+        # amset settings variants, reusing the final amset calculation
+        if self.amset_variants is not None:
+            sweep = self.amset_sweep_maker.make(
+                {}, self.amset_variants, prev_amset_dir=amset.output.dir_name
+            )
+            jobs.append(sweep)
+            output = sweep.output
 
-        return Flow(jobs, output=amset.output, name=self.name)
+        return Flow(jobs, output=output, name=self.name)
@@ -8,7 +8,6 @@ from pathlib import Path
 from jobflow import Flow, Maker, OnMissing
 from pymatgen.core.structure import Structure
 
-from atomate2 import SETTINGS
 from atomate2.common.schemas.math import Matrix3D
 from atomate2.vasp.flows.core import DoubleRelaxMaker
 from atomate2.vasp.jobs.base import BaseVaspMaker
@@ -16,7 +15,9 @@ from atomate2.vasp.jobs.core import TightRelaxMaker
 from atomate2.vasp.jobs.elastic import (
     ElasticRelaxMaker,
     fit_elastic_tensor,
+    fit_elastic_tensor_adaptive,
     generate_elastic_deformations,
+    generate_elastic_symmetry_map,
     run_elastic_deformations,
 )
 
@@ -50,8 +51,9 @@ class ElasticMaker(Maker):
         Order of the tensor expansion to be determined. Can be either 2 or 3.
     sym_reduce : bool
         Whether to reduce the number of deformations using symmetry.
-    symprec : float
-        Symmetry precision to use in the reduction of symmetry.
+    symprec : float or None
+        Symmetry precision to use in the reduction of symmetry. Defaults to the
+        ``SYMPREC`` setting.
     bulk_relax_maker : .BaseVaspMaker or None
         A maker to perform a tight relaxation on the bulk. Set to ``None`` to skip the
         bulk relaxation.
@@ -61,18 +63,39 @@ class ElasticMaker(Maker):
         Keyword arguments passed to :obj:`generate_elastic_deformations`.
     fit_elastic_tensor_kwargs : dict
         Keyword arguments passed to :obj:`fit_elastic_tensor`.
+    adaptive : bool
+        Whether to calculate the deformations adaptively. Initially, only the first
+        batch of ``adaptive_strain_magnitudes`` is calculated. Further batches are
+        only calculated if the fitted elastic tensor is not converged. See
+        :obj:`fit_elastic_tensor_adaptive` for more details.
+    adaptive_strain_magnitudes : list of list of float
+        Batches of strain magnitudes used in adaptive mode. Note, fitting a 3rd order
+        tensor requires at least four non-zero strain magnitudes in the first batch,
+        otherwise a ``ValueError`` is raised when making the flow.
+    adaptive_residual_tol : float
+        Maximum relative residual of the fitted stresses for the elastic tensor to be
+        considered converged in adaptive mode.
     """
 
     name: str = "elastic"
     order: int = 2
     sym_reduce: bool = True
-    symprec: float = SETTINGS.SYMPREC
+    symprec: float | None = None
     bulk_relax_maker: BaseVaspMaker | None = field(
         default_factory=lambda: DoubleRelaxMaker.from_relax_maker(TightRelaxMaker())
     )
     elastic_relax_maker: BaseVaspMaker = field(default_factory=ElasticRelaxMaker)
     generate_elastic_deformations_kwargs: dict = field(default_factory=dict)
     fit_elastic_tensor_kwargs: dict = field(default_factory=dict)
+    adaptive: bool = False
+    adaptive_strain_magnitudes: list[list[float]] = field(
+        default_factory=lambda: [
+            [-0.01, 0.01],
+            [-0.005, 0.005],
+            [-0.0075, -0.0025, 0.0025, 0.0075],
+        ]
+    )
+    adaptive_residual_tol: float = 0.05
 
     def make(
         self,
@@ -92,6 +115,12 @@ class ElasticMaker(Maker):
         equilibrium_stress : tuple of tuple of float
             The equilibrium stress of the (relaxed) structure, if known.
         """
+        symprec = self.symprec
+        if symprec is None:
+            from atomate2 import SETTINGS
+
+            symprec = SETTINGS.SYMPREC
+
         jobs = []
 
         if self.bulk_relax_maker is not None:
@@ -103,32 +132,72 @@ class ElasticMaker(Maker):
             if equilibrium_stress is None:
                 equilibrium_stress = bulk.output.output.stress
 
+        generate_kwargs = dict(self.generate_elastic_deformations_kwargs)
+        first_batch_kwargs = generate_kwargs
+        if self.adaptive:
+            # strain magnitudes are controlled by the adaptive batches
+            generate_kwargs.pop("strain_magnitudes", None)
+            first_batch = self.adaptive_strain_magnitudes[0]
+            if self.order == 3 and len({m for m in first_batch if m != 0}) < 4:
+                raise ValueError(
+                    "Fitting a 3rd order elastic tensor requires at least four "
+                    "non-zero strain magnitudes in the first adaptive batch."
+                )
+            first_batch_kwargs = {**generate_kwargs, "strain_magnitudes": first_batch}
+
         deformations = generate_elastic_deformations(
             structure,
             order=self.order,
             sym_reduce=self.sym_reduce,
-            symprec=self.symprec,
-            **self.generate_elastic_deformations_kwargs,
+            symprec=symprec,
+            **first_batch_kwargs,
         )
+        jobs.append(deformations)
+
+        symmetry_map = None
+        if self.sym_reduce:
+            symmetry_map_job = generate_elastic_symmetry_map(
+                structure, order=self.order, symprec=symprec, **first_batch_kwargs
+            )
+            jobs.append(symmetry_map_job)
+            symmetry_map = symmetry_map_job.output
+
         vasp_deformation_calcs = run_elastic_deformations(
             structure,
             deformations.output,
             prev_vasp_dir=prev_vasp_dir,
             elastic_relax_maker=self.elastic_relax_maker,
         )
-        fit_tensor = fit_elastic_tensor(
-            structure,
-            vasp_deformation_calcs.output,
-            equilibrium_stress=equilibrium_stress,
-            order=self.order,
-            symprec=self.symprec if self.sym_reduce else None,
-            **self.fit_elastic_tensor_kwargs,
-        )
+        if self.adaptive:
+            fit_tensor = fit_elastic_tensor_adaptive(
+                structure,
+                vasp_deformation_calcs.output,
+                self.adaptive_strain_magnitudes[1:],
+                equilibrium_stress=equilibrium_stress,
+                order=self.order,
+                symprec=symprec if self.sym_reduce else None,
+                symmetry_map=symmetry_map,
+                residual_tol=self.adaptive_residual_tol,
+                prev_vasp_dir=prev_vasp_dir,
+                elastic_relax_maker=self.elastic_relax_maker,
+                generate_elastic_deformations_kwargs=generate_kwargs,
+                **self.fit_elastic_tensor_kwargs,
+            )
+        else:
+            fit_tensor = fit_elastic_tensor(
+                structure,
+                vasp_deformation_calcs.output,
+                equilibrium_stress=equilibrium_stress,
+                order=self.order,
+                symprec=symprec if self.sym_reduce else None,
+                symmetry_map=symmetry_map,
+                **self.fit_elastic_tensor_kwargs,
+            )
 
         # allow some of the deformations to fail
         fit_tensor.config.on_missing_references = OnMissing.NONE
 
-        jobs += [deformations, vasp_deformation_calcs, fit_tensor]
+        jobs += [vasp_deformation_calcs, fit_tensor]
 
         flow = Flow(
             jobs=jobs,
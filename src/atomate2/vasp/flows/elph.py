@@ -28,6 +28,7 @@ from atomate2.vasp.jobs.elph import (
     SupercellElectronPhononDisplacedStructureMaker,
     calculate_electron_phonon_renormalisation,
     run_elph_displacements,
+    store_band_edges,
 )
 from atomate2.vasp.sets.core import (
     HSEBSSetGenerator,
@@ -86,6 +87,10 @@ class ElectronPhononMaker(Maker):
     uniform_maker : BaseVaspMaker
         Maker to use to run the density of states on the displaced structures and
         bulk supercell structure.
+    warm_start : bool
+        Whether to start the displaced structure calculations from the charge density
+        of the bulk supercell calculation. The displaced structure calculations will
+        then only start once the first bulk supercell calculation has finished.
     """
 
     name: str = "electron phonon"
@@ -119,6 +124,7 @@ class ElectronPhononMaker(Maker):
             ),
         )
     )
+    warm_start: bool = False
 
     def make(self, structure: Structure, prev_vasp_dir: str | Path | None = None):
         """
@@ -163,6 +169,14 @@ class ElectronPhononMaker(Maker):
             elph.output.structure, prev_vasp_dir=static.output.dir_name
         )
         supercell_dos.append_name(" bulk supercell")
+        store_band_edges(supercell_dos)
+
+        warm_start_dir = None
+        if self.warm_start:
+            bulk_job = supercell_dos
+            while isinstance(bulk_job, Flow):
+                bulk_job = bulk_job.jobs[0]
+            warm_start_dir = bulk_job.output.dir_name
 
         displaced_doses = run_elph_displacements(
             elph.output.calcs_reversed[0].output.elph_displaced_structures.temperatures,
@@ -171,15 +185,16 @@ class ElectronPhononMaker(Maker):
             prev_vasp_dir=static.output.dir_name,
             original_structure=static.output.structure,
             supercell_structure=elph.output.structure,
+            warm_start_dir=warm_start_dir,
         )
 
         renorm = calculate_electron_phonon_renormalisation(
             displaced_doses.output["temperatures"],
-            displaced_doses.output["band_structures"],
+            displaced_doses.output["band_edges"],
             displaced_doses.output["structures"],
             displaced_doses.output["uuids"],
             displaced_doses.output["dirs"],
-            supercell_dos.output.vasp_objects["bandstructure"],
+            supercell_dos.output.calcs_reversed[0].output.band_edges,
             supercell_dos.output.structure,
             supercell_dos.output.uuid,
             supercell_dos.output.dir_name,
@@ -0,0 +1,255 @@
+"""Custodian error handlers for VASP calculations."""
+
+from __future__ import annotations
+
+import logging
+import math
+from pathlib import Path
+
+from custodian.custodian import ErrorHandler
+from custodian.utils import backup
+from custodian.vasp.handlers import VASP_BACKUP_FILES
+from custodian.vasp.interpreter import VaspModder
+from pymatgen.io.vasp import Incar, VaspInput
+
+from atomate2.vasp.monitor import IONIC_REGEX, SCF_REGEX, FileTail, to_float
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["ConvergenceTrendHandler"]
+
+
+class ConvergenceTrendHandler(ErrorHandler):
+    """
+    Stop VASP early when the electronic or ionic loops are not making progress.
+
+    The OSZICAR is read incrementally each time the handler is checked. Two trends are
+    detected:
+
+    - ``"scf_stalled"``: over the last ``scf_window`` electronic steps of the current
+      ionic step, log10 of the energy change decreases by less than ``min_scf_slope``
+      per step while still being far above EDIFF. If the sign of the energy change
+      alternates in most steps, the stall is treated as charge sloshing
+      (``"scf_oscillation"``).
+    - ``"ionic_oscillation"``: over the last ``ionic_window`` ionic steps, the change
+      in free energy alternates in sign, the energy has not decreased overall, and
+      the largest change is more than ``ionic_ediffg_factor`` times the energy
+      convergence criterion for the relaxation (EDIFFG, or 10 * EDIFF if EDIFFG is
+      a force criterion or not set).
+
+    Rather than waiting for NELM or NSW to be reached, VASP is stopped and a targeted
+    INCAR fix is applied. Charge sloshing is fixed by reducing the mixing parameters
+    (AMIX and BMIX) before changing ALGO; a stalled SCF is fixed by changing ALGO
+    first. An oscillating relaxation is fixed by halving POTIM and finally switching
+    to the RMM-DIIS optimiser (IBRION = 1) from the last CONTCAR.
+
+    Parameters
+    ----------
+    output_filename
+        The name of the OSZICAR file.
+    scf_window
+        The number of electronic steps used to fit the trend.
+    min_scf_steps
+        The minimum number of electronic steps in an ionic step before the SCF trend
+        is checked.
+    min_scf_slope
+        The minimum decrease of log10 |dE| per electronic step considered progress.
+    ediff_factor
+        The SCF trend is only checked when |dE| is larger than this multiple of EDIFF.
+    oscillation_fraction
+        The fraction of steps in which the sign of the energy change must flip for the
+        convergence to be considered oscillating.
+    ionic_window
+        The number of ionic steps used to detect oscillations.
+    ionic_ediffg_factor
+        Ionic oscillations smaller than this multiple of the energy convergence
+        criterion are ignored.
+    """
+
+    is_monitor = True
+
+    def __init__(
+        self,
+        output_filename: str = "OSZICAR",
+        scf_window: int = 20,
+        min_scf_steps: int = 40,
+        min_scf_slope: float = 0.02,
+        ediff_factor: float = 100,
+        oscillation_fraction: float = 0.7,
+        ionic_window: int = 8,
+        ionic_ediffg_factor: float = 10,
+    ):
+        self.output_filename = output_filename
+        self.scf_window = scf_window
+        self.min_scf_steps = min_scf_steps
+        self.min_scf_slope = min_scf_slope
+        self.ediff_factor = ediff_factor
+        self.oscillation_fraction = oscillation_fraction
+        self.ionic_window = ionic_window
+        self.ionic_ediffg_factor = ionic_ediffg_factor
+
+        self.errors: set[str] = set()
+        self.error_count: dict[str, int] = {}
+        self._tail = FileTail(output_filename)
+        self._reset()
+
+    def _reset(self):
+        self._scf_de: list[float] = []
+        self._ionic_energies: list[float] = []
+
+    def check(self) -> bool:
+        """
+        Check the OSZICAR for unproductive electronic or ionic convergence.
+
+        Returns
+        -------
+        bool
+            Whether an error was detected.
+        """
+        self._read_oszicar()
+        self.errors = set()
+
+        incar = Incar.from_file("INCAR") if Path("INCAR").exists() else {}
+        ediff = incar.get("EDIFF", 1e-4)
+
+        if len(self._scf_de) >= max(self.min_scf_steps, self.scf_window):
+            scf_de = self._scf_de[-self.scf_window :]
+            if abs(scf_de[-1]) > self.ediff_factor * ediff:
+                log_de = [math.log10(max(abs(de), 1e-12)) for de in scf_de]
+                if _get_slope(log_de) > -self.min_scf_slope:
+                    if _get_sign_flip_fraction(scf_de) >= self.oscillation_fraction:
+                        self.errors.add("scf_oscillation")
+                    else:
+                        self.errors.add("scf_stalled")
+
+        if incar.get("IBRION", -1) in (1, 2, 3) and (
+            len(self._ionic_energies) > self.ionic_window
+        ):
+            energies = self._ionic_energies[-self.ionic_window - 1 :]
+            changes = [e2 - e1 for e1, e2 in zip(energies[:-1], energies[1:])]
+
+            # negative EDIFFG is a force criterion; VASP then uses 10 * EDIFF
+            ediffg = incar.get("EDIFFG", 10 * ediff)
+            energy_tol = ediffg if ediffg > 0 else 10 * ediff
+            if (
+                _get_sign_flip_fraction(changes) >= self.oscillation_fraction
+                and energies[-1] >= energies[0]
+                and max(abs(c) for c in changes) > self.ionic_ediffg_factor * energy_tol
+            ):
+                self.errors.add("ionic_oscillation")
+
+        return len(self.errors) > 0
+
+    def correct(self) -> dict:
+        """
+        Stop the calculation and apply a targeted fix to the INCAR.
+
+        Returns
+        -------
+        dict
+            The errors detected and the actions taken. If no fix is left, the actions
+            are ``None`` and custodian treats the error as unrecoverable.
+        """
+        vi = VaspInput.from_directory(".")
+        incar = vi["INCAR"]
+        actions = []
+
+        for error in sorted(self.errors):
+            count = self.error_count.get(error, 0)
+            self.error_count[error] = count + 1
+
+            if error == "ionic_oscillation":
+                fixes = _get_ionic_fixes(incar)
+            else:
+                fixes = _get_scf_fixes(incar, sloshing=error == "scf_oscillation")
+
+            if count < len(fixes):
+                actions.append({"dict": "INCAR", "action": {"_set": fixes[count]}})
+                if error == "ionic_oscillation":
+                    # restart from the latest structure rather than the beginning
+                    copy_action = {"_file_copy": {"dest": "POSCAR"}}
+                    actions.append({"file": "CONTCAR", "action": copy_action})
+                logger.info(f"Applying {fixes[count]} to fix {error}")
+
+        if len(actions) == 0:
+            return {"errors": sorted(self.errors), "actions": None}
+
+        backup(VASP_BACKUP_FILES)
+        VaspModder(vi=vi).apply_actions(actions)
+
+        # VASP is restarted and will write a new OSZICAR; remove the old one so that
+        # it is not mistaken for the output of the new calculation
+        Path(self.output_filename).unlink(missing_ok=True)
+        self._tail = FileTail(self.output_filename)
+        self._reset()
+        return {"errors": sorted(self.errors), "actions": actions}
+
+    def _read_oszicar(self):
+        nresets = self._tail.nresets
+        lines = self._tail.read_lines()
+        if self._tail.nresets != nresets:
+            # the file was replaced and is being read from the beginning
+            self._reset()
+
+        for line in lines:
+            ionic_match = IONIC_REGEX.match(line)
+            if ionic_match:
+                energy = to_float(ionic_match.group(2))
+                if energy is not None:
+                    self._ionic_energies.append(energy)
+                self._scf_de = []
+                continue
+
+            scf_match = SCF_REGEX.match(line)
+            if scf_match:
+                de = to_float(scf_match.group(4))
+                # overflowing energy changes are treated as very large
+                self._scf_de.append(de if de is not None else 1e10)
+
+
+def _get_scf_fixes(incar: Incar, sloshing: bool) -> list[dict]:
+    """Get the INCAR fixes for an unproductive SCF, in the order they are tried."""
+    algo = str(incar.get("ALGO", "Normal")).lower()
+    algo_fix = {"ALGO": "All"} if algo != "all" else {"ALGO": "Damped", "TIME": 0.5}
+
+    amix = incar.get("AMIX", 0.4)
+    bmix = incar.get("BMIX", 1.0)
+    mixing_fix = {"AMIX": round(amix / 4, 4), "BMIX": round(bmix / 100, 6)}
+    if incar.get("ISPIN", 1) == 2:
+        mixing_fix.update(
+            {
+                "AMIX_MAG": round(incar.get("AMIX_MAG", 1.6) / 2, 4),
+                "BMIX_MAG": round(incar.get("BMIX_MAG", 1.0) / 100, 6),
+            }
+        )
+
+    if sloshing:
+        return [mixing_fix, algo_fix]
+    return [algo_fix, mixing_fix]
+
+
+def _get_ionic_fixes(incar: Incar) -> list[dict]:
+    """Get the INCAR fixes for an oscillating relaxation, in the order to try them."""
+    potim = incar.get("POTIM", 0.5)
+    fixes = [{"POTIM": round(potim / 2, 4)}, {"POTIM": round(potim / 4, 4)}]
+    if incar.get("IBRION") != 1:
+        fixes.append({"IBRION": 1, "POTIM": round(potim / 4, 4)})
+    return fixes
+
+
+def _get_slope(values: list[float]) -> float:
+    """Get the least-squares slope of evenly spaced values."""
+    n = len(values)
+    x_mean = (n - 1) / 2
+    y_mean = sum(values) / n
+    numerator = sum((i - x_mean) * (y - y_mean) for i, y in enumerate(values))
+    denominator = sum((i - x_mean) ** 2 for i in range(n))
+    return numerator / denominator
+
+
+def _get_sign_flip_fraction(values: list[float]) -> float:
+    """Get the fraction of consecutive values that change sign."""
+    if len(values) < 2:
+        return 0
+    flips = sum(v1 * v2 < 0 for v1, v2 in zip(values[:-1], values[1:]))
+    return flips / (len(values) - 1)
@@ -2,21 +2,25 @@
 
 from __future__ import annotations
 
+import shutil
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Iterator
 
 import numpy as np
-from click.testing import CliRunner
 from jobflow import Flow, Response, job
+from monty.io import zopen
 from pymatgen.core import Structure
 from pymatgen.core.tensors import symmetry_reduce
+from pymatgen.electronic_structure.core import Spin
 from pymatgen.transformations.standard_transformations import (
     DeformStructureTransformation,
 )
 
-from atomate2 import SETTINGS
 from atomate2.common.files import get_zfile
 from atomate2.common.schemas.math import Vector3D
+from atomate2.settings import SETTINGS_DEFAULT
 from atomate2.utils.file_client import FileClient
 from atomate2.utils.path import strip_hostname
 from atomate2.vasp.jobs.base import BaseVaspMaker
@@ -68,6 +72,10 @@ class DenseUniformMaker(NonSCFMaker):
         the "." character which is typically used to denote file extensions. To avoid
         this, use the ":" character, which will automatically be converted to ".". E.g.
         ``{"my_file:txt": "contents of the file"}``.
+    gzip_exclude : list of str
+        Files to leave uncompressed when the job directory is gzipped. By default, the
+        WAVECAR is not compressed so that it can be read in place when generating the
+        wavefunction coefficients.
     """
 
     name: str = "dense uniform"
@@ -76,6 +84,7 @@ class DenseUniformMaker(NonSCFMaker):
             mode="uniform", reciprocal_density=1000, user_incar_settings={"LWAVE": True}
         )
     )
+    gzip_exclude: list = field(default_factory=lambda: ["WAVECAR"])
 
 
 @dataclass
@@ -189,6 +198,10 @@ class HSEDenseUniformMaker(HSEBSMaker):
         the "." character which is typically used to denote file extensions. To avoid
         this, use the ":" character, which will automatically be converted to ".". E.g.
         ``{"my_file:txt": "contents of the file"}``.
+    gzip_exclude : list of str
+        Files to leave uncompressed when the job directory is gzipped. By default, the
+        WAVECAR is not compressed so that it can be read in place when generating the
+        wavefunction coefficients.
     """
 
     name: str = "dense uniform"
@@ -199,12 +212,13 @@ class HSEDenseUniformMaker(HSEBSMaker):
             user_incar_settings={"LWAVE": True},
         )
     )
+    gzip_exclude: list = field(default_factory=lambda: ["WAVECAR"])
 
 
 @job
 def run_amset_deformations(
     structure: Structure,
-    symprec: float = SETTINGS.SYMPREC,
+    symprec: float | None = SETTINGS_DEFAULT,
     prev_vasp_dir: str | Path | None = None,
     static_deformation_maker: BaseVaspMaker | None = None,
 ):
@@ -218,9 +232,9 @@ def run_amset_deformations(
     ----------
     structure : .Structure
         A pymatgen structure.
-    symprec : float
+    symprec : float or None
         Symmetry precision used to reduce the number of deformations. Set to None for
-        no symmetry reduction.
+        no symmetry reduction. Defaults to the ``SYMPREC`` setting.
     prev_vasp_dir : str or Path or None
         A previous VASP directory to use for copying VASP outputs.
     static_deformation_maker : .BaseVaspMaker or None
@@ -236,6 +250,11 @@ def run_amset_deformations(
     if static_deformation_maker is None:
         static_deformation_maker = StaticDeformationMaker()
 
+    if symprec is SETTINGS_DEFAULT:
+        from atomate2 import SETTINGS
+
+        symprec = SETTINGS.SYMPREC
+
     deformations = get_deformations(0.005)
     if symprec is not None:
         deformations = list(symmetry_reduce(deformations, structure, symprec=symprec))
@@ -265,13 +284,14 @@ def run_amset_deformations(
 def calculate_deformation_potentials(
     bulk_dir: str,
     deformation_dirs: list[str],
-    symprec: float = SETTINGS.SYMPREC,
+    symprec: float | None = SETTINGS_DEFAULT,
     ibands: tuple[list[int], list[int]] = None,
 ):
     """
     Generate the deformation.h5 (containing deformation potentials) using AMSET.
 
-    Note, this script just calls ``amset deform read``.
+    Note, this job calls the ``amset deform read`` command in process rather than
+    through the command line interface.
 
     Parameters
     ----------
@@ -279,9 +299,9 @@ def calculate_deformation_potentials(
         The folder containing the bulk calculation data.
     deformation_dirs : list of str
         A list of folders for each deformation.
-    symprec : float
+    symprec : float or None
         The symmetry precision used to reduce the number of deformations. Set to None
-        if no-symmetry reduction was applied.
+        if no-symmetry reduction was applied. Defaults to the ``SYMPREC`` setting.
     ibands : tuple of list of int
         Which bands to include in the deformation.h5 file. Given as a tuple of one or
         two lists (one for each spin channel). The bands indices are zero indexed.
@@ -293,34 +313,38 @@ def calculate_deformation_potentials(
 
         - "dir_name": containing the directory where the deformation.h5 file was
           generated.
-        - "log": The output log from ``amset deform read``.
+        - "ibands": The bands included in the deformation.h5 file, if specified.
+
+        The "log" key containing the output of ``amset deform read`` is no longer
+        included, as the command is not run through the command line interface.
     """
     from amset.tools.deformation import read
-    from click.testing import CliRunner
 
-    # convert arguments into their command line equivalents
-    # note, amset expects the band indices to be 1 indexed, whereas we store them
-    # as zero indexed
-    symprec_str = "N" if symprec is None else str(symprec)
+    if symprec is SETTINGS_DEFAULT:
+        from atomate2 import SETTINGS
+
+        symprec = SETTINGS.SYMPREC
 
     # TODO: Handle hostnames properly
     bulk_dir = strip_hostname(bulk_dir)
     deformation_dirs = [strip_hostname(d) for d in deformation_dirs]
-    args = [
-        bulk_dir,
-        *deformation_dirs,
-        f"--symprec={symprec_str}",
-    ]
+
+    # start from the command defaults so that only the options we set are changed
+    arguments = ("bulk_folder", "deformation_folders")
+    kwargs = {p.name: p.default for p in read.params if p.name not in arguments}
+    kwargs["symprec"] = "N" if symprec is None else str(symprec)
     if ibands is not None:
-        bands_str = ".".join(",".join([str(idx + 1) for idx in b]) for b in ibands)
-        args.append(f"--bands={bands_str}")
+        kwargs["bands"] = _get_bands_string(ibands)
 
-    runner = CliRunner()
-    result = runner.invoke(read, args, catch_exceptions=False)
+    try:
+        read.callback(bulk_dir, deformation_dirs, **kwargs)
+    except SystemExit as e:
+        # amset exits if the deformations do not cover the strain tensor or the BZ
+        raise ValueError(f"Could not calculate deformation potentials: {e}") from e
 
     # TODO: Store some information about the deformation potentials, e.g., values
     #   at CBM and VBM?
-    return {"dir_name": str(Path.cwd()), "log": result.output}
+    return {"dir_name": str(Path.cwd()), "ibands": ibands}
 
 
 @job
@@ -373,6 +397,11 @@ def generate_wavefunction_coefficients(dir_name: str):
     """
     Generate wavefunction.h5 file using amset.
 
+    The coefficients are generated in process using the amset Python API. An
+    uncompressed WAVECAR (as kept by :obj:`DenseUniformMaker`) is read in place from
+    ``dir_name``; a gzipped WAVECAR is decompressed in a single streaming pass into the
+    current directory and removed once it has been read.
+
     Parameters
     ----------
     dir_name : str
@@ -385,12 +414,26 @@ def generate_wavefunction_coefficients(dir_name: str):
 
         - "dir_name" (str): containing the directory where the wavefunction.h5 file was
           generated.
-        - "log" (str): The output log from ``amset wave``.
         - "ibands" (Tuple[List[int], ...]): The bands included in the wavefunction.h5
           file. Given as a tuple of one or two lists (one for each spin channel).
           The bands indices are zero indexed.
+        - "planewave_cutoff" (float): The plane wave cutoff used for the coefficients.
+
+        The "log" key containing the output of ``amset wave`` is no longer included;
+        the bands are taken directly from amset rather than parsed from the log.
     """
-    from amset.tools.wavefunction import wave
+    from amset.constants import defaults
+    from amset.electronic_structure.common import (
+        get_band_structure,
+        get_ibands,
+        get_zero_weighted_kpoint_indices,
+    )
+    from amset.wavefunction.io import write_coefficients
+    from amset.wavefunction.vasp import (
+        get_converged_encut,
+        get_wavefunction_coefficients,
+    )
+    from pymatgen.io.vasp import BSVasprun, Wavecar
 
     dir_name = strip_hostname(dir_name)  # TODO: Handle hostnames properly.
     fc = FileClient()
@@ -398,56 +441,71 @@ def generate_wavefunction_coefficients(dir_name: str):
     vasprun_file = Path(dir_name) / get_zfile(files, "vasprun.xml")
     wavecar_file = Path(dir_name) / get_zfile(files, "WAVECAR")
 
-    # wavecar can't be gzipped, so copy it to current directory and unzip it
-    fc.copy(wavecar_file, wavecar_file.name)
-    fc.gunzip(wavecar_file.name)
+    vasprun = BSVasprun(str(vasprun_file))
+    zwk_mode = defaults["zero_weighted_kpoints"]
+    band_structure = get_band_structure(vasprun, zero_weighted=zwk_mode)
+    ibands = get_ibands(defaults["energy_cutoff"], band_structure)
+    ikpoints = get_zero_weighted_kpoint_indices(vasprun, zwk_mode)
+
+    # the coefficients are read into memory when the Wavecar is initialised
+    with _uncompressed_file(wavecar_file) as filename:
+        wavefunction = Wavecar(filename)
+
+    planewave_cutoff = get_converged_encut(
+        wavefunction, iband=ibands, ikpoints=ikpoints, n_samples=2000, std_tol=0.02
+    )
+    coeffs, gpoints = get_wavefunction_coefficients(
+        wavefunction, iband=ibands, ikpoints=ikpoints, encut=planewave_cutoff
+    )
+    kpoints = np.array([k.frac_coords for k in band_structure.kpoints])
+    write_coefficients(
+        coeffs, gpoints, kpoints, vasprun.final_structure, filename="wavefunction.h5"
+    )
+
+    return {
+        "dir_name": str(Path.cwd()),
+        "ibands": _get_ibands_tuple(ibands),
+        "planewave_cutoff": planewave_cutoff,
+    }
 
-    args = ["--wavecar=WAVECAR", f"--vasprun={vasprun_file}"]
-    runner = CliRunner()
-    result = runner.invoke(wave, args, catch_exceptions=False)
-    ibands = _extract_ibands(result.output)
 
-    # remove WAVECAR from current directory
-    fc.remove("WAVECAR")
+def _get_bands_string(ibands: tuple[list[int], ...]) -> str:
+    """
+    Convert zero indexed bands to the amset bands option.
 
-    return {"dir_name": str(Path.cwd()), "log": result.output, "ibands": ibands}
+    Amset expects the band indices to be 1 indexed, with spin channels separated by
+    a full stop, e.g., "1,2,3.1,2".
+    """
+    return ".".join(",".join([str(i + 1) for i in b]) for b in ibands)
 
 
-def _extract_ibands(log: str) -> tuple[list[int], ...]:
+def _get_ibands_tuple(ibands: dict) -> tuple[list[int], ...]:
     """
-    Extract ibands from an ``amset wave`` log.
+    Convert the bands selected by amset to a tuple of lists.
 
-    Note in the log the band indices are 1 indexed but this function returns zero
-    indexed band indices.
+    Amset gives the zero indexed bands as a dict of ``{spin: array}``. These are
+    converted to a tuple of one or two lists (spin up, then spin down).
+    """
+    spins = [spin for spin in (Spin.up, Spin.down) if spin in ibands]
+    return tuple(np.asarray(ibands[spin]).tolist() for spin in spins)
 
-    Parameters
-    ----------
-    log : str
-        The log from ``amset wave``.
 
-    Returns
-    -------
-    tuple of list of int
-        The bands included in the wavefunction.h5 file. Given as a tuple of one or two
-        lists (one for each spin channel). The bands indices are zero indexed.
+@contextmanager
+def _uncompressed_file(filename: Path) -> Iterator[Path]:
+    """
+    Get the path to an uncompressed version of a file.
+
+    Uncompressed files are used in place. Compressed files are decompressed in
+    chunks into the current directory and removed afterwards.
     """
-    result_splits = log.split("\n")
-    for i in range(len(result_splits)):
-        if "Including bands" in result_splits[i]:
-            # non-spin polarised result system
-            min_band, max_band = result_splits[i].split()[-1].split("—")
-            return (list(range(int(min_band) - 1, int(max_band))),)
-
-        if "Including:" in result_splits[i]:
-            amin_band, amax_band = result_splits[i + 1].split()[-1].split("—")
-            bmin_band, bmax_band = result_splits[i + 2].split()[-1].split("—")
-            aibands = list(range(int(amin_band) - 1, int(amax_band)))
-            bibands = list(range(int(bmin_band) - 1, int(bmax_band)))
-
-            if "up" in result_splits[i + 1]:
-                # up listed first
-                return aibands, bibands
-            else:
-                # down listed first
-                return bibands, aibands
-    raise ValueError("Could not find ibands in log.")
+    if not filename.name.endswith((".gz", ".GZ", ".bz2", ".xz", ".lzma")):
+        yield filename
+        return
+
+    dest = Path(filename.name.split(".")[0])
+    with zopen(filename, "rb") as f_in, open(dest, "wb") as f_out:
+        shutil.copyfileobj(f_in, f_out, length=64 * 1024 * 1024)
+    try:
+        yield dest
+    finally:
+        dest.unlink()
@@ -8,7 +8,6 @@ from typing import Callable
 
 from jobflow import Maker, Response, job
 from monty.serialization import dumpfn
-from monty.shutil import gzip_dir
 from pymatgen.core import Structure
 from pymatgen.core.trajectory import Trajectory
 from pymatgen.electronic_structure.bandstructure import (
@@ -18,10 +17,16 @@ from pymatgen.electronic_structure.bandstructure import (
 from pymatgen.electronic_structure.dos import DOS, CompleteDos, Dos
 from pymatgen.io.vasp import Chgcar, Locpot, Wavecar
 
-from atomate2.vasp.files import copy_vasp_outputs, write_vasp_input_set
+from atomate2.common.files import gzip_files
+from atomate2.vasp.files import (
+    apply_warm_start,
+    copy_vasp_outputs,
+    write_vasp_input_set,
+)
 from atomate2.vasp.run import run_vasp, should_stop_children
 from atomate2.vasp.schemas.task import TaskDocument
 from atomate2.vasp.sets.base import VaspInputGenerator
+from atomate2.vasp.summary import write_vasp_summary
 
 __all__ = ["BaseVaspMaker", "vasp_job"]
 
@@ -103,6 +108,16 @@ class BaseVaspMaker(Maker):
         the "." character which is typically used to denote file extensions. To avoid
         this, use the ":" character, which will automatically be converted to ".". E.g.
         ``{"my_file:txt": "contents of the file"}``.
+    warm_start : bool or None
+        Whether to start from the WAVECAR or CHGCAR of the previous calculation, if
+        one is given and the calculations are compatible. See
+        :obj:`.apply_warm_start`. Defaults to the ``VASP_WARM_START`` setting.
+    warm_start_kwargs : dict
+        Keyword arguments that will get passed to :obj:`.apply_warm_start`.
+    gzip_exclude : list of str
+        Files to leave uncompressed when the job directory is gzipped. Supports glob
+        file matching. Useful for large files that are read by later jobs, such as the
+        WAVECAR of a dense k-point mesh.
     """
 
     name: str = "base vasp job"
@@ -113,6 +128,9 @@ class BaseVaspMaker(Maker):
     task_document_kwargs: dict = field(default_factory=dict)
     stop_children_kwargs: dict = field(default_factory=dict)
     write_additional_data: dict = field(default_factory=dict)
+    warm_start: bool | None = None
+    warm_start_kwargs: dict = field(default_factory=dict)
+    gzip_exclude: list = field(default_factory=list)
 
     @vasp_job
     def make(self, structure: Structure, prev_vasp_dir: str | Path | None = None):
@@ -134,11 +152,27 @@ class BaseVaspMaker(Maker):
         if "from_prev" not in self.write_input_set_kwargs:
             self.write_input_set_kwargs["from_prev"] = from_prev
 
+        if "vasp_cmd" in self.run_vasp_kwargs:
+            # plan the resources for the command that will run vasp
+            self.write_input_set_kwargs.setdefault(
+                "vasp_cmd", self.run_vasp_kwargs["vasp_cmd"]
+            )
+
         # write vasp input files
         write_vasp_input_set(
             structure, self.input_set_generator, **self.write_input_set_kwargs
         )
 
+        # reuse the wavefunction or charge density of the previous calculation
+        warm_start = self.warm_start
+        if warm_start is None:
+            from atomate2 import SETTINGS
+
+            warm_start = SETTINGS.VASP_WARM_START
+
+        if warm_start and prev_vasp_dir is not None:
+            apply_warm_start(prev_vasp_dir, **self.warm_start_kwargs)
+
         # write any additional data
         for filename, data in self.write_additional_data.items():
             dumpfn(data, filename.replace(":", "."))
@@ -153,8 +187,11 @@ class BaseVaspMaker(Maker):
         # decide whether child jobs should proceed
         stop_children = should_stop_children(task_doc, **self.stop_children_kwargs)
 
+        # write a summary of the outputs so child jobs can skip parsing them
+        write_vasp_summary(task_doc)
+
         # gzip folder
-        gzip_dir(".")
+        gzip_files(".", exclude_files=self.gzip_exclude, force=True)
 
         return Response(
             stop_children=stop_children,
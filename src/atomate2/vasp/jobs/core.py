@@ -6,15 +6,6 @@ import logging
 from dataclasses import dataclass, field
 from pathlib import Path
 
-from custodian.vasp.handlers import (
-    FrozenJobErrorHandler,
-    IncorrectSmearingHandler,
-    LargeSigmaHandler,
-    MeshSymmetryErrorHandler,
-    PositiveEnergyErrorHandler,
-    StdErrHandler,
-    VaspErrorHandler,
-)
 from pymatgen.alchemy.materials import TransformedStructure
 from pymatgen.alchemy.transmuters import StandardTransmuter
 from pymatgen.core.structure import Structure
@@ -566,17 +557,7 @@ class MDMaker(BaseVaspMaker):
     # Explicitly pass the handlers to not use the default ones. Some default handlers
     # such as PotimErrorHandler do not apply to MD runs.
     run_vasp_kwargs: dict = field(
-        default_factory=lambda: {
-            "handlers": (
-                VaspErrorHandler(),
-                MeshSymmetryErrorHandler(),
-                PositiveEnergyErrorHandler(),
-                FrozenJobErrorHandler(),
-                StdErrHandler(),
-                LargeSigmaHandler(),
-                IncorrectSmearingHandler(),
-            )
-        }
+        default_factory=lambda: {"handlers": _get_md_handlers()}
     )
 
     # Store ionic steps info in a pymatgen Trajectory object instead of in the output
@@ -586,6 +567,29 @@ class MDMaker(BaseVaspMaker):
     )
 
 
+def _get_md_handlers() -> tuple:
+    """Get the custodian error handlers for MD runs."""
+    from custodian.vasp.handlers import (
+        FrozenJobErrorHandler,
+        IncorrectSmearingHandler,
+        LargeSigmaHandler,
+        MeshSymmetryErrorHandler,
+        PositiveEnergyErrorHandler,
+        StdErrHandler,
+        VaspErrorHandler,
+    )
+
+    return (
+        VaspErrorHandler(),
+        MeshSymmetryErrorHandler(),
+        PositiveEnergyErrorHandler(),
+        FrozenJobErrorHandler(),
+        StdErrHandler(),
+        LargeSigmaHandler(),
+        IncorrectSmearingHandler(),
+    )
+
+
 def _get_transformations(
     transformations: tuple[str, ...], params: tuple[dict, ...] | None
 ):
@@ -7,20 +7,24 @@ from dataclasses import dataclass, field
 from pathlib import Path
 
 import numpy as np
-from jobflow import Flow, Response, job
+from jobflow import Flow, OnMissing, Response, job
 from pymatgen.alchemy.materials import TransformedStructure
 from pymatgen.analysis.elasticity import Deformation, Strain, Stress
 from pymatgen.core.structure import Structure
-from pymatgen.core.tensors import symmetry_reduce
 from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
 from pymatgen.transformations.standard_transformations import (
     DeformStructureTransformation,
 )
 
-from atomate2 import SETTINGS
-from atomate2.common.analysis.elastic import get_default_strain_states
+from atomate2.common.analysis.elastic import (
+    get_default_strain_states,
+    get_symmetry_reduced_deformations,
+    is_born_stable,
+)
+from atomate2.common.jobs import get_output_collector
 from atomate2.common.schemas.elastic import ElasticDocument
 from atomate2.common.schemas.math import Matrix3D
+from atomate2.settings import SETTINGS_DEFAULT
 from atomate2.vasp.jobs.base import BaseVaspMaker
 from atomate2.vasp.sets.base import VaspInputGenerator
 from atomate2.vasp.sets.core import StaticSetGenerator
@@ -30,8 +34,10 @@ logger = logging.getLogger(__name__)
 __all__ = [
     "ElasticRelaxMaker",
     "generate_elastic_deformations",
+    "generate_elastic_symmetry_map",
     "run_elastic_deformations",
     "fit_elastic_tensor",
+    "fit_elastic_tensor_adaptive",
 ]
 
 
@@ -95,7 +101,7 @@ def generate_elastic_deformations(
     strain_states: list[tuple[int, int, int, int, int, int]] | None = None,
     strain_magnitudes: list[float] | list[list[float]] | None = None,
     conventional: bool = False,
-    symprec: float = SETTINGS.SYMPREC,
+    symprec: float | None = None,
     sym_reduce: bool = True,
 ):
     """
@@ -116,16 +122,95 @@ def generate_elastic_deformations(
         each inner list corresponds to a specific strain state.
     conventional : bool
         Whether to transform the structure into the conventional cell.
-    symprec : float
-        Symmetry precision.
+    symprec : float or None
+        Symmetry precision. Defaults to the ``SYMPREC`` setting.
     sym_reduce : bool
         Whether to reduce the number of deformations using symmetry.
 
     Returns
     -------
     List[Deformation]
-        A list of deformations.
+        A list of deformations. The symmetry-expansion map for the reduced
+        deformations can be obtained using :obj:`generate_elastic_symmetry_map`.
+    """
+    deformations, _ = _get_elastic_deformations(
+        structure,
+        order=order,
+        strain_states=strain_states,
+        strain_magnitudes=strain_magnitudes,
+        conventional=conventional,
+        symprec=symprec,
+        sym_reduce=sym_reduce,
+    )
+    return deformations
+
+
+@job
+def generate_elastic_symmetry_map(
+    structure: Structure,
+    order: int = 2,
+    strain_states: list[tuple[int, int, int, int, int, int]] | None = None,
+    strain_magnitudes: list[float] | list[list[float]] | None = None,
+    conventional: bool = False,
+    symprec: float | None = None,
+):
+    """
+    Generate the symmetry-expansion map for the symmetry reduced elastic deformations.
+
+    The arguments should be the same as those given to
+    :obj:`generate_elastic_deformations` (with ``sym_reduce=True``), in which case the
+    "images" entry of the map is in the same order as the generated deformations.
+
+    Parameters
+    ----------
+    structure : Structure
+        A pymatgen structure object.
+    order : int
+        Order of the tensor expansion to be determined. Can be either 2 or 3.
+    strain_states : None or list of tuple of int
+        List of Voigt-notation strains, e.g. ``[(1, 0, 0, 0, 0, 0), (0, 1, 0, 0, 0, 0),
+        etc]``.
+    strain_magnitudes : None or list of float or list of list of float
+        A list of strain magnitudes to multiply by for each strain state. See
+        :obj:`generate_elastic_deformations` for more details.
+    conventional : bool
+        Whether to transform the structure into the conventional cell.
+    symprec : float or None
+        Symmetry precision. Defaults to the ``SYMPREC`` setting.
+
+    Returns
+    -------
+    dict
+        The symmetry-expansion map needed to recover the equivalent deformations. See
+        :obj:`.get_symmetry_reduced_deformations` for the format.
     """
+    _, symmetry_map = _get_elastic_deformations(
+        structure,
+        order=order,
+        strain_states=strain_states,
+        strain_magnitudes=strain_magnitudes,
+        conventional=conventional,
+        symprec=symprec,
+        sym_reduce=True,
+    )
+    return symmetry_map
+
+
+def _get_elastic_deformations(
+    structure: Structure,
+    order: int = 2,
+    strain_states: list[tuple[int, int, int, int, int, int]] | None = None,
+    strain_magnitudes: list[float] | list[list[float]] | None = None,
+    conventional: bool = False,
+    symprec: float | None = None,
+    sym_reduce: bool = True,
+) -> tuple[list[Deformation], dict | None]:
+    """Get the (symmetry reduced) deformations and the symmetry-expansion map."""
+    if symprec is None:
+        from atomate2 import SETTINGS
+
+        symprec = SETTINGS.SYMPREC
+
     if conventional:
         sga = SpacegroupAnalyzer(structure, symprec=symprec)
         structure = sga.get_conventional_standard_structure()
@@ -154,15 +239,18 @@ def generate_elastic_deformations(
 
     deformations = [s.get_deformation_matrix() for s in strains]
 
+    symmetry_map = None
     if sym_reduce:
-        deformation_mapping = symmetry_reduce(deformations, structure, symprec=symprec)
+        reduced_deformations, symmetry_map = get_symmetry_reduced_deformations(
+            deformations, structure, symprec=symprec
+        )
         logger.info(
             f"Using symmetry to reduce number of deformations from {len(deformations)} "
-            f"to {len(list(deformation_mapping.keys()))}"
+            f"to {len(reduced_deformations)}"
         )
-        deformations = list(deformation_mapping.keys())
+        deformations = reduced_deformations
 
-    return deformations
+    return deformations, symmetry_map
 
 
 @job
@@ -176,7 +264,7 @@ def run_elastic_deformations(
     Run elastic deformations.
 
     Note, this job will replace itself with N relaxation calculations, where N is
-    the number of deformations.
+    the number of deformations, and a job that collects their outputs.
 
     Parameters
     ----------
@@ -223,7 +311,12 @@ def run_elastic_deformations(
 
         outputs.append(output)
 
-    relax_flow = Flow(relaxations, outputs)
+    # collect the outputs of all relaxations with a single store query; some of the
+    # deformations are allowed to fail
+    collector = get_output_collector(outputs, on_missing=OnMissing.NONE)
+    collector.name = "collect elastic deformations"
+
+    relax_flow = Flow([*relaxations, collector], collector.output)
     return Response(replace=relax_flow)
 
 
@@ -233,8 +326,9 @@ def fit_elastic_tensor(
     deformation_data: list[dict],
     equilibrium_stress: Matrix3D | None = None,
     order: int = 2,
-    fitting_method: str = SETTINGS.ELASTIC_FITTING_METHOD,
-    symprec: float = SETTINGS.SYMPREC,
+    fitting_method: str | None = None,
+    symprec: float | None = SETTINGS_DEFAULT,
+    symmetry_map: dict | None = None,
 ):
     """
     Analyze stress/strain data to fit the elastic tensor and related properties.
@@ -250,32 +344,233 @@ def fit_elastic_tensor(
         The equilibrium stress of the (relaxed) structure, if known.
     order : int
         Order of the tensor expansion to be fitted. Can be either 2 or 3.
-    fitting_method : str
+    fitting_method : str or None
         The method used to fit the elastic tensor. See pymatgen for more details on the
         methods themselves. The options are:
 
-        - "finite_difference" (note this is required if fitting a 3rd order tensor)
+        - "finite_difference" (note this is the default if fitting a 3rd order tensor)
         - "independent"
         - "pseudoinverse"
-    symprec : float
+        - "least_squares"
+
+        Defaults to the ``ELASTIC_FITTING_METHOD`` setting.
+    symprec : float or None
         Symmetry precision for deriving symmetry equivalent deformations. If
-        ``symprec=None``, then no symmetry operations will be applied.
+        ``symprec=None``, then no symmetry operations will be applied. Defaults to the
+        ``SYMPREC`` setting.
+    symmetry_map : dict or None
+        The symmetry-expansion map generated by :obj:`generate_elastic_symmetry_map`.
+        The "images" entry should be in the same order as ``deformation_data``. If
+        provided, the deformations will be expanded using the map and ``symprec``
+        will be ignored.
     """
+    return _fit_elastic_document(
+        structure,
+        deformation_data,
+        equilibrium_stress=equilibrium_stress,
+        order=order,
+        fitting_method=fitting_method,
+        symprec=symprec,
+        symmetry_map=symmetry_map,
+    )
+
+
+@job(output_schema=ElasticDocument)
+def fit_elastic_tensor_adaptive(
+    structure: Structure,
+    deformation_data: list[dict],
+    strain_magnitudes: list[list[float]],
+    equilibrium_stress: Matrix3D | None = None,
+    order: int = 2,
+    fitting_method: str | None = None,
+    symprec: float | None = SETTINGS_DEFAULT,
+    symmetry_map: dict | None = None,
+    residual_tol: float = 0.05,
+    prev_vasp_dir: str | Path | None = None,
+    elastic_relax_maker: BaseVaspMaker = None,
+    generate_elastic_deformations_kwargs: dict | None = None,
+    previous_deformation_data: list[dict] | None = None,
+    previous_symmetry_map: dict | None = None,
+):
+    """
+    Fit the elastic tensor and submit further deformations if it is not converged.
+
+    The elastic tensor is fitted using all deformations calculated so far. The fit is
+    considered converged if the relative residual of the fitted stresses is below
+    ``residual_tol`` and the elastic tensor satisfies the Born stability criteria. If
+    the fit is not converged, this job will replace itself with a flow that calculates
+    the next batch of strain magnitudes and refits the tensor. If no further strain
+    magnitudes are available, the current fit is returned.
+
+    Parameters
+    ----------
+    structure : ~pymatgen.core.structure.Structure
+        A pymatgen structure.
+    deformation_data : list of dict
+        The deformation data from the latest batch of deformations, as a list of
+        dictionaries, each containing the keys "stress", "deformation".
+    strain_magnitudes : list of list of float
+        The remaining batches of strain magnitudes to use if the fit is not
+        converged, e.g. ``[[-0.005, 0.005], [-0.0075, 0.0075]]``.
+    equilibrium_stress : None or tuple of tuple of float
+        The equilibrium stress of the (relaxed) structure, if known.
+    order : int
+        Order of the tensor expansion to be fitted. Can be either 2 or 3.
+    fitting_method : str or None
+        The method used to fit the elastic tensor. See :obj:`fit_elastic_tensor` for
+        the available options. Defaults to the ``ELASTIC_FITTING_METHOD`` setting.
+    symprec : float or None
+        Symmetry precision for deriving symmetry equivalent deformations. If
+        ``symprec=None``, then no symmetry operations will be applied. Defaults to the
+        ``SYMPREC`` setting.
+    symmetry_map : dict or None
+        The symmetry-expansion map for the latest batch of deformations.
+    residual_tol : float
+        Maximum relative residual of the fitted stresses for the fit to be considered
+        converged.
+    prev_vasp_dir : str or Path or None
+        A previous VASP directory to use for copying VASP outputs.
+    elastic_relax_maker : .BaseVaspMaker
+        A VaspMaker to use to generate the elastic relaxation jobs.
+    generate_elastic_deformations_kwargs : dict or None
+        Keyword arguments passed to :obj:`generate_elastic_deformations`.
+    previous_deformation_data : list of dict or None
+        Deformation data from previous batches.
+    previous_symmetry_map : dict or None
+        The symmetry-expansion map for the previous batches.
+    """
+    from atomate2 import SETTINGS
+
+    # resolve the defaults so that the settings are not passed on as placeholders
+    if fitting_method is None:
+        fitting_method = SETTINGS.ELASTIC_FITTING_METHOD
+    if symprec is SETTINGS_DEFAULT:
+        symprec = SETTINGS.SYMPREC
+
+    if previous_deformation_data is not None:
+        deformation_data = previous_deformation_data + deformation_data
+        if symmetry_map is not None:
+            # all batches use the same structure and symprec, so the rotations are the
+            # same and only the images need to be combined
+            symmetry_map = {
+                "rotations": symmetry_map["rotations"],
+                "images": previous_symmetry_map["images"] + symmetry_map["images"],
+            }
+
+    elastic_doc = _fit_elastic_document(
+        structure,
+        deformation_data,
+        equilibrium_stress=equilibrium_stress,
+        order=order,
+        fitting_method=fitting_method,
+        symprec=symprec,
+        symmetry_map=symmetry_map,
+    )
+
+    # for higher order expansions, ieee_format contains the 2nd order tensor
+    stable = is_born_stable(elastic_doc.elastic_tensor.ieee_format)
+    converged = elastic_doc.fitting_residual <= residual_tol and stable
+    if converged:
+        logger.info("Elastic tensor is converged")
+        return elastic_doc
+
+    if len(strain_magnitudes) == 0:
+        logger.warning(
+            "Elastic tensor is not converged but no strain magnitudes remain "
+            f"(residual: {elastic_doc.fitting_residual:.3f}, stable: {stable})"
+        )
+        return elastic_doc
+
+    logger.info(
+        f"Elastic tensor is not converged (residual: {elastic_doc.fitting_residual:.3f}"
+        f", stable: {stable}); calculating additional strain magnitudes"
+    )
+
+    generate_elastic_deformations_kwargs = generate_elastic_deformations_kwargs or {}
+    generate_kwargs = {
+        "order": order,
+        "strain_magnitudes": strain_magnitudes[0],
+        "symprec": symprec,
+        **generate_elastic_deformations_kwargs,
+    }
+    deformations = generate_elastic_deformations(
+        structure, sym_reduce=symmetry_map is not None, **generate_kwargs
+    )
+    jobs = [deformations]
+
+    next_symmetry_map = None
+    if symmetry_map is not None:
+        symmetry_map_job = generate_elastic_symmetry_map(structure, **generate_kwargs)
+        jobs.append(symmetry_map_job)
+        next_symmetry_map = symmetry_map_job.output
+
+    vasp_deformation_calcs = run_elastic_deformations(
+        structure,
+        deformations.output,
+        prev_vasp_dir=prev_vasp_dir,
+        elastic_relax_maker=elastic_relax_maker,
+    )
+    fit_tensor = fit_elastic_tensor_adaptive(
+        structure,
+        vasp_deformation_calcs.output,
+        strain_magnitudes[1:],
+        equilibrium_stress=equilibrium_stress,
+        order=order,
+        fitting_method=fitting_method,
+        symprec=symprec,
+        symmetry_map=next_symmetry_map,
+        residual_tol=residual_tol,
+        prev_vasp_dir=prev_vasp_dir,
+        elastic_relax_maker=elastic_relax_maker,
+        generate_elastic_deformations_kwargs=generate_elastic_deformations_kwargs,
+        previous_deformation_data=deformation_data,
+        previous_symmetry_map=symmetry_map,
+    )
+
+    # allow some of the deformations to fail
+    fit_tensor.config.on_missing_references = OnMissing.NONE
+
+    flow = Flow([*jobs, vasp_deformation_calcs, fit_tensor], fit_tensor.output)
+    return Response(replace=flow)
+
+
+def _fit_elastic_document(
+    structure: Structure,
+    deformation_data: list[dict],
+    equilibrium_stress: Matrix3D | None = None,
+    order: int = 2,
+    fitting_method: str | None = None,
+    symprec: float | None = SETTINGS_DEFAULT,
+    symmetry_map: dict | None = None,
+) -> ElasticDocument:
+    """Fit an elastic document from the output of the deformation calculations."""
+    if symmetry_map is not None and len(symmetry_map["images"]) != len(
+        deformation_data
+    ):
+        raise ValueError("symmetry map does not match the number of deformations.")
+
     stresses = []
     deformations = []
     uuids = []
     job_dirs = []
-    for data in deformation_data:
+    images = []
+    for i, data in enumerate(deformation_data):
 
         # stress could be none if the deformation calculation failed
         if data["stress"] is None:
             continue
 
+        if symmetry_map is not None:
+            images.append(symmetry_map["images"][i])
+
         stresses.append(Stress(data["stress"]))
         deformations.append(Deformation(data["deformation"]))
         uuids.append(data["uuid"])
         job_dirs.append(data["job_dir"])
 
+    if symmetry_map is not None:
+        symmetry_map = {"rotations": symmetry_map["rotations"], "images": images}
+
     logger.info("Analyzing stress/strain data")
 
     elastic_doc = ElasticDocument.from_stresses(
@@ -288,5 +583,6 @@ def fit_elastic_tensor(
         order=order,
         equilibrium_stress=equilibrium_stress,
         symprec=symprec,
+        symmetry_map=symmetry_map,
     )
     return elastic_doc
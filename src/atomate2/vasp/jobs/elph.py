@@ -7,12 +7,13 @@ from dataclasses import dataclass, field
 from pathlib import Path
 
 import numpy as np
-from jobflow import Flow, Response, job
+from jobflow import Flow, Job, Response, job
 from pymatgen.core import Structure
 from pymatgen.electronic_structure.bandstructure import BandStructure
 
 from atomate2.vasp.jobs.base import BaseVaspMaker, vasp_job
 from atomate2.vasp.jobs.core import TransmuterMaker
+from atomate2.vasp.schemas.calculation import BandEdgeSummary
 from atomate2.vasp.schemas.elph import ElectronPhononRenormalisationDoc
 from atomate2.vasp.sets.core import ElectronPhononSetGenerator
 
@@ -22,6 +23,7 @@ __all__ = [
     "SupercellElectronPhononDisplacedStructureMaker",
     "run_elph_displacements",
     "calculate_electron_phonon_renormalisation",
+    "store_band_edges",
 ]
 
 
@@ -125,11 +127,15 @@ def run_elph_displacements(
     prev_vasp_dir: str | Path | None = None,
     original_structure: Structure = None,
     supercell_structure: Structure = None,
+    warm_start_dir: str | Path | None = None,
 ):
     """
     Run electron phonon displaced structures.
 
-    Note, this job will replace itself with N displacement calculations.
+    Note, this job will replace itself with N displacement calculations. The
+    displacement calculations store a summary of the bands near the band edges (see
+    :obj:`.BandEdgeSummary`), available in the ``"band_edges"`` output, so the full
+    band structures do not need to be loaded to calculate the renormalisation.
 
     Parameters
     ----------
@@ -144,6 +150,17 @@ def run_elph_displacements(
     original_structure : Structure
         The original structure before supercell is made and before electron phonon
         displacements.
+    supercell_structure : Structure
+        The undisplaced supercell structure.
+    warm_start_dir : str or Path or None
+        The directory of a calculation on the undisplaced supercell (e.g., the bulk
+        supercell static calculation). If set, this is used as the previous VASP
+        directory and the first calculation for each temperature starts from its
+        charge density or wavefunction (see :obj:`.apply_warm_start`). All displaced
+        structures have the same lattice and species as the supercell, so this
+        typically saves SCF steps. The number of SCF steps saved and the elapsed time
+        of each calculation are available in the ``"warm_starts"`` and
+        ``"elapsed_times"`` outputs.
     """
     if len(temperatures) != len(structures):
         raise ValueError(
@@ -155,15 +172,29 @@ def run_elph_displacements(
     outputs: dict[str, list] = {
         "temperatures": [],
         "band_structures": [],
+        "band_edges": [],
         "structures": [],
         "uuids": [],
         "dirs": [],
+        "warm_starts": [],
+        "elapsed_times": [],
     }
+    if warm_start_dir is not None:
+        prev_vasp_dir = warm_start_dir
+
     for temp, structure in zip(temperatures, structures):
         # create the job
         elph_job = vasp_maker.make(structure, prev_vasp_dir=prev_vasp_dir)
         elph_job.append_name(f" T={temp}")
 
+        # only the first calculation starts from the undisplaced supercell, later
+        # calculations (e.g., non-self-consistent) follow from the first
+        first_job = elph_job
+        while isinstance(first_job, Flow):
+            first_job = first_job.jobs[0]
+        if warm_start_dir is not None:
+            first_job.update_maker_kwargs({"_set": {"warm_start": True}}, dict_mod=True)
+
         # write details of the electron phonon temperature and structure elph_info.json
         # file. this file will automatically get added to the task document and allow
         # the elph builder to reconstruct the elph document. note the ":" is
@@ -176,15 +207,28 @@ def run_elph_displacements(
         elph_job.update_maker_kwargs(
             {"_set": {"write_additional_data->elph_info:json": info}}, dict_mod=True
         )
+        store_band_edges(elph_job)
 
         jobs.append(elph_job)
 
         # extract the outputs we want
         outputs["temperatures"].append(temp)
         outputs["band_structures"].append(elph_job.output.vasp_objects["bandstructure"])
+        band_edges = elph_job.output.calcs_reversed[0].output.band_edges
+        outputs["band_edges"].append(band_edges)
         outputs["structures"].append(elph_job.output.structure)
         outputs["dirs"].append(elph_job.output.dir_name)
         outputs["uuids"].append(elph_job.output.uuid)
+        outputs["warm_starts"].append(first_job.output.warm_start)
+        jobs_iter = elph_job.iterflow() if isinstance(elph_job, Flow) else [(elph_job,)]
+        vasp_jobs = [
+            j[0]
+            for j in jobs_iter
+            if isinstance(getattr(j[0].function, "__self__", None), BaseVaspMaker)
+        ]
+        outputs["elapsed_times"].append(
+            [j.output.run_stats["overall"].elapsed_time for j in vasp_jobs]
+        )
 
     disp_flow = Flow(jobs, outputs)
     return Response(replace=disp_flow)
@@ -193,11 +237,11 @@ def run_elph_displacements(
 @job(output_schema=ElectronPhononRenormalisationDoc)
 def calculate_electron_phonon_renormalisation(
     temperatures: list[float],
-    displacement_band_structures: list[BandStructure],
+    displacement_band_edges: list[BandEdgeSummary | BandStructure],
     displacement_structures: list[Structure],
     displacement_uuids: list[str],
     displacement_dirs: list[str],
-    bulk_band_structure: BandStructure,
+    bulk_band_edges: BandEdgeSummary | BandStructure,
     bulk_structure: Structure,
     bulk_uuid: str,
     bulk_dir: str,
@@ -212,8 +256,9 @@ def calculate_electron_phonon_renormalisation(
     ----------
     temperatures : list of float
         The temperatures at which electron phonon properties were calculated.
-    displacement_band_structures : list of BandStructure
-        The electron-phonon displaced band structures.
+    displacement_band_edges : list of BandEdgeSummary or BandStructure
+        The band edges of the electron-phonon displaced structures. Band structures
+        will be converted to band edge summaries.
     displacement_structures : list of Structure
         The electron-phonon displaced structures.
     displacement_uuids : list of str
@@ -221,8 +266,8 @@ def calculate_electron_phonon_renormalisation(
     displacement_dirs : list of str
         The calculation directories of the electron-phonon displaced band structure
         calculations.
-    bulk_band_structure : BandStructure
-        The band structure of the bulk undisplaced supercell calculation.
+    bulk_band_edges : BandEdgeSummary or BandStructure
+        The band edges of the bulk undisplaced supercell calculation.
     bulk_structure : Structure
         The structure of the bulk undisplaced supercell.
     bulk_uuid : str
@@ -238,29 +283,29 @@ def calculate_electron_phonon_renormalisation(
         The original primitive structure for which electron-phonon calculations
         were performed.
     """
-    if bulk_structure is None:
+    if bulk_structure is None or bulk_band_edges is None:
         raise ValueError(
             "Bulk (undisplaced) supercell band structure calculation failed. Cannot "
             "calculate electron-phonon renormalisation."
         )
 
-    # filter band structures that are None (i.e., the displacement calculation failed)
-    keep = [i for i, b in enumerate(displacement_band_structures) if b is not None]
+    # filter band edges that are None (i.e., the displacement calculation failed)
+    keep = [i for i, b in enumerate(displacement_band_edges) if b is not None]
     temperatures = [temperatures[i] for i in keep]
-    displacement_band_structures = [displacement_band_structures[i] for i in keep]
+    displacement_band_edges = [displacement_band_edges[i] for i in keep]
     displacement_structures = [displacement_structures[i] for i in keep]
     displacement_uuids = [displacement_uuids[i] for i in keep]
     displacement_dirs = [displacement_dirs[i] for i in keep]
 
     logger.info("Calculating electron-phonon renormalisation")
 
-    return ElectronPhononRenormalisationDoc.from_band_structures(
+    return ElectronPhononRenormalisationDoc.from_band_edges(
         temperatures,
-        displacement_band_structures,
+        [_get_band_edges(b) for b in displacement_band_edges],
         displacement_structures,
         displacement_uuids,
         displacement_dirs,
-        bulk_band_structure,
+        _get_band_edges(bulk_band_edges),
         bulk_structure,
         bulk_uuid,
         bulk_dir,
@@ -268,3 +313,32 @@ def calculate_electron_phonon_renormalisation(
         elph_dir,
         original_structure,
     )
+
+
+def store_band_edges(flow: Job | Flow) -> Job | Flow:
+    """
+    Store the band edge summary in the task documents of VASP jobs.
+
+    Parameters
+    ----------
+    flow : Job or Flow
+        A job or flow containing VASP jobs.
+
+    Returns
+    -------
+    Job or Flow
+        The job or flow with the band edge summary enabled (modified in place).
+    """
+    flow.update_maker_kwargs(
+        {"_set": {"task_document_kwargs->store_band_edges": True}},
+        dict_mod=True,
+        class_filter=BaseVaspMaker,
+    )
+    return flow
+
+
+def _get_band_edges(band_edges: BandEdgeSummary | BandStructure) -> BandEdgeSummary:
+    """Convert band structures to band edge summaries."""
+    if isinstance(band_edges, BandStructure):
+        return BandEdgeSummary.from_band_structure(band_edges)
+    return band_edges
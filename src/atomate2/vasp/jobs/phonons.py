@@ -7,16 +7,14 @@ from dataclasses import dataclass, field
 
 import numpy as np
 from jobflow import Flow, Response, job
-from phonopy import Phonopy
-from phonopy.units import VaspToTHz
 from pymatgen.core import Structure
-from pymatgen.io.phonopy import get_phonopy_structure, get_pmg_structure
 from pymatgen.phonon.bandstructure import PhononBandStructureSymmLine
 from pymatgen.phonon.dos import PhononDos
 from pymatgen.transformations.advanced_transformations import (
     CubicSupercellTransformation,
 )
 
+from atomate2.common.jobs import get_output_collector
 from atomate2.common.schemas.math import Matrix3D
 from atomate2.vasp.jobs.base import BaseVaspMaker
 from atomate2.vasp.schemas.phonons import PhononBSDOSDoc
@@ -157,6 +155,10 @@ def generate_phonon_displacements(
     code:
         code to perform the computations
     """
+    from phonopy import Phonopy
+    from phonopy.units import VaspToTHz
+    from pymatgen.io.phonopy import get_phonopy_structure, get_pmg_structure
+
     cell = get_phonopy_structure(structure)
     if code == "vasp":
         factor = VaspToTHz
@@ -266,7 +268,8 @@ def run_phonon_displacements(
     """
     Run phonon displacements.
 
-    Note, this job will replace itself with N displacement calculations.
+    Note, this job will replace itself with N displacement calculations and a job that
+    collects their outputs.
 
     Parameters
     ----------
@@ -310,7 +313,11 @@ def run_phonon_displacements(
         outputs["forces"].append(phonon_job.output.output.forces)
         outputs["displaced_structures"].append(displacement)
 
-    displacement_flow = Flow(phonon_jobs, outputs)
+    # collect the outputs of all displacements with a single store query
+    collector = get_output_collector(outputs)
+    collector.name = "collect phonon displacements"
+
+    displacement_flow = Flow([*phonon_jobs, collector], collector.output)
     return Response(replace=displacement_flow)
 
 
@@ -0,0 +1,305 @@
+"""Live monitoring of running VASP calculations."""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["FileTail", "IONIC_REGEX", "SCF_REGEX", "VaspMonitor", "to_float"]
+
+SCF_REGEX = re.compile(r"^\s*(\w+):\s+(\d+)\s+(\S+)\s+(\S+)")
+IONIC_REGEX = re.compile(r"^\s*(\d+)\s.*F=\s*(\S+)\s+E0=\s*(\S+)")
+_MAG_REGEX = re.compile(r"mag=\s*(\S+)")
+_LOOP_REGEX = re.compile(r"(LOOP\+?):\s+cpu time\s+(\S+):\s+real time\s+(\S+)")
+_MEMORY_REGEX = re.compile(r"total amount of memory used by VASP MPI-rank0\s+(\S+)")
+
+
+class FileTail:
+    """
+    Incrementally read the complete lines appended to a file.
+
+    The position of the last complete line read is stored so that each call only
+    reads new data. If the file is truncated or replaced (e.g., when custodian restarts
+    VASP), reading starts again from the beginning of the file and ``nresets`` is
+    incremented.
+
+    Parameters
+    ----------
+    filename
+        The file to read.
+    """
+
+    def __init__(self, filename: str | Path):
+        self.filename = Path(filename)
+        self.offset = 0
+        self.nresets = 0
+        self._inode: int | None = None
+
+    def read_lines(self) -> list[str]:
+        """
+        Read any new complete lines from the file.
+
+        Returns
+        -------
+        list of str
+            The new lines, or an empty list if the file does not exist.
+        """
+        try:
+            stat = os.stat(self.filename)
+        except FileNotFoundError:
+            return []
+
+        if stat.st_ino != self._inode or stat.st_size < self.offset:
+            if self._inode is not None:
+                self.nresets += 1
+            self._inode = stat.st_ino
+            self.offset = 0
+
+        if stat.st_size == self.offset:
+            return []
+
+        with open(self.filename, "rb") as f:
+            f.seek(self.offset)
+            data = f.read(stat.st_size - self.offset)
+
+        # only process complete lines; the remainder will be read next time
+        end = data.rfind(b"\n") + 1
+        self.offset += end
+        return data[:end].decode(errors="replace").splitlines()
+
+
+class VaspMonitor:
+    """
+    Monitor a running VASP calculation in a background thread.
+
+    The OSZICAR and OUTCAR files are tailed incrementally and a JSON record is written
+    to a JSON Lines file for each electronic (SCF) step, each ionic step, the timing of
+    each step and the memory usage. The record types are:
+
+    - ``"scf"``: algorithm, step number, energy and energy change from the OSZICAR.
+    - ``"ionic"``: ionic step number, free energy, E0 and magnetisation from the
+      OSZICAR, and the number of SCF steps taken.
+    - ``"scf_timing"`` and ``"ionic_timing"``: CPU and real time of each step from the
+      LOOP and LOOP+ lines in the OUTCAR.
+    - ``"memory"``: memory used by MPI rank 0 in kB from the OUTCAR.
+
+    Every record includes the wall-clock ``timestamp`` at which it was read.
+    Optionally, the latest values can be written to a Prometheus text exposition file
+    (e.g., for the node exporter textfile collector) or passed to a callback.
+
+    The monitor can be used as a context manager:
+
+    .. code-block:: python
+
+        with VaspMonitor():
+            subprocess.call(vasp_cmd, shell=True)
+
+    Parameters
+    ----------
+    directory
+        The directory in which VASP is running.
+    output_file
+        The JSON Lines file to write records to, relative to ``directory``.
+    interval
+        The time between checks of the output files in seconds.
+    prometheus_file
+        A file to write the latest metrics to in the Prometheus text format.
+    callback
+        A function called with each record.
+    """
+
+    def __init__(
+        self,
+        directory: str | Path = ".",
+        output_file: str = "vasp_monitor.jsonl",
+        interval: float = 5.0,
+        prometheus_file: str | Path | None = None,
+        callback: Callable[[dict[str, Any]], None] | None = None,
+    ):
+        self.directory = Path(directory)
+        self.output_file = self.directory / output_file
+        self.interval = interval
+        self.prometheus_file = prometheus_file
+        self.callback = callback
+
+        self._oszicar = FileTail(self.directory / "OSZICAR")
+        self._outcar = FileTail(self.directory / "OUTCAR")
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._start_time = time.time()
+        self._metrics: dict[str, float] = {
+            "ionic_steps": 0,
+            "scf_steps_total": 0,
+            "scf_steps_current": 0,
+        }
+
+    def start(self):
+        """Start monitoring in a background thread."""
+        # allow the monitor to be restarted after it has been stopped
+        self._stop.clear()
+        self._start_time = time.time()
+        self._thread = threading.Thread(
+            target=self._run, name="vasp-monitor", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Stop monitoring, after reading any remaining output."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> VaspMonitor:
+        """Start monitoring."""
+        self.start()
+        return self
+
+    def __exit__(self, *args):
+        """Stop monitoring."""
+        self.stop()
+
+    def poll(self) -> list[dict[str, Any]]:
+        """
+        Read new output and record the metrics.
+
+        Returns
+        -------
+        list of dict
+            The new records.
+        """
+        records = self._parse_oszicar() + self._parse_outcar()
+        if len(records) == 0:
+            return records
+
+        with open(self.output_file, "a") as f:
+            for record in records:
+                f.write(json.dumps(record) + "\n")
+
+        if self.callback is not None:
+            for record in records:
+                self.callback(record)
+
+        if self.prometheus_file is not None:
+            self._write_prometheus()
+        return records
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            self._safe_poll()
+        self._safe_poll()
+
+    def _safe_poll(self):
+        # monitoring must never interrupt the calculation
+        try:
+            self.poll()
+        except Exception as e:
+            logger.warning(f"Error monitoring VASP: {e}")
+
+    def _parse_oszicar(self) -> list[dict[str, Any]]:
+        records = []
+        now = time.time()
+        for line in self._oszicar.read_lines():
+            ionic_match = IONIC_REGEX.match(line)
+            if ionic_match:
+                mag_match = _MAG_REGEX.search(line)
+                records.append(
+                    {
+                        "type": "ionic",
+                        "timestamp": now,
+                        "step": int(ionic_match.group(1)),
+                        "energy": to_float(ionic_match.group(2)),
+                        "e0": to_float(ionic_match.group(3)),
+                        "mag": to_float(mag_match.group(1)) if mag_match else None,
+                        "scf_steps": int(self._metrics["scf_steps_current"]),
+                    }
+                )
+                self._metrics["ionic_steps"] = int(ionic_match.group(1))
+                self._metrics["energy"] = records[-1]["energy"]
+                self._metrics["scf_steps_current"] = 0
+                continue
+
+            scf_match = SCF_REGEX.match(line)
+            if scf_match:
+                records.append(
+                    {
+                        "type": "scf",
+                        "timestamp": now,
+                        "algo": scf_match.group(1),
+                        "step": int(scf_match.group(2)),
+                        "energy": to_float(scf_match.group(3)),
+                        "de": to_float(scf_match.group(4)),
+                    }
+                )
+                self._metrics["scf_steps_total"] += 1
+                self._metrics["scf_steps_current"] = int(scf_match.group(2))
+                self._metrics["scf_de"] = records[-1]["de"]
+        return records
+
+    def _parse_outcar(self) -> list[dict[str, Any]]:
+        records = []
+        now = time.time()
+        for line in self._outcar.read_lines():
+            if "LOOP" in line:
+                match = _LOOP_REGEX.search(line)
+                if match:
+                    step_type = "ionic" if match.group(1) == "LOOP+" else "scf"
+                    records.append(
+                        {
+                            "type": f"{step_type}_timing",
+                            "timestamp": now,
+                            "cpu_time": to_float(match.group(2)),
+                            "real_time": to_float(match.group(3)),
+                        }
+                    )
+                    self._metrics[f"{step_type}_real_time"] = records[-1]["real_time"]
+            elif "memory used by VASP" in line:
+                match = _MEMORY_REGEX.search(line)
+                if match:
+                    memory = to_float(match.group(1).rstrip("."))
+                    records.append({"type": "memory", "timestamp": now, "kb": memory})
+                    self._metrics["memory_kb"] = memory
+        return records
+
+    def _write_prometheus(self):
+        lines = []
+        for name, value in self._metrics.items():
+            if value is not None:
+                lines.append(f"vasp_{name} {value}")
+        lines.append(f"vasp_monitor_elapsed_seconds {time.time() - self._start_time}")
+        lines.append(f"vasp_monitor_last_update_timestamp_seconds {time.time()}")
+
+        # write atomically so the file is never read while partially written
+        path = Path(self.prometheus_file)
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        tmp_path.write_text("\n".join(lines) + "\n")
+        os.replace(tmp_path, path)
+
+
+def to_float(value: str) -> float | None:
+    """
+    Convert a value from a VASP output file to a float.
+
+    Parameters
+    ----------
+    value
+        The value to convert.
+
+    Returns
+    -------
+    float or None
+        The value, or None if it cannot be converted.
+    """
+    try:
+        return float(value)
+    except ValueError:
+        # e.g., overflowing values written as *********
+        return None
@@ -0,0 +1,201 @@
+"""Process-wide in-memory registry of VASP POTCARs."""
+
+from __future__ import annotations
+
+import logging
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Sequence
+
+from monty.io import zopen
+from pymatgen.io.vasp import Potcar, PotcarSingle
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["PotcarInfo", "PotcarRegistry", "POTCAR_REGISTRY"]
+
+
+@dataclass(frozen=True)
+class PotcarInfo:
+    """
+    Summary of a single POTCAR.
+
+    Parameters
+    ----------
+    symbol
+        The POTCAR symbol, e.g. "Fe_pv".
+    element
+        The element the POTCAR is for.
+    nelectrons
+        The number of valence electrons.
+    hash
+        The md5 hash of the POTCAR, as given by ``PotcarSingle.get_potcar_hash``.
+    functionals
+        The functionals pymatgen identifies the POTCAR as belonging to.
+    """
+
+    symbol: str
+    element: str
+    nelectrons: float
+    hash: str
+    functionals: tuple[str, ...]
+
+
+class PotcarRegistry:
+    """
+    In-memory registry of POTCARs keyed by ``(functional, symbol)``.
+
+    POTCARs are only read from disk the first time they are requested. The
+    :obj:`PotcarSingle` objects are shared between all callers and must be treated as
+    read-only; callers needing to modify one should copy it first (copy-on-write).
+    The number of electrons, hash and identified functionals of each POTCAR are
+    computed once on load.
+    """
+
+    def __init__(self):
+        self._singles: dict[tuple[str, str], PotcarSingle] = {}
+        self._info: dict[tuple[str, str], PotcarInfo] = {}
+        self._data_to_single: dict[str, PotcarSingle] = {}
+        self._hashes: dict[str, str] = {}
+        self._lock = threading.RLock()
+
+    def get_single(self, symbol: str, functional: str) -> PotcarSingle:
+        """
+        Get a (shared, read-only) POTCAR for a symbol and functional.
+
+        Parameters
+        ----------
+        symbol
+            The POTCAR symbol.
+        functional
+            The POTCAR functional, e.g. "PBE_54".
+
+        Returns
+        -------
+        PotcarSingle
+            The POTCAR.
+        """
+        key = (functional, symbol)
+        if key not in self._singles:
+            with self._lock:
+                if key not in self._singles:
+                    logger.debug(f"Loading {functional} POTCAR for {symbol}")
+                    psingle = PotcarSingle.from_symbol_and_functional(
+                        symbol, functional
+                    )
+                    self._data_to_single.setdefault(psingle.data, psingle)
+                    self._info[key] = PotcarInfo(
+                        symbol=psingle.symbol,
+                        element=psingle.element,
+                        nelectrons=psingle.nelectrons,
+                        hash=self.get_hash(psingle),
+                        functionals=tuple(psingle.identify_potcar(mode="data")[0]),
+                    )
+                    self._singles[key] = psingle
+        return self._singles[key]
+
+    def get_info(self, symbol: str, functional: str) -> PotcarInfo:
+        """
+        Get the precomputed summary of a POTCAR.
+
+        Parameters
+        ----------
+        symbol
+            The POTCAR symbol.
+        functional
+            The POTCAR functional, e.g. "PBE_54".
+
+        Returns
+        -------
+        PotcarInfo
+            The number of electrons, hash and identified functionals of the POTCAR.
+        """
+        self.get_single(symbol, functional)
+        return self._info[(functional, symbol)]
+
+    def get_potcar(self, symbols: Sequence[str], functional: str) -> Potcar:
+        """
+        Get a Potcar for a list of symbols.
+
+        The returned :obj:`Potcar` is a new object, but the POTCARs it contains are
+        shared with the registry.
+
+        Parameters
+        ----------
+        symbols
+            The POTCAR symbols.
+        functional
+            The POTCAR functional, e.g. "PBE_54".
+
+        Returns
+        -------
+        Potcar
+            The POTCAR.
+        """
+        potcar = Potcar(functional=functional)
+        potcar.extend(self.get_single(symbol, functional) for symbol in symbols)
+        return potcar
+
+    def get_hash(self, potcar_single: PotcarSingle) -> str:
+        """
+        Get the md5 hash of a POTCAR, caching the result on the POTCAR data.
+
+        Parameters
+        ----------
+        potcar_single
+            A POTCAR.
+
+        Returns
+        -------
+        str
+            The hash as given by ``PotcarSingle.get_potcar_hash``.
+        """
+        data = potcar_single.data
+        if data not in self._hashes:
+            self._hashes[data] = potcar_single.get_potcar_hash()
+        return self._hashes[data]
+
+    def from_file(self, filename: str | Path) -> Potcar:
+        """
+        Read a POTCAR file, reusing any POTCARs already held in the registry.
+
+        Parameters
+        ----------
+        filename
+            The POTCAR file, optionally compressed.
+
+        Returns
+        -------
+        Potcar
+            The POTCAR.
+        """
+        with zopen(filename, "rt") as f:
+            file_data = f.read()
+
+        potcar = Potcar()
+        for psingle_str in file_data.split("End of Dataset"):
+            psingle_str = psingle_str.strip()
+            if not psingle_str:
+                continue
+
+            data = psingle_str + "\nEnd of Dataset\n"
+            if data not in self._data_to_single:
+                with self._lock:
+                    self._data_to_single.setdefault(data, PotcarSingle(data))
+            potcar.append(self._data_to_single[data])
+
+        if len(potcar) > 0:
+            potcar.functional = potcar[0].functional
+        return potcar
+
+    def clear(self):
+        """Remove all POTCARs from the registry."""
+        with self._lock:
+            self._singles.clear()
+            self._info.clear()
+            self._data_to_single.clear()
+            self._hashes.clear()
+
+
+POTCAR_REGISTRY = PotcarRegistry()
@@ -2,13 +2,18 @@
 
 from __future__ import annotations
 
+import logging
 from copy import deepcopy
 from typing import Any
 
 from jobflow import Flow, Job, Maker
+from pymatgen.core import Structure
 from pymatgen.io.vasp import Kpoints
 
 from atomate2.vasp.jobs.base import BaseVaspMaker
+from atomate2.vasp.resources import ResourceModel
+
+logger = logging.getLogger(__name__)
 
 
 def update_user_incar_settings(
@@ -285,3 +290,77 @@ def use_auto_ispin(
             dict_mod=True,
         )
     return updated_flow
+
+
+def add_resource_hints(
+    flow: Job | Flow,
+    model: ResourceModel,
+    cores: int | None = None,
+    nstd: float = 1.0,
+    name_filter: str | None = None,
+    class_filter: type[Maker] | None = BaseVaspMaker,
+) -> Job | Flow:
+    """
+    Add predicted run time and memory to the metadata of VASP jobs in a flow.
+
+    The predictions are stored in ``job.metadata["resource_hints"]`` as a dict with the
+    keys "elapsed_time" (seconds), "max_memory" (kb per process) and "cores", and can
+    be used by workflow managers to size allocations. Predictions can only be made for
+    jobs whose input structure is known when the flow is created, i.e., not an output
+    reference to another job; other jobs are left unchanged.
+
+    Note, this returns a copy of the original Job/Flow. I.e., the update does not
+    happen in place.
+
+    Parameters
+    ----------
+    flow : .Job or .Flow
+        A job or flow.
+    model : .ResourceModel
+        A fitted resource model.
+    cores : int or None
+        The number of cores the jobs will run on. If None, this will be determined
+        using :obj:`.get_available_cores`.
+    nstd : float
+        The number of standard deviations of the fitting residuals to add to the
+        predictions.
+    name_filter : str or None
+        A filter for the name of the jobs.
+    class_filter : Maker or None
+        A filter for the VaspMaker class used to generate the flows. Note the class
+        filter will match any subclasses.
+
+    Returns
+    -------
+    Job or Flow
+        A copy of the input flow/job with resource hints added to the job metadata.
+    """
+    updated_flow = deepcopy(flow)
+    if isinstance(updated_flow, Job):
+        jobs = [updated_flow]
+    else:
+        jobs = [job for job, _ in updated_flow.iterflow()]
+
+    for job in jobs:
+        maker = getattr(job.function, "__self__", None)
+        if class_filter is not None and not isinstance(maker, class_filter):
+            continue
+        if name_filter is not None and name_filter not in job.name:
+            continue
+
+        args = job.function_args
+        structure = args[0] if args else job.function_kwargs.get("structure")
+        if not isinstance(structure, Structure):
+            continue
+
+        generator = maker.input_set_generator
+        try:
+            input_set = generator.get_input_set(structure, potcar_spec=True)
+            nelect = generator.get_nelect(structure)
+            prediction = model.predict(input_set, cores=cores, nelect=nelect, nstd=nstd)
+        except Exception as e:
+            logger.warning(f"Could not predict resources for {job.name}: {e}")
+            continue
+
+        job.metadata["resource_hints"] = prediction
+    return updated_flow
@@ -0,0 +1,516 @@
+"""Estimate the resources needed by VASP calculations and choose parallelisation."""
+
+from __future__ import annotations
+
+import logging
+import math
+import os
+import re
+import shlex
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Sequence
+
+import numpy as np
+from monty.serialization import dumpfn
+from pydantic import BaseModel, Field
+from pymatgen.io.vasp import Kpoints, Potcar
+from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
+
+from atomate2.vasp.schemas.calc_types import run_type
+from atomate2.vasp.schemas.calculation import ResourceEstimate
+from atomate2.vasp.sets.base import VaspInputSet
+
+if TYPE_CHECKING:
+    from jobflow import JobStore
+
+__all__ = [
+    "RESOURCE_ESTIMATE_FILENAME",
+    "estimate_resources",
+    "get_available_cores",
+    "apply_resource_estimate",
+    "ResourceModel",
+]
+
+logger = logging.getLogger(__name__)
+
+RESOURCE_ESTIMATE_FILENAME = "resource_estimate.json"
+
+# hbar^2 / 2m_e in eV A^2, used to convert ENCUT to a plane-wave cutoff
+_HBAR2_2M = 3.80998212
+
+# rough prefactors used in the memory and runtime models; these are intended to be
+# calibrated against the RunStatistics recorded alongside each estimate
+_BASE_MEMORY_KB = 300_000
+_RUNTIME_PREFACTOR = 2e-9
+_HYBRID_RUNTIME_FACTOR = 50
+_SCF_STEPS = 20
+_MAX_IONIC_STEPS = 30
+
+
+def estimate_resources(
+    input_set: VaspInputSet,
+    cores: int | None = None,
+    nelect: float | None = None,
+    min_cores_per_kgroup: int = 4,
+) -> ResourceEstimate:
+    """
+    Estimate the resources for a VASP calculation and choose KPAR and NCORE.
+
+    The number of bands is estimated from the number of electrons using the VASP
+    default, the number of irreducible k-points from the k-point mesh and symmetry,
+    and the FFT grid from ENCUT and the lattice. KPAR is the largest divisor of the
+    number of cores not exceeding the number of k-points, such that each k-point group
+    has at least ``min_cores_per_kgroup`` cores. NCORE is the divisor of the number of
+    cores per k-point group closest to its square root.
+
+    Parameters
+    ----------
+    input_set
+        A VASP input set.
+    cores
+        The number of cores available to VASP. If None, this will be determined using
+        :obj:`get_available_cores`.
+    nelect
+        The number of electrons. Required if the input set uses a POTCAR.spec.
+    min_cores_per_kgroup
+        The minimum number of cores in each k-point group.
+
+    Returns
+    -------
+    ResourceEstimate
+        The estimated resources and parallelisation settings.
+    """
+    cores = get_available_cores() if cores is None else cores
+    incar = input_set.incar
+    structure = input_set.poscar.structure
+
+    if nelect is None:
+        nelect = _get_nelect(input_set)
+
+    ispin = incar.get("ISPIN", 1)
+    noncollinear = incar.get("LNONCOLLINEAR", False) or incar.get("LSORBIT", False)
+    hybrid = incar.get("LHFCALC", False)
+    nkpoints = _get_nkpoints(input_set)
+
+    kpar = _choose_kpar(cores, nkpoints, min_cores_per_kgroup)
+    cores_per_kgroup = cores // kpar
+    ncore = 1 if hybrid else _choose_ncore(cores_per_kgroup)
+
+    nbands = incar.get("NBANDS")
+    if nbands is None:
+        nbands = max(
+            math.ceil((nelect + 2) / 2) + max(len(structure) // 2, 3),
+            math.ceil(0.6 * nelect),
+        )
+        if noncollinear:
+            nbands *= 2
+        # VASP rounds the number of bands up to a multiple of the band groups
+        nband_groups = cores_per_kgroup // ncore
+        nbands = math.ceil(nbands / nband_groups) * nband_groups
+
+    encut = incar.get("ENCUT", 520)
+    gcut = math.sqrt(encut / _HBAR2_2M)
+    grid_factor = 2 if incar.get("PREC", "Normal").lower()[0] == "a" else 1.5
+    fft_grid = [
+        _next_fft_size(math.ceil(grid_factor * 2 * gcut * length / (2 * np.pi)))
+        for length in structure.lattice.abc
+    ]
+    nplane_waves = math.ceil(structure.volume * gcut**3 / (6 * np.pi**2))
+    nspinors = 2 if noncollinear else 1
+    nspins = 1 if noncollinear else ispin
+
+    # memory per process: wavefunctions (plus two work copies) in double complex
+    # precision distributed over all cores, subspace matrices distributed over each
+    # k-point group, and the FFT work arrays
+    nwave = nbands * nplane_waves * nspinors * nkpoints * nspins
+    memory_kb = (
+        _BASE_MEMORY_KB
+        + 3 * 16 * nwave / 1024 / cores
+        + 3 * 16 * nbands**2 / 1024 / cores_per_kgroup
+        + 20 * 16 * np.prod(fft_grid) / 1024 / ncore
+    )
+
+    # cost of each SCF step is dominated by FFTs and orthogonalisation
+    fft_cost = np.prod(fft_grid) * math.log2(max(np.prod(fft_grid), 2))
+    cost = nkpoints * nspins * nspinors * nbands * (fft_cost + nbands * nplane_waves)
+    if hybrid:
+        cost *= _HYBRID_RUNTIME_FACTOR * nkpoints
+    nionic = min(max(incar.get("NSW", 0), 1), _MAX_IONIC_STEPS)
+    elapsed_time = _RUNTIME_PREFACTOR * cost * _SCF_STEPS * nionic / cores
+
+    return ResourceEstimate(
+        cores=cores,
+        kpar=kpar,
+        ncore=ncore,
+        nelect=nelect,
+        nbands=nbands,
+        nkpoints=nkpoints,
+        fft_grid=fft_grid,
+        nplane_waves=nplane_waves,
+        max_memory=float(memory_kb),
+        elapsed_time=float(elapsed_time),
+    )
+
+
+def apply_resource_estimate(
+    input_set: VaspInputSet,
+    estimate: ResourceEstimate,
+    directory: str | Path = ".",
+) -> VaspInputSet:
+    """
+    Apply the parallelisation settings of an estimate and record the estimate.
+
+    KPAR and NCORE are only set if none of KPAR, NCORE or NPAR are already in the INCAR.
+    The estimate is written to a resource_estimate.json file which is parsed into the
+    ``resource_estimate`` field of the task document.
+
+    Parameters
+    ----------
+    input_set
+        A VASP input set. The INCAR is updated in place.
+    estimate
+        The resource estimate.
+    directory
+        The directory to write the resource estimate to.
+
+    Returns
+    -------
+    VaspInputSet
+        The updated input set.
+    """
+    if not any(k in input_set.incar for k in ("KPAR", "NCORE", "NPAR")):
+        input_set.incar.update({"KPAR": estimate.kpar, "NCORE": estimate.ncore})
+
+    logger.info(
+        f"Using KPAR = {estimate.kpar} and NCORE = {estimate.ncore} on "
+        f"{estimate.cores} cores; estimated memory {estimate.max_memory / 1e6:.1f} GB "
+        f"and run time {estimate.elapsed_time / 3600:.2f} h"
+    )
+    dumpfn(estimate.dict(), Path(directory) / RESOURCE_ESTIMATE_FILENAME)
+    return input_set
+
+
+def get_available_cores(vasp_cmd: str | None = None) -> int:
+    """
+    Get the number of cores available to VASP.
+
+    The number of cores is taken from the ``-n``/``-np`` option of the VASP command,
+    then the SLURM, PBS and SGE environment variables, and finally the number of CPUs
+    on the machine.
+
+    Parameters
+    ----------
+    vasp_cmd
+        The command used to run VASP. Defaults to the ``VASP_CMD`` setting.
+
+    Returns
+    -------
+    int
+        The number of cores.
+    """
+    if vasp_cmd is None:
+        from atomate2 import SETTINGS
+
+        vasp_cmd = SETTINGS.VASP_CMD
+
+    args = shlex.split(os.path.expandvars(vasp_cmd))
+    for i, arg in enumerate(args):
+        if (
+            arg in ("-n", "-np", "--ntasks")
+            and i + 1 < len(args)
+            and args[i + 1].isdigit()
+        ):
+            return int(args[i + 1])
+        match = re.match(r"--(?:ntasks|np)=(\d+)$", arg)
+        if match:
+            return int(match.group(1))
+
+    for env in ("SLURM_NTASKS", "PBS_NP", "NSLOTS"):
+        if os.environ.get(env, "").isdigit():
+            return int(os.environ[env])
+
+    return os.cpu_count() or 1
+
+
+class ResourceModel(BaseModel):
+    """
+    Regression model for the run time and memory of VASP calculations.
+
+    The logarithm of the elapsed time and maximum memory are fit as linear functions
+    of the logarithm of the number of atoms, k-points, ENCUT, bands and cores, whether
+    the calculation is spin polarised or uses a hybrid functional, and the run type.
+    The model is fit using ridge regression on the ``run_stats`` of historical task
+    documents.
+    """
+
+    run_types: Sequence[str] = Field(
+        [], description="The run types seen when fitting the model"
+    )
+    time_coefficients: Sequence[float] = Field(
+        None, description="Coefficients for the logarithm of the elapsed time"
+    )
+    memory_coefficients: Sequence[float] = Field(
+        None, description="Coefficients for the logarithm of the maximum memory"
+    )
+    time_std: float = Field(
+        0, description="Standard deviation of the log elapsed time residuals"
+    )
+    memory_std: float = Field(
+        0, description="Standard deviation of the log maximum memory residuals"
+    )
+    nsamples: int = Field(0, description="The number of task documents used in fitting")
+
+    @classmethod
+    def from_task_documents(
+        cls, task_documents: Sequence[Any], regularization: float = 1e-3
+    ) -> ResourceModel:
+        """
+        Fit the model to task documents.
+
+        Parameters
+        ----------
+        task_documents
+            A list of task documents, as TaskDocument objects or dictionaries.
+            Documents without run statistics are skipped.
+        regularization
+            The ridge regularization parameter.
+
+        Returns
+        -------
+        ResourceModel
+            The fitted model.
+        """
+        samples = [_get_task_sample(doc) for doc in task_documents]
+        samples = [s for s in samples if s is not None]
+        if len(samples) == 0:
+            raise ValueError("No task documents with run statistics to fit.")
+
+        run_types = sorted({s["run_type"] for s in samples})
+        model = cls(run_types=run_types, nsamples=len(samples))
+        x = np.array([model._get_features(**s["features"]) for s in samples])
+
+        # don't regularize the intercept
+        penalty = regularization * np.eye(x.shape[1])
+        penalty[0, 0] = 0
+
+        for target in ("time", "memory"):
+            y = np.log([s[target] for s in samples])
+            coefficients = np.linalg.solve(x.T @ x + penalty, x.T @ y)
+            std = float(np.std(y - x @ coefficients))
+            setattr(model, f"{target}_coefficients", coefficients.tolist())
+            setattr(model, f"{target}_std", std)
+        return model
+
+    @classmethod
+    def from_store(
+        cls,
+        store: JobStore,
+        criteria: dict | None = None,
+        limit: int = 0,
+        regularization: float = 1e-3,
+    ) -> ResourceModel:
+        """
+        Fit the model to the VASP task documents in a job store.
+
+        Parameters
+        ----------
+        store
+            A job store containing the outputs of VASP jobs.
+        criteria
+            Additional query criteria used to select the jobs.
+        limit
+            The maximum number of task documents to use. 0 means no limit.
+        regularization
+            The ridge regularization parameter.
+
+        Returns
+        -------
+        ResourceModel
+            The fitted model.
+        """
+        query = {"output.run_stats.overall.elapsed_time": {"$gt": 0}}
+        query.update({} if criteria is None else criteria)
+        properties = [
+            "output.nsites",
+            "output.run_stats.overall",
+            "output.calcs_reversed.run_type",
+            "output.calcs_reversed.input.nkpoints",
+            "output.calcs_reversed.input.parameters",
+        ]
+        docs = store.query(query, properties=properties, limit=limit)
+        return cls.from_task_documents(
+            [doc["output"] for doc in docs], regularization=regularization
+        )
+
+    def predict(
+        self,
+        input_set: VaspInputSet,
+        cores: int | None = None,
+        nelect: float | None = None,
+        nstd: float = 1.0,
+    ) -> dict[str, float]:
+        """
+        Predict the run time and memory of a calculation.
+
+        Parameters
+        ----------
+        input_set
+            A VASP input set.
+        cores
+            The number of cores VASP will be run on. If None, this will be determined
+            using :obj:`get_available_cores`.
+        nelect
+            The number of electrons. Required if the input set uses a POTCAR.spec.
+        nstd
+            The number of standard deviations of the fitting residuals to add to the
+            predictions, to avoid underestimating the resources.
+
+        Returns
+        -------
+        dict
+            The predicted ``elapsed_time`` in seconds and ``max_memory`` per process in
+            kb, and the number of ``cores`` the prediction is for.
+        """
+        if self.time_coefficients is None:
+            raise ValueError("The model has not been fitted.")
+
+        estimate = estimate_resources(input_set, cores=cores, nelect=nelect)
+        incar = input_set.incar
+        features = self._get_features(
+            natoms=len(input_set.poscar.structure),
+            nkpoints=estimate.nkpoints,
+            encut=incar.get("ENCUT", 520),
+            nbands=estimate.nbands,
+            cores=estimate.cores,
+            ispin=incar.get("ISPIN", 1),
+            lhfcalc=incar.get("LHFCALC", False),
+            run_type=str(run_type(dict(incar))),
+        )
+        log_time = features @ self.time_coefficients + nstd * self.time_std
+        log_memory = features @ self.memory_coefficients + nstd * self.memory_std
+        return {
+            "elapsed_time": float(np.exp(log_time)),
+            "max_memory": float(np.exp(log_memory)),
+            "cores": estimate.cores,
+        }
+
+    def _get_features(
+        self,
+        natoms: int,
+        nkpoints: int,
+        encut: float,
+        nbands: int,
+        cores: int,
+        ispin: int,
+        lhfcalc: bool,
+        run_type: str,
+    ) -> np.ndarray:
+        """Get the feature vector for a calculation."""
+        numeric = [natoms, nkpoints, encut, nbands, cores]
+        run_type_features = [float(run_type == rt) for rt in self.run_types]
+        return np.array(
+            [
+                1.0,
+                *np.log(np.maximum(numeric, 1)),
+                ispin == 2,
+                bool(lhfcalc),
+                *run_type_features,
+            ],
+            dtype=float,
+        )
+
+
+def _get_task_sample(doc: Any) -> dict | None:
+    """Get the features and run statistics from a task document."""
+    if isinstance(doc, BaseModel):
+        doc = doc.dict()
+
+    stats = (doc.get("run_stats") or {}).get("overall")
+    if not stats or not doc.get("calcs_reversed"):
+        return None
+
+    stats = stats if isinstance(stats, dict) else dict(stats)
+    if min(stats["elapsed_time"], stats["max_memory"], stats["cores"]) <= 0:
+        return None
+
+    calc = doc["calcs_reversed"][0]
+    params = calc["input"]["parameters"]
+    return {
+        "run_type": str(calc["run_type"]),
+        "time": stats["elapsed_time"],
+        "memory": stats["max_memory"],
+        "features": {
+            "natoms": doc["nsites"],
+            "nkpoints": calc["input"]["nkpoints"],
+            "encut": params.get("ENCUT", 520),
+            "nbands": params.get("NBANDS", 1),
+            "cores": stats["cores"],
+            "ispin": params.get("ISPIN", 1),
+            "lhfcalc": params.get("LHFCALC", False),
+            "run_type": str(calc["run_type"]),
+        },
+    }
+
+
+def _get_nelect(input_set: VaspInputSet) -> float:
+    """Get the number of electrons from the POTCAR and NELECT of an input set."""
+    if "NELECT" in input_set.incar:
+        return input_set.incar["NELECT"]
+
+    if not isinstance(input_set.potcar, Potcar):
+        raise ValueError("nelect must be given when using a POTCAR.spec")
+
+    nelec = {p.element: p.nelectrons for p in input_set.potcar}
+    comp = input_set.poscar.structure.composition.element_composition
+    return sum(num_atoms * nelec[str(el)] for el, num_atoms in comp.items())
+
+
+def _get_nkpoints(input_set: VaspInputSet) -> int:
+    """Get the number of irreducible k-points of an input set."""
+    kpoints = input_set.kpoints
+    structure = input_set.poscar.structure
+
+    if kpoints is None:
+        # k-points generated by VASP using KSPACING
+        kspacing = input_set.incar.get("KSPACING", 0.5)
+        recip_lengths = structure.lattice.reciprocal_lattice.abc
+        mesh = [max(1, math.ceil(length / kspacing)) for length in recip_lengths]
+    elif kpoints.style in (
+        Kpoints.supported_modes.Gamma,
+        Kpoints.supported_modes.Monkhorst,
+    ):
+        mesh = kpoints.kpts[0]
+    else:
+        return max(kpoints.num_kpts, 1)
+
+    if input_set.incar.get("ISYM", 1) == -1:
+        return int(np.prod(mesh))
+
+    sga = SpacegroupAnalyzer(structure, symprec=input_set.incar.get("SYMPREC", 1e-5))
+    return len(sga.get_ir_reciprocal_mesh(mesh))
+
+
+def _choose_kpar(cores: int, nkpoints: int, min_cores_per_kgroup: int) -> int:
+    """Choose the largest valid KPAR."""
+    for kpar in range(min(cores, nkpoints), 0, -1):
+        if cores % kpar == 0 and cores // kpar >= min(min_cores_per_kgroup, cores):
+            return kpar
+    return 1
+
+
+def _choose_ncore(cores: int) -> int:
+    """Choose the divisor of the number of cores closest to its square root."""
+    divisors = [i for i in range(1, cores + 1) if cores % i == 0]
+    return min(divisors, key=lambda x: abs(x - math.sqrt(cores)))
+
+
+def _next_fft_size(n: int) -> int:
+    """Get the smallest integer >= n that only has factors of 2, 3, 5 and 7."""
+    while True:
+        m = n
+        for p in (2, 3, 5, 7):
+            while m % p == 0:
+                m //= p
+        if m == 1:
+            return n
+        n += 1
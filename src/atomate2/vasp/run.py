@@ -11,30 +11,17 @@ from __future__ import annotations
 import logging
 import shlex
 import subprocess
+from contextlib import AbstractContextManager, nullcontext
 from os.path import expandvars
-from typing import Any, Sequence
-
-from custodian import Custodian
-from custodian.custodian import ErrorHandler, Validator
-from custodian.vasp.handlers import (
-    FrozenJobErrorHandler,
-    IncorrectSmearingHandler,
-    LargeSigmaHandler,
-    MeshSymmetryErrorHandler,
-    NonConvergingErrorHandler,
-    PositiveEnergyErrorHandler,
-    PotimErrorHandler,
-    StdErrHandler,
-    UnconvergedErrorHandler,
-    VaspErrorHandler,
-    WalltimeHandler,
-)
-from custodian.vasp.jobs import VaspJob
-from custodian.vasp.validators import VaspFilesValidator, VasprunXMLValidator
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Sequence
+
 from jobflow.utils import ValueEnum
 
-from atomate2 import SETTINGS
-from atomate2.vasp.schemas.task import TaskDocument
+if TYPE_CHECKING:
+    from custodian.custodian import ErrorHandler, Validator
+
+    from atomate2.vasp.schemas.task import TaskDocument
 
 __all__ = [
     "JobType",
@@ -42,23 +29,58 @@ __all__ = [
     "should_stop_children",
 ]
 
-_DEFAULT_HANDLERS = (
-    VaspErrorHandler(),
-    MeshSymmetryErrorHandler(),
-    UnconvergedErrorHandler(),
-    NonConvergingErrorHandler(),
-    PotimErrorHandler(),
-    PositiveEnergyErrorHandler(),
-    FrozenJobErrorHandler(),
-    StdErrHandler(),
-    LargeSigmaHandler(),
-    IncorrectSmearingHandler(),
-)
-_DEFAULT_VALIDATORS = (VasprunXMLValidator(), VaspFilesValidator())
-
 logger = logging.getLogger(__name__)
 
 
+def _get_default_handlers(
+    convergence_trend: bool | None = None,
+) -> tuple[ErrorHandler, ...]:
+    """Get the default custodian error handlers; custodian is imported on demand."""
+    from custodian.vasp.handlers import (
+        FrozenJobErrorHandler,
+        IncorrectSmearingHandler,
+        LargeSigmaHandler,
+        MeshSymmetryErrorHandler,
+        NonConvergingErrorHandler,
+        PositiveEnergyErrorHandler,
+        PotimErrorHandler,
+        StdErrHandler,
+        UnconvergedErrorHandler,
+        VaspErrorHandler,
+    )
+
+    handlers = [
+        VaspErrorHandler(),
+        MeshSymmetryErrorHandler(),
+        UnconvergedErrorHandler(),
+        NonConvergingErrorHandler(),
+        PotimErrorHandler(),
+        PositiveEnergyErrorHandler(),
+        FrozenJobErrorHandler(),
+        StdErrHandler(),
+        LargeSigmaHandler(),
+        IncorrectSmearingHandler(),
+    ]
+
+    if convergence_trend is None:
+        from atomate2 import SETTINGS
+
+        convergence_trend = SETTINGS.VASP_CONVERGENCE_TREND_HANDLER
+
+    if convergence_trend:
+        from atomate2.vasp.handlers import ConvergenceTrendHandler
+
+        handlers.insert(4, ConvergenceTrendHandler())
+    return tuple(handlers)
+
+
+def _get_default_validators() -> tuple[Validator, ...]:
+    """Get the default custodian validators; custodian is imported on demand."""
+    from custodian.vasp.validators import VaspFilesValidator, VasprunXMLValidator
+
+    return VasprunXMLValidator(), VaspFilesValidator()
+
+
 class JobType(ValueEnum):
     """
     Type of VASP job.
@@ -82,15 +104,18 @@ class JobType(ValueEnum):
 
 def run_vasp(
     job_type: JobType | str = JobType.NORMAL,
-    vasp_cmd: str = SETTINGS.VASP_CMD,
-    vasp_gamma_cmd: str = SETTINGS.VASP_GAMMA_CMD,
-    max_errors: int = SETTINGS.VASP_CUSTODIAN_MAX_ERRORS,
-    scratch_dir: str = SETTINGS.CUSTODIAN_SCRATCH_DIR,
-    handlers: Sequence[ErrorHandler] = _DEFAULT_HANDLERS,
-    validators: Sequence[Validator] = _DEFAULT_VALIDATORS,
+    vasp_cmd: str | None = None,
+    vasp_gamma_cmd: str | None = None,
+    max_errors: int | None = None,
+    scratch_dir: str | None = None,
+    handlers: Sequence[ErrorHandler] | None = None,
+    validators: Sequence[Validator] | None = None,
     wall_time: int | None = None,
     vasp_job_kwargs: dict[str, Any] = None,
     custodian_kwargs: dict[str, Any] = None,
+    auto_parallel: bool | None = None,
+    monitor: bool = False,
+    monitor_kwargs: dict[str, Any] = None,
 ):
     """
     Run VASP.
@@ -101,18 +126,25 @@ def run_vasp(
     ----------
     job_type : str or .JobType
         The job type.
-    vasp_cmd : str
-        The command used to run the standard version of vasp.
-    vasp_gamma_cmd : str
-        The command used to run the gamma version of vasp.
-    max_errors : int
-        The maximum number of errors allowed by custodian.
-    scratch_dir : str
-        The scratch directory used by custodian.
-    handlers : list of .ErrorHandler
-        The error handlers used by custodian.
-    validators : list of .Validator
-        The validators handlers used by custodian.
+    vasp_cmd : str or None
+        The command used to run the standard version of vasp. Defaults to the
+        ``VASP_CMD`` setting.
+    vasp_gamma_cmd : str or None
+        The command used to run the gamma version of vasp. Defaults to the
+        ``VASP_GAMMA_CMD`` setting.
+    max_errors : int or None
+        The maximum number of errors allowed by custodian. Defaults to the
+        ``VASP_CUSTODIAN_MAX_ERRORS`` setting.
+    scratch_dir : str or None
+        The scratch directory used by custodian. Defaults to the
+        ``CUSTODIAN_SCRATCH_DIR`` setting.
+    handlers : list of .ErrorHandler or None
+        The error handlers used by custodian. If None, the default handlers will be
+        used. The :obj:`.ConvergenceTrendHandler` is only included in the defaults
+        if the ``VASP_CONVERGENCE_TREND_HANDLER`` setting is enabled.
+    validators : list of .Validator or None
+        The validators handlers used by custodian. If None, the default validators will
+        be used.
     wall_time : int
         The maximum wall time. If set, a WallTimeHandler will be added to the list
         of handlers.
@@ -120,7 +152,31 @@ def run_vasp(
         Keyword arguments that are passed to :obj:`.VaspJob`.
     custodian_kwargs : dict
         Keyword arguments that are passed to :obj:`.Custodian`.
+    auto_parallel : bool or None
+        Whether to set KPAR and NCORE in the INCAR based on the cores available to
+        the VASP command. Skipped if the resources were already estimated when writing
+        the input set. See :obj:`.estimate_resources`. Defaults to the
+        ``VASP_AUTO_PARALLEL`` setting.
+    monitor : bool
+        Whether to monitor the progress of VASP in a background thread, writing the
+        timing, memory and convergence of each step to a JSON Lines file. See
+        :obj:`.VaspMonitor`.
+    monitor_kwargs : dict
+        Keyword arguments that are passed to :obj:`.VaspMonitor`.
     """
+    from atomate2 import SETTINGS
+
+    if vasp_cmd is None:
+        vasp_cmd = SETTINGS.VASP_CMD
+    if vasp_gamma_cmd is None:
+        vasp_gamma_cmd = SETTINGS.VASP_GAMMA_CMD
+    if max_errors is None:
+        max_errors = SETTINGS.VASP_CUSTODIAN_MAX_ERRORS
+    if scratch_dir is None:
+        scratch_dir = SETTINGS.CUSTODIAN_SCRATCH_DIR
+    if auto_parallel is None:
+        auto_parallel = SETTINGS.VASP_AUTO_PARALLEL
+
     vasp_job_kwargs = {} if vasp_job_kwargs is None else vasp_job_kwargs
     custodian_kwargs = {} if custodian_kwargs is None else custodian_kwargs
 
@@ -134,13 +190,33 @@ def run_vasp(
 
     vasp_job_kwargs.update({"gamma_vasp_cmd": split_vasp_gamma_cmd})
 
+    if auto_parallel:
+        _apply_auto_parallel(vasp_cmd)
+
+    vasp_monitor: AbstractContextManager = nullcontext()
+    if monitor:
+        from atomate2.vasp.monitor import VaspMonitor
+
+        vasp_monitor = VaspMonitor(**({} if monitor_kwargs is None else monitor_kwargs))
+
     if job_type == JobType.DIRECT:
         logger.info(f"Running command: {vasp_cmd}")
-        return_code = subprocess.call(vasp_cmd, shell=True)
+        with vasp_monitor:
+            return_code = subprocess.call(vasp_cmd, shell=True)
         logger.info(f"{vasp_cmd} finished running with returncode: {return_code}")
         return
 
-    elif job_type == JobType.NORMAL:
+    from custodian import Custodian
+    from custodian.vasp.handlers import WalltimeHandler
+    from custodian.vasp.jobs import VaspJob
+
+    if handlers is None:
+        handlers = _get_default_handlers()
+
+    if validators is None:
+        validators = _get_default_validators()
+
+    if job_type == JobType.NORMAL:
         jobs = [VaspJob(split_vasp_cmd, **vasp_job_kwargs)]
     elif job_type == JobType.DOUBLE_RELAXATION:
         jobs = VaspJob.double_relaxation_run(split_vasp_cmd, **vasp_job_kwargs)
@@ -164,12 +240,38 @@ def run_vasp(
     )
 
     logger.info("Running VASP using custodian.")
-    c.run()
+    with vasp_monitor:
+        c.run()
+
+
+def _apply_auto_parallel(vasp_cmd: str):
+    """Estimate resources for the inputs in the current directory and set KPAR/NCORE."""
+    from atomate2.vasp.resources import (
+        RESOURCE_ESTIMATE_FILENAME,
+        apply_resource_estimate,
+        estimate_resources,
+        get_available_cores,
+    )
+    from atomate2.vasp.sets.base import VaspInputSet
+
+    if Path(RESOURCE_ESTIMATE_FILENAME).exists():
+        # resources already planned when the input set was written
+        return
+
+    try:
+        vis = VaspInputSet.from_directory(".")
+        estimate = estimate_resources(vis, cores=get_available_cores(vasp_cmd))
+    except Exception as e:
+        logger.warning(f"Could not estimate VASP resources: {e}")
+        return
+
+    apply_resource_estimate(vis, estimate)
+    vis.incar.write_file("INCAR")
 
 
 def should_stop_children(
     task_document: TaskDocument,
-    handle_unsuccessful: bool | str = SETTINGS.VASP_HANDLE_UNSUCCESSFUL,
+    handle_unsuccessful: bool | str | None = None,
 ) -> bool:
     """
     Parse VASP outputs and decide whether child jobs should continue.
@@ -178,7 +280,7 @@ def should_stop_children(
     ----------
     task_document : .TaskDocument
         A VASP task document.
-    handle_unsuccessful : bool or str
+    handle_unsuccessful : bool or str or None
         This is a three-way toggle on what to do if your job looks OK, but is actually
         unconverged (either electronic or ionic):
 
@@ -186,6 +288,8 @@ def should_stop_children(
         - `False`: Do nothing, continue with workflow as normal.
         - `"error"`: Throw an error.
 
+        Defaults to the ``VASP_HANDLE_UNSUCCESSFUL`` setting.
+
     Returns
     -------
     bool
@@ -194,6 +298,11 @@ def should_stop_children(
     if task_document.state == "successful":
         return False
 
+    if handle_unsuccessful is None:
+        from atomate2 import SETTINGS
+
+        handle_unsuccessful = SETTINGS.VASP_HANDLE_UNSUCCESSFUL
+
     if isinstance(handle_unsuccessful, bool):
         return handle_unsuccessful
 
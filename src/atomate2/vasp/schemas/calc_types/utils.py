@@ -1,5 +1,6 @@
 """Module to define various calculation types as Enums for VASP."""
 
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Literal
 
@@ -7,11 +8,15 @@ from monty.serialization import loadfn
 
 from atomate2.vasp.schemas.calc_types.enums import CalcType, RunType, TaskType
 
-_RUN_TYPE_DATA = loadfn(str(Path(__file__).parent.joinpath("run_types.yaml").resolve()))
-
 __all__ = ["run_type", "task_type", "calc_type"]
 
 
+@lru_cache(maxsize=None)
+def _get_run_type_data() -> dict:
+    """Load the run type data on first use."""
+    return loadfn(str(Path(__file__).parent.joinpath("run_types.yaml").resolve()))
+
+
 def run_type(vasp_parameters: Dict) -> RunType:
     """
     Determine run_type from the VASP parameters dict.
@@ -38,8 +43,9 @@ def run_type(vasp_parameters: Dict) -> RunType:
             return v1 == v2
 
     # This is to force an order of evaluation
+    run_type_data = _get_run_type_data()
     for functional_class in ["HF", "VDW", "METAGGA", "GGA"]:
-        for special_type, params in _RUN_TYPE_DATA[functional_class].items():
+        for special_type, params in run_type_data[functional_class].items():
             if all(
                 [
                     _variant_equal(vasp_parameters.get(param, None), value)
@@ -27,8 +27,9 @@ from pymatgen.io.vasp import (
     VolumetricData,
 )
 
-from atomate2 import SETTINGS
 from atomate2.common.schemas.math import Matrix3D, Vector3D
+from atomate2.settings import SETTINGS_DEFAULT
+from atomate2.vasp.potcar import POTCAR_REGISTRY
 from atomate2.vasp.schemas.calc_types import (
     CalcType,
     RunType,
@@ -48,10 +49,13 @@ __all__ = [
     "CalculationInput",
     "CalculationOutput",
     "RunStatistics",
+    "ResourceEstimate",
+    "WarmStart",
     "Calculation",
     "IonicStep",
     "ElectronicStep",
     "ElectronPhononDisplacedStructures",
+    "BandEdgeSummary",
 ]
 
 
@@ -103,7 +107,7 @@ class PotcarSpec(BaseModel):
         PotcarSpec
             A potcar spec.
         """
-        potcar_hash = potcar_single.get_potcar_hash()
+        potcar_hash = POTCAR_REGISTRY.get_hash(potcar_single)
         return cls(titel=potcar_single.symbol, hash=potcar_hash)
 
     @classmethod
@@ -182,6 +186,59 @@ class CalculationInput(BaseModel):
         )
 
 
+class ResourceEstimate(BaseModel):
+    """Estimated resources for a VASP calculation, for comparison with RunStatistics."""
+
+    cores: int = Field(None, description="The number of cores available to VASP")
+    kpar: int = Field(None, description="The chosen number of k-point groups (KPAR)")
+    ncore: int = Field(
+        None, description="The chosen number of cores per orbital (NCORE)"
+    )
+    nelect: float = Field(None, description="The number of electrons")
+    nbands: int = Field(None, description="The estimated number of bands")
+    nkpoints: int = Field(None, description="The number of irreducible k-points")
+    fft_grid: List[int] = Field(None, description="The estimated coarse FFT grid")
+    nplane_waves: int = Field(
+        None, description="The estimated number of plane waves per band"
+    )
+    max_memory: float = Field(
+        None, description="The estimated maximum memory used per process in kb"
+    )
+    elapsed_time: float = Field(
+        None, description="The estimated real time elapsed in seconds"
+    )
+
+
+class WarmStart(BaseModel):
+    """Record of the wavefunction or charge density used to start a VASP calculation."""
+
+    source_dir: str = Field(
+        None, description="The directory of the calculation the files were taken from"
+    )
+    files: List[str] = Field(
+        None, description="The files copied from the source directory"
+    )
+    istart: int = Field(None, description="The ISTART value set in the INCAR")
+    icharg: int = Field(None, description="The ICHARG value set in the INCAR")
+    reasons: List[str] = Field(
+        None, description="The reasons the calculation was not warm started"
+    )
+    parent_scf_steps: int = Field(
+        None,
+        description="The number of electronic steps in the first ionic step of the "
+        "source calculation",
+    )
+    scf_steps: int = Field(
+        None,
+        description="The number of electronic steps in the first ionic step of this "
+        "calculation",
+    )
+    scf_steps_saved: int = Field(
+        None,
+        description="The difference between parent_scf_steps and scf_steps",
+    )
+
+
 class RunStatistics(BaseModel):
     """Summary of the run statistics for a VASP calculation."""
 
@@ -286,6 +343,71 @@ class ElectronPhononDisplacedStructures(BaseModel):
     )
 
 
+class BandEdgeSummary(BaseModel):
+    """
+    Compact summary of the bands near the band edges.
+
+    Only the eigenvalues of the highest valence bands and lowest conduction bands are
+    stored, which is much smaller than the full band structure for large supercells.
+    """
+
+    efermi: float = Field(None, description="The Fermi level in eV")
+    vbm: float = Field(None, description="The valence band maximum in eV")
+    cbm: float = Field(None, description="The conduction band minimum in eV")
+    is_metal: bool = Field(None, description="Whether the system is metallic")
+    is_spin_polarized: bool = Field(
+        None, description="Whether the band structure is spin polarized"
+    )
+    band_indices: Dict[str, List[int]] = Field(
+        None,
+        description="The indices (zero indexed) of the stored bands for each spin",
+    )
+    eigenvalues: Dict[str, List[List[float]]] = Field(
+        None,
+        description="The eigenvalues of the stored bands for each spin, as an array "
+        "with the shape (nbands, nkpoints)",
+    )
+
+    @classmethod
+    def from_band_structure(
+        cls, band_structure: BandStructure, nbands: int = 8
+    ) -> "BandEdgeSummary":
+        """
+        Create a band edge summary from a band structure.
+
+        Parameters
+        ----------
+        band_structure
+            A band structure.
+        nbands
+            The number of valence and conduction bands to store for each spin.
+
+        Returns
+        -------
+        BandEdgeSummary
+            The band edge summary.
+        """
+        band_indices = {}
+        eigenvalues = {}
+        for spin, energies in band_structure.bands.items():
+            # bands are sorted in energy so the valence bands come first
+            nvalence = int(np.any(energies < band_structure.efermi, axis=1).sum())
+            start = max(nvalence - nbands, 0)
+            stop = min(nvalence + nbands, len(energies))
+            band_indices[spin.name] = list(range(start, stop))
+            eigenvalues[spin.name] = energies[start:stop].tolist()
+
+        return cls(
+            efermi=band_structure.efermi,
+            vbm=band_structure.get_vbm()["energy"],
+            cbm=band_structure.get_cbm()["energy"],
+            is_metal=band_structure.is_metal(),
+            is_spin_polarized=band_structure.is_spin_polarized,
+            band_indices=band_indices,
+            eigenvalues=eigenvalues,
+        )
+
+
 class ElectronicStep(BaseModel, extra=Extra.allow):  # type: ignore
     """Document defining the information at each electronic step.
 
@@ -401,6 +523,9 @@ class CalculationOutput(BaseModel):
         description="Electron-phonon displaced structures, generated by setting "
         "PHON_LMC = True.",
     )
+    band_edges: BandEdgeSummary = Field(
+        None, description="Eigenvalues of the bands near the band edges"
+    )
     dos_properties: Dict[str, Dict[str, Dict[str, float]]] = Field(
         None,
         description="Element- and orbital-projected band properties (in eV) for the "
@@ -419,6 +544,7 @@ class CalculationOutput(BaseModel):
         locpot: Optional[Locpot] = None,
         elph_poscars: Optional[List[Path]] = None,
         store_trajectory: bool = False,
+        store_band_edges: bool = False,
     ) -> "CalculationOutput":
         """
         Create a VASP output document from VASP outputs.
@@ -439,6 +565,8 @@ class CalculationOutput(BaseModel):
         store_trajectory
             Whether to store ionic steps as a pymatgen Trajectory object. If `True`,
             the `ionic_steps` field is left as None.
+        store_band_edges
+            Whether to store the eigenvalues of the bands near the band edges.
 
         Returns
         -------
@@ -457,6 +585,10 @@ class CalculationOutput(BaseModel):
                 direct_gap=bandstructure.get_direct_band_gap(),
                 transition=bandgap_info["transition"],
             )
+            if store_band_edges:
+                electronic_output["band_edges"] = BandEdgeSummary.from_band_structure(
+                    bandstructure
+                )
         except Exception:
             logger.warning("Error in parsing bandstructure")
             if vasprun.incar["IBRION"] == 1:
@@ -591,13 +723,12 @@ class Calculation(BaseModel):
         parse_dos: Union[str, bool] = False,
         parse_bandstructure: Union[str, bool] = False,
         average_locpot: bool = True,
-        run_bader: bool = (SETTINGS.VASP_RUN_BADER and _BADER_EXE_EXISTS),
+        run_bader: Optional[bool] = None,
         strip_bandstructure_projections: bool = False,
         strip_dos_projections: bool = False,
-        store_volumetric_data: Optional[
-            Tuple[str]
-        ] = SETTINGS.VASP_STORE_VOLUMETRIC_DATA,
+        store_volumetric_data: Optional[Tuple[str]] = SETTINGS_DEFAULT,
         store_trajectory: bool = False,
+        store_band_edges: bool = False,
         vasprun_kwargs: Optional[Dict] = None,
     ) -> Tuple["Calculation", Dict[VaspObject, Dict]]:
         """
@@ -643,7 +774,8 @@ class Calculation(BaseModel):
         average_locpot
             Whether to store the average of the LOCPOT along the crystal axes.
         run_bader
-            Whether to run bader on the charge density.
+            Whether to run bader on the charge density. Defaults to the
+            ``VASP_RUN_BADER`` setting if the bader executable is available.
         strip_dos_projections
             Whether to strip the element and site projections from the density of
             states. This can help reduce the size of DOS objects in systems with many
@@ -652,11 +784,15 @@ class Calculation(BaseModel):
             Whether to strip the element and site projections from the band structure.
             This can help reduce the size of DOS objects in systems with many atoms.
         store_volumetric_data
-            Which volumetric files to store.
+            Which volumetric files to store. Defaults to the
+            ``VASP_STORE_VOLUMETRIC_DATA`` setting.
         store_trajectory
             Whether to store the ionic steps in a pymatgen Trajectory object. if `True`,
             :obj:'.CalculationOutput.ionic_steps' is set to None to reduce duplicating
             information.
+        store_band_edges
+            Whether to store the eigenvalues of the bands near the band edges. This is
+            much smaller than the full band structure, see :obj:`.BandEdgeSummary`.
         vasprun_kwargs
             Additional keyword arguments that will be passed to the Vasprun init.
 
@@ -665,6 +801,13 @@ class Calculation(BaseModel):
         Calculation
             A VASP calculation document.
         """
+        from atomate2 import SETTINGS
+
+        if run_bader is None:
+            run_bader = SETTINGS.VASP_RUN_BADER and _BADER_EXE_EXISTS
+        if store_volumetric_data is SETTINGS_DEFAULT:
+            store_volumetric_data = SETTINGS.VASP_STORE_VOLUMETRIC_DATA
+
         dir_name = Path(dir_name)
         vasprun_file = dir_name / vasprun_file
         outcar_file = dir_name / outcar_file
@@ -716,6 +859,7 @@ class Calculation(BaseModel):
             locpot=locpot,
             elph_poscars=elph_poscars,
             store_trajectory=store_trajectory,
+            store_band_edges=store_band_edges,
         )
         if store_trajectory:
             traj = Trajectory.from_structures(
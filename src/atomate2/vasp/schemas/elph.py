@@ -7,7 +7,8 @@ import numpy as np
 from pydantic import BaseModel, Field
 from pymatgen.core import Structure
 from pymatgen.electronic_structure.bandstructure import BandStructure
-from pymatgen.electronic_structure.core import Spin
+
+from atomate2.vasp.schemas.calculation import BandEdgeSummary
 
 logger = logging.getLogger(__name__)
 
@@ -126,6 +127,9 @@ class ElectronPhononRenormalisationDoc(BaseModel):
         """
         Calculate an electron-phonon renormalisation document from band structures.
 
+        The band structures are converted to band edge summaries and the document is
+        calculated using :obj:`from_band_edges`.
+
         Parameters
         ----------
         temperatures : list of float
@@ -162,13 +166,86 @@ class ElectronPhononRenormalisationDoc(BaseModel):
         ElectronPhononRenormalisationDoc
             An electron-phonon renormalisation document.
         """
-        if bulk_band_structure.is_metal():
+        displacement_band_edges = [
+            BandEdgeSummary.from_band_structure(b) for b in displacement_band_structures
+        ]
+        return cls.from_band_edges(
+            temperatures,
+            displacement_band_edges,
+            displacement_structures,
+            displacement_uuids,
+            displacement_dirs,
+            BandEdgeSummary.from_band_structure(bulk_band_structure),
+            bulk_structure,
+            bulk_uuid,
+            bulk_dir,
+            elph_uuid,
+            elph_dir,
+            original_structure,
+        )
+
+    @classmethod
+    def from_band_edges(
+        cls,
+        temperatures: List[float],
+        displacement_band_edges: List[BandEdgeSummary],
+        displacement_structures: List[Structure],
+        displacement_uuids: List[str],
+        displacement_dirs: List[str],
+        bulk_band_edges: BandEdgeSummary,
+        bulk_structure: Structure,
+        bulk_uuid: str,
+        bulk_dir: str,
+        elph_uuid: str,
+        elph_dir: str,
+        original_structure: Structure,
+    ):
+        """
+        Calculate an electron-phonon renormalisation document from band edge summaries.
+
+        Parameters
+        ----------
+        temperatures : list of float
+            The temperatures at which electron phonon properties were calculated.
+        displacement_band_edges : list of BandEdgeSummary
+            The band edges of the electron-phonon displaced structures.
+        displacement_structures : list of Structure
+            The electron-phonon displaced structures.
+        displacement_uuids : list of str
+            The UUIDs of the electron-phonon displaced band structure calculations.
+        displacement_dirs : list of str
+            The calculation directories of the electron-phonon displaced band structure
+            calculations.
+        bulk_band_edges : BandEdgeSummary
+            The band edges of the bulk undisplaced supercell calculation.
+        bulk_structure : Structure
+            The structure of the bulk undisplaced supercell.
+        bulk_uuid : str
+            The UUID of the bulk undisplaced supercell band structure calculation.
+        bulk_dir : str
+            The directory of the bulk undisplaced supercell band structure calculation.
+        elph_uuid : str
+            The UUID of the electron-phonon calculation that generated the displaced
+            structures.
+        elph_dir : str
+            The directory of electron-phonon calculation that generated the displaced
+            structures.
+        original_structure : Structure
+            The original primitive structure for which electron-phonon calculations
+            were performed.
+
+        Returns
+        -------
+        ElectronPhononRenormalisationDoc
+            An electron-phonon renormalisation document.
+        """
+        if bulk_band_edges.is_metal:
             raise ValueError(
                 "Bulk band structure is metallic. Cannot calculate band gap "
                 "renormalisation"
             )
 
-        if len({b.is_spin_polarized for b in displacement_band_structures}) != 1:
+        if len({b.is_spin_polarized for b in displacement_band_edges}) != 1:
             raise ValueError(
                 "Some displacement bands structures are spin polarized and some are "
                 "spin paired. Cannot continue."
@@ -176,8 +253,8 @@ class ElectronPhononRenormalisationDoc(BaseModel):
 
         # check all displacement calculations match magnetism of bulk
         if (
-            bulk_band_structure.is_spin_polarized
-            != displacement_band_structures[0].is_spin_polarized
+            bulk_band_edges.is_spin_polarized
+            != displacement_band_edges[0].is_spin_polarized
         ):
             raise ValueError(
                 "Spin polarization of bulk structure does not match polarization of "
@@ -186,28 +263,28 @@ class ElectronPhononRenormalisationDoc(BaseModel):
 
         # discard metallic displacement calculations and log the issue
         keep = []
-        for i, band_structure in enumerate(displacement_band_structures):
-            if band_structure.is_metal():
-                logger.warning("T = {} K band structure is metallic... skipping")
+        for i, band_edges in enumerate(displacement_band_edges):
+            if band_edges.is_metal:
+                logger.warning(f"T = {temperatures[i]} K band structure is metallic...")
             else:
                 keep.append(i)
 
         temperatures = [temperatures[i] for i in keep]
-        displacement_band_structures = [displacement_band_structures[i] for i in keep]
+        displacement_band_edges = [displacement_band_edges[i] for i in keep]
         displacement_structures = [displacement_structures[i] for i in keep]
         displacement_dirs = [displacement_dirs[i] for i in keep]
         displacement_uuids = [displacement_uuids[i] for i in keep]
 
-        vbm_band_indices, cbm_band_indices = _get_band_edge_indices(bulk_band_structure)
-        bulk_vbm = bulk_band_structure.get_vbm()["energy"]
-        bulk_cbm = bulk_band_structure.get_cbm()["energy"]
+        vbm_band_indices, cbm_band_indices = _get_band_edge_indices(bulk_band_edges)
+        bulk_vbm = bulk_band_edges.vbm
+        bulk_cbm = bulk_band_edges.cbm
         bulk_band_gap = bulk_cbm - bulk_vbm
 
         displacement_cbms = _get_displacement_band_edges(
-            displacement_band_structures, cbm_band_indices, cbm=True
+            displacement_band_edges, cbm_band_indices, cbm=True
         )
         displacement_vbms = _get_displacement_band_edges(
-            displacement_band_structures, vbm_band_indices, cbm=False
+            displacement_band_edges, vbm_band_indices, cbm=False
         )
         cbms = np.mean(displacement_cbms, axis=1)
         vbms = np.mean(displacement_vbms, axis=1)
@@ -234,8 +311,8 @@ class ElectronPhononRenormalisationDoc(BaseModel):
                 bulk_structure=bulk_structure,
                 bulk_cbm=bulk_cbm,
                 bulk_vbm=bulk_vbm,
-                bulk_vbm_band_indices={s.name: i for s, i in vbm_band_indices.items()},
-                bulk_cbm_band_indices={s.name: i for s, i in cbm_band_indices.items()},
+                bulk_vbm_band_indices=vbm_band_indices,
+                bulk_cbm_band_indices=cbm_band_indices,
                 elph_uuid=elph_uuid,
                 elph_dir=elph_dir,
             ),
@@ -243,59 +320,86 @@ class ElectronPhononRenormalisationDoc(BaseModel):
 
 
 def _get_displacement_band_edges(
-    band_structures: List[BandStructure],
-    band_indices: Dict[Spin, List[int]],
+    band_edges: List[BandEdgeSummary],
+    band_indices: Dict[str, List[int]],
     cbm: bool = True,
-):
-    """Extract band edge energies based on a band structure and band indices."""
-    band_edges = []
-    for band_structure in band_structures:
-        spin_edges = []
-        for spin, spin_indices in band_indices.items():
-            eigs = band_structure.bands[spin][spin_indices]
-            if cbm:
-                spin_edges.extend(eigs.min(axis=1).tolist())
-            else:
-                spin_edges.extend(eigs.max(axis=1).tolist())
-        band_edges.append(spin_edges)
+) -> np.ndarray:
+    """
+    Extract band edge energies based on band edge summaries and band indices.
 
-    return np.array(band_edges)
+    The eigenvalues of the bands for all structures are stacked into a single array,
+    padded with NaN where structures have fewer k-points, so that the band extrema are
+    found in one operation.
+
+    Returns
+    -------
+    np.ndarray
+        The band edge energies with the shape (nstructures, nbands).
+    """
+    spin_edges = []
+    for spin, spin_indices in band_indices.items():
+        eigenvalues = _stack_band_eigenvalues(band_edges, spin, spin_indices)
+        if cbm:
+            spin_edges.append(np.nanmin(eigenvalues, axis=2))
+        else:
+            spin_edges.append(np.nanmax(eigenvalues, axis=2))
+
+    return np.concatenate(spin_edges, axis=1)
+
+
+def _stack_band_eigenvalues(
+    band_edges: List[BandEdgeSummary], spin: str, band_indices: List[int]
+) -> np.ndarray:
+    """Stack the eigenvalues of selected bands with the shape (nstructs, nbands, nk)."""
+    nkpoints = max(len(b.eigenvalues[spin][0]) for b in band_edges)
+    stacked = np.full((len(band_edges), len(band_indices), nkpoints), np.nan)
+    for i, summary in enumerate(band_edges):
+        stored_indices = summary.band_indices[spin]
+        missing = set(band_indices) - set(stored_indices)
+        if missing:
+            raise ValueError(
+                f"Bands {sorted(missing)} are not included in the band edge summary. "
+                "Increase the number of bands stored."
+            )
+        rows = [stored_indices.index(idx) for idx in band_indices]
+        eigenvalues = np.asarray(summary.eigenvalues[spin])[rows]
+        stacked[i, :, : eigenvalues.shape[1]] = eigenvalues
+    return stacked
 
 
 def _get_band_edge_indices(
-    band_structure: BandStructure,
+    band_edges: BandEdgeSummary,
     tol: float = 0.005,
-) -> Tuple[Dict[Spin, List[int]], Dict[Spin, List[int]]]:
+) -> Tuple[Dict[str, List[int]], Dict[str, List[int]]]:
     """
     Get indices of degenerate band edge states, within a tolerance.
 
     Parameters
     ----------
-    band_structure : BandStructure
-        A band structure.
+    band_edges : BandEdgeSummary
+        A band edge summary.
     tol : float
         Degeneracy tolerance in meV.
     """
-    vbm_energy = band_structure.get_vbm()["energy"]
-    cbm_energy = band_structure.get_cbm()["energy"]
-
     vbm_band_indices = {}
     cbm_band_indices = {}
-    for spin, spin_energies in band_structure.bands.items():
-        vb_idxs = np.where(
+    for spin, spin_energies in band_edges.eigenvalues.items():
+        spin_energies = np.asarray(spin_energies)
+        spin_indices = np.asarray(band_edges.band_indices[spin])
+        vb_idxs = spin_indices[
             np.any(
-                (spin_energies > vbm_energy - tol)
-                & (spin_energies < band_structure.efermi),
+                (spin_energies > band_edges.vbm - tol)
+                & (spin_energies < band_edges.efermi),
                 axis=1,
             )
-        )[0]
-        cb_idxs = np.where(
+        ]
+        cb_idxs = spin_indices[
             np.any(
-                (spin_energies < cbm_energy + tol)
-                & (spin_energies > band_structure.efermi),
+                (spin_energies < band_edges.cbm + tol)
+                & (spin_energies > band_edges.efermi),
                 axis=1,
             )
-        )[0]
+        ]
         vbm_band_indices[spin] = vb_idxs.tolist()
         cbm_band_indices[spin] = cb_idxs.tolist()
 
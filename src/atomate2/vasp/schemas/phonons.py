@@ -5,22 +5,11 @@ import logging
 from typing import Dict, List, Optional, Union
 
 import numpy as np
-from phonopy import Phonopy
-from phonopy.phonon.band_structure import get_band_qpoints_and_path_connections
-from phonopy.structure.symmetry import symmetrize_borns_and_epsilon
-from phonopy.units import VaspToTHz
 from pydantic import BaseModel, Field
 from pymatgen.core import Structure
-from pymatgen.io.phonopy import (
-    get_ph_bs_symm_line,
-    get_ph_dos,
-    get_phonopy_structure,
-    get_pmg_structure,
-)
 from pymatgen.io.vasp import Kpoints
 from pymatgen.phonon.bandstructure import PhononBandStructureSymmLine
 from pymatgen.phonon.dos import PhononDos
-from pymatgen.phonon.plotter import PhononBSPlotter, PhononDosPlotter
 from pymatgen.symmetry.bandstructure import HighSymmKpath
 from pymatgen.symmetry.kpath import KPathSeek
 
@@ -234,6 +223,20 @@ class PhononBSDOSDoc(BaseModel):
         **kwargs:
             additional arguments
         """
+        from phonopy import Phonopy
+        from phonopy.phonon.band_structure import (
+            get_band_qpoints_and_path_connections,
+        )
+        from phonopy.structure.symmetry import symmetrize_borns_and_epsilon
+        from phonopy.units import VaspToTHz
+        from pymatgen.io.phonopy import (
+            get_ph_bs_symm_line,
+            get_ph_dos,
+            get_phonopy_structure,
+            get_pmg_structure,
+        )
+        from pymatgen.phonon.plotter import PhononBSPlotter, PhononDosPlotter
+
         if code == "vasp":
             factor = VaspToTHz
         # This opens the opportunity to add support for other codes
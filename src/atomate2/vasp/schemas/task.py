@@ -14,17 +14,20 @@ from pymatgen.core.trajectory import Trajectory
 from pymatgen.entries.computed_entries import ComputedEntry
 from pymatgen.io.vasp import Incar, Kpoints, Poscar, Potcar
 
-from atomate2 import SETTINGS, __version__
+from atomate2 import __version__
 from atomate2.common.schemas.math import Matrix3D, Vector3D
 from atomate2.common.schemas.structure import StructureMetadata
 from atomate2.utils.datetime import datetime_str
 from atomate2.utils.path import get_uri
+from atomate2.vasp.potcar import POTCAR_REGISTRY
 from atomate2.vasp.schemas.calculation import (
     Calculation,
     PotcarSpec,
+    ResourceEstimate,
     RunStatistics,
     Status,
     VaspObject,
+    WarmStart,
 )
 
 __all__ = [
@@ -68,6 +71,7 @@ class AnalysisSummary(BaseModel):
         AnalysisSummary
             The relaxation analysis.
         """
+        from atomate2 import SETTINGS
         from atomate2.vasp.schemas.calculation import Status
 
         initial_vol = calcs_reversed[-1].input.structure.lattice.volume
@@ -269,6 +273,16 @@ class TaskDocument(StructureMetadata):
         None,
         description="Summary of runtime statistics for each calculation in this task",
     )
+    resource_estimate: ResourceEstimate = Field(
+        None,
+        description="Resources estimated before running this task, parsed from a "
+        "resource_estimate.json file",
+    )
+    warm_start: WarmStart = Field(
+        None,
+        description="The wavefunction or charge density files used to start this "
+        "task, parsed from a warm_start.json file",
+    )
     orig_inputs: Dict[str, Union[Kpoints, dict, Poscar, List[PotcarSpec]]] = Field(
         None, description="Summary of the original VASP inputs written by custodian"
     )
@@ -305,7 +319,7 @@ class TaskDocument(StructureMetadata):
         cls: Type[_T],
         dir_name: Union[Path, str],
         volumetric_files: Tuple[str, ...] = _VOLUMETRIC_FILES,
-        store_additional_json: bool = SETTINGS.VASP_STORE_ADDITIONAL_JSON,
+        store_additional_json: Optional[bool] = None,
         additional_fields: Dict[str, Any] = None,
         **vasp_calculation_kwargs,
     ) -> _T:
@@ -318,6 +332,7 @@ class TaskDocument(StructureMetadata):
             The path to the folder containing the calculation outputs.
         store_additional_json
             Whether to store additional json files found in the calculation directory.
+            Defaults to the ``VASP_STORE_ADDITIONAL_JSON`` setting.
         volumetric_files
             Volumetric files to search for.
         additional_fields
@@ -333,6 +348,11 @@ class TaskDocument(StructureMetadata):
         """
         logger.info(f"Getting task doc in: {dir_name}")
 
+        if store_additional_json is None:
+            from atomate2 import SETTINGS
+
+            store_additional_json = SETTINGS.VASP_STORE_ADDITIONAL_JSON
+
         additional_fields = {} if additional_fields is None else additional_fields
         dir_name = Path(dir_name)
         task_files = _find_vasp_files(dir_name, volumetric_files=volumetric_files)
@@ -357,6 +377,8 @@ class TaskDocument(StructureMetadata):
         analysis = AnalysisSummary.from_vasp_calc_docs(calcs_reversed)
         transformations, icsd_id, tags, author = _parse_transformations(dir_name)
         custodian = _parse_custodian(dir_name)
+        resource_estimate = _parse_resource_estimate(dir_name)
+        warm_start = _parse_warm_start(dir_name, calcs_reversed)
         orig_inputs = _parse_orig_inputs(dir_name)
 
         additional_json = None
@@ -394,6 +416,8 @@ class TaskDocument(StructureMetadata):
             state=_get_state(calcs_reversed, analysis),
             entry=cls.get_entry(calcs_reversed),
             run_stats=_get_run_stats(calcs_reversed),
+            resource_estimate=resource_estimate,
+            warm_start=warm_start,
             vasp_objects=vasp_objects,
             included_objects=included_objects,
         )
@@ -491,6 +515,33 @@ def _parse_custodian(dir_name: Path) -> Optional[Dict]:
     return None
 
 
+def _parse_resource_estimate(dir_name: Path) -> Optional[ResourceEstimate]:
+    """Parse resource_estimate.json file written when planning the calculation."""
+    filenames = tuple(dir_name.glob("resource_estimate.json*"))
+    if len(filenames) >= 1:
+        return ResourceEstimate(**loadfn(filenames[0], cls=None))
+    return None
+
+
+def _parse_warm_start(
+    dir_name: Path, calcs_reversed: List[Calculation]
+) -> Optional[WarmStart]:
+    """Parse warm_start.json file and count the SCF steps saved by the warm start."""
+    filenames = tuple(dir_name.glob("warm_start.json*"))
+    if len(filenames) == 0:
+        return None
+
+    warm_start = WarmStart(**loadfn(filenames[0], cls=None))
+    ionic_steps = calcs_reversed[-1].output.ionic_steps
+    if ionic_steps and ionic_steps[0].electronic_steps is not None:
+        warm_start.scf_steps = len(ionic_steps[0].electronic_steps)
+        if warm_start.parent_scf_steps is not None:
+            warm_start.scf_steps_saved = (
+                warm_start.parent_scf_steps - warm_start.scf_steps
+            )
+    return warm_start
+
+
 def _parse_orig_inputs(
     dir_name: Path,
 ) -> Dict[str, Union[Kpoints, Poscar, PotcarSpec, Incar]]:
@@ -523,7 +574,7 @@ def _parse_orig_inputs(
                 if name == "POTCAR":
                     # can't serialize POTCAR
                     orig_inputs[name.lower()] = PotcarSpec.from_potcar(
-                        vasp_input.from_file(filename)
+                        POTCAR_REGISTRY.from_file(filename)
                     )
                 else:
                     orig_inputs[name.lower()] = vasp_input.from_file(filename)
@@ -533,10 +584,17 @@ def _parse_orig_inputs(
 
 def _parse_additional_json(dir_name: Path) -> Dict[str, Any]:
     """Parse additional json files in the directory."""
+    excluded = (
+        "custodian",
+        "transformations",
+        "vasp_summary",
+        "resource_estimate",
+        "warm_start",
+    )
     additional_json = {}
     for filename in dir_name.glob("*.json*"):
         key = filename.name.split(".")[0]
-        if key not in ("custodian", "transformations"):
+        if key not in excluded and ".jsonl" not in filename.name:
             additional_json[key] = loadfn(filename, cls=None)
     return additional_json
 
@@ -3,10 +3,14 @@
 from __future__ import annotations
 
 import glob
+import hashlib
+import json
 import os
 import warnings
+from collections import OrderedDict
 from copy import deepcopy
 from dataclasses import dataclass, field
+from functools import lru_cache
 from itertools import groupby
 from pathlib import Path
 from typing import Any
@@ -14,7 +18,6 @@ from typing import Any
 import numpy as np
 from monty.io import zopen
 from monty.serialization import loadfn
-from pkg_resources import resource_filename
 from pymatgen.core import Structure
 from pymatgen.electronic_structure.core import Magmom
 from pymatgen.io.core import InputGenerator, InputSet
@@ -27,11 +30,28 @@ from pymatgen.io.vasp.sets import (
 from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
 from pymatgen.symmetry.bandstructure import HighSymmKpath
 
-from atomate2 import SETTINGS
+from atomate2.vasp.potcar import POTCAR_REGISTRY
+from atomate2.vasp.summary import get_summary_structure, load_vasp_summary
 
-_BASE_VASP_SET = loadfn(resource_filename("atomate2.vasp.sets", "BaseVaspSet.yaml"))
+__all__ = ["VaspInputSet", "VaspInputGenerator", "clear_input_set_cache"]
 
-__all__ = ["VaspInputSet", "VaspInputGenerator"]
+_INPUT_SET_CACHE_SIZE = 128
+_input_set_cache: OrderedDict[tuple, VaspInputSet] = OrderedDict()
+
+
+@lru_cache(maxsize=None)
+def _load_base_vasp_set() -> dict:
+    """Load the base VASP input set settings on first use."""
+    return loadfn(Path(__file__).parent / "BaseVaspSet.yaml")
+
+
+def clear_input_set_cache():
+    """Clear the cached input sets, POTCARs, k-point paths and meshes."""
+    _input_set_cache.clear()
+    _load_potcar.cache_clear()
+    POTCAR_REGISTRY.clear()
+    _get_line_mode_kpoints_cached.cache_clear()
+    _get_ir_reciprocal_mesh_cached.cache_clear()
 
 
 class VaspInputSet(InputSet):
@@ -257,6 +277,7 @@ class VaspInputGenerator(InputGenerator):
         optB86b and rVV10.
     symprec
         Tolerance for symmetry finding, used for line mode band structure k-points.
+        Defaults to the ``SYMPREC`` setting.
     auto_ispin
         If generating input set from a previous calculation, this controls whether
         to disable magnetisation (ISPIN = 1) if the absolute value of all magnetic
@@ -275,10 +296,10 @@ class VaspInputGenerator(InputGenerator):
     use_structure_charge: bool = False
     sort_structure: bool = True
     force_gamma: bool = True
-    symprec: float = SETTINGS.SYMPREC
+    symprec: float | None = None
     vdw: str = None
     auto_ispin: bool = False
-    config_dict: dict = field(default_factory=lambda: _BASE_VASP_SET)
+    config_dict: dict = field(default_factory=_load_base_vasp_set)
 
     def __post_init__(self):
         """Post init formatting of arguments."""
@@ -366,6 +387,19 @@ class VaspInputGenerator(InputGenerator):
         VaspInputSet
             A VASP input set.
         """
+        # input sets generated from a structure alone are fully determined by the
+        # structure and generator settings, so they can be reused between calls
+        cache_key = None
+        if prev_dir is None and structure is not None:
+            cache_key = (
+                _get_fingerprint(self.as_dict()),
+                _get_fingerprint(structure.as_dict()),
+                potcar_spec,
+            )
+            if cache_key in _input_set_cache:
+                _input_set_cache.move_to_end(cache_key)
+                return _copy_input_set(_input_set_cache[cache_key])
+
         structure, prev_incar, bandgap, ispin, vasprun, outcar = self._get_previous(
             structure, prev_dir
         )
@@ -394,13 +428,19 @@ class VaspInputGenerator(InputGenerator):
             bandgap=bandgap,
             ispin=ispin,
         )
-        return VaspInputSet(
+        input_set = VaspInputSet(
             incar=incar,
             kpoints=kpoints,
             poscar=Poscar(structure),
             potcar=self._get_potcar(structure, potcar_spec=potcar_spec),
         )
 
+        if cache_key is not None:
+            _input_set_cache[cache_key] = _copy_input_set(input_set)
+            if len(_input_set_cache) > _INPUT_SET_CACHE_SIZE:
+                _input_set_cache.popitem(last=False)
+        return input_set
+
     def get_incar_updates(
         self,
         structure: Structure,
@@ -479,8 +519,10 @@ class VaspInputGenerator(InputGenerator):
         float
             Number of electrons for the structure.
         """
-        potcar = self._get_potcar(structure, potcar_spec=False)
-        nelec = {p.element: p.nelectrons for p in potcar}
+        nelec = {}
+        for symbol in self._get_potcar_symbols(structure):
+            info = POTCAR_REGISTRY.get_info(symbol, self.potcar_functional)
+            nelec[info.element] = info.nelectrons
         comp = structure.composition.element_composition
         nelect = sum(num_atoms * nelec[str(el)] for el, num_atoms in comp.items())
 
@@ -501,34 +543,49 @@ class VaspInputGenerator(InputGenerator):
         bandgap = 0
         ispin = None
         if prev_dir:
-            vasprun, outcar = get_vasprun_outcar(prev_dir)
+            summary = load_vasp_summary(prev_dir)
+            if summary is not None and summary.get("bandgap") is not None:
+                # fast path: use the summary written by the previous job and only
+                # parse the vasprun.xml and OUTCAR if they are actually needed
+                prev_outputs = _LazyVaspOutputs(prev_dir)
+                vasprun = _LazyOutput(prev_outputs, "vasprun")
+                outcar = _LazyOutput(prev_outputs, "outcar")
+                prev_incar = Incar(summary["incar"])
+                prev_structure = get_summary_structure(summary)
+                bandgap = 0 if summary["is_metal"] else summary["bandgap"]
+
+                if self.auto_ispin:
+                    # turn off spin when magmom for every site is smaller than 0.02.
+                    magmoms = np.abs(summary["magmoms"])
+                    ispin = 2 if np.any(magmoms > 0.02) else 1
+            else:
+                vasprun, outcar = get_vasprun_outcar(prev_dir, parse_dos=False)
 
-            path_prev_dir = Path(prev_dir)
+                path_prev_dir = Path(prev_dir)
 
-            # CONTCAR is already renamed POSCAR
-            contcars = list(glob.glob(str(path_prev_dir / "POSCAR*")))
-            contcarfile_fullpath = str(path_prev_dir / "POSCAR")
-            contcarfile = (
-                contcarfile_fullpath
-                if contcarfile_fullpath in contcars
-                else sorted(contcars)[-1]
-            )
-            contcar = Poscar.from_file(contcarfile)
+                # CONTCAR is already renamed POSCAR
+                contcars = list(glob.glob(str(path_prev_dir / "POSCAR*")))
+                contcarfile_fullpath = str(path_prev_dir / "POSCAR")
+                contcarfile = (
+                    contcarfile_fullpath
+                    if contcarfile_fullpath in contcars
+                    else sorted(contcars)[-1]
+                )
+                contcar = Poscar.from_file(contcarfile)
 
-            if vasprun.efermi is None:
-                # VASP doesn't output efermi in vasprun if IBRION = 1
-                vasprun.efermi = outcar.efermi
+                if vasprun.efermi is None:
+                    # VASP doesn't output efermi in vasprun if IBRION = 1
+                    vasprun.efermi = outcar.efermi
 
-            bs = vasprun.get_band_structure(efermi="smart")
-            prev_incar = vasprun.incar
-            # use structure from CONTCAR as it is written to greater
-            # precision than in the vasprun
-            prev_structure = contcar.structure
-            bandgap = 0 if bs.is_metal() else bs.get_band_gap()["energy"]
+                prev_incar = vasprun.incar
+                # use structure from CONTCAR as it is written to greater
+                # precision than in the vasprun
+                prev_structure = contcar.structure
+                bandgap = _get_bandgap(vasprun)
 
-            if self.auto_ispin:
-                # turn off spin when magmom for every site is smaller than 0.02.
-                ispin = _get_ispin(vasprun, outcar)
+                if self.auto_ispin:
+                    # turn off spin when magmom for every site is smaller than 0.02.
+                    ispin = _get_ispin(vasprun, outcar)
 
         structure = structure if structure is not None else prev_structure
         structure = self._get_structure(structure)
@@ -551,28 +608,36 @@ class VaspInputGenerator(InputGenerator):
             get_valid_magmom_struct(structure, spin_mode="auto", inplace=True)
         return structure
 
+    def _get_potcar_symbols(self, structure) -> list[str]:
+        """Get the POTCAR symbols for each element in the structure."""
+        elements = [a[0] for a in groupby([s.specie.symbol for s in structure])]
+        return [self.config_dict["POTCAR"].get(el, el) for el in elements]
+
     def _get_potcar(self, structure, potcar_spec: bool = False):
         """Get the POTCAR."""
-        elements = [a[0] for a in groupby([s.specie.symbol for s in structure])]
-        potcar_symbols = [self.config_dict["POTCAR"].get(el, el) for el in elements]
+        potcar_symbols = self._get_potcar_symbols(structure)
 
         if potcar_spec:
             return potcar_symbols
 
-        potcar = Potcar(potcar_symbols, functional=self.potcar_functional)
+        potcar, unmatched = _load_potcar(tuple(potcar_symbols), self.potcar_functional)
 
         # warn if the selected POTCARs do not correspond to the chosen potcar_functional
-        for psingle in potcar:
-            if self.potcar_functional not in psingle.identify_potcar()[0]:
-                warnings.warn(
-                    f"POTCAR data with symbol {psingle.symbol} is not known by pymatgen"
-                    " to correspond with the selected potcar_functional "
-                    f"{self.potcar_functional}. This POTCAR is known to correspond with"
-                    f" functionals {psingle.identify_potcar(mode='data')[0]}. Please "
-                    "verify that you are using the right POTCARs!",
-                    BadInputSetWarning,
-                )
-        return potcar
+        for symbol, functionals in unmatched:
+            warnings.warn(
+                f"POTCAR data with symbol {symbol} is not known by pymatgen"
+                " to correspond with the selected potcar_functional "
+                f"{self.potcar_functional}. This POTCAR is known to correspond with"
+                f" functionals {list(functionals)}. Please "
+                "verify that you are using the right POTCARs!",
+                BadInputSetWarning,
+            )
+
+        # return a new Potcar so the cached copy cannot be modified by the caller; the
+        # POTCARs themselves are shared with the registry
+        potcar_copy = Potcar(functional=self.potcar_functional)
+        potcar_copy.extend(potcar)
+        return potcar_copy
 
     def _get_incar(
         self,
@@ -693,9 +758,10 @@ class VaspInputGenerator(InputGenerator):
         base_kpoints = None
         if kconfig.get("line_density"):
             # handle line density generation
-            kpath = HighSymmKpath(structure, **kconfig.get("kpath_kwargs", {}))
-            frac_k_points, k_points_labels = kpath.get_kpoints(
-                line_density=kconfig["line_density"], coords_are_cartesian=False
+            frac_k_points, k_points_labels = _get_line_mode_kpoints(
+                _StructureKey(structure),
+                kconfig["line_density"],
+                _get_fingerprint(kconfig.get("kpath_kwargs", {}), digest=False),
             )
             base_kpoints = Kpoints(
                 comment="Non SCF run along symmetry lines",
@@ -716,8 +782,9 @@ class VaspInputGenerator(InputGenerator):
                     structure, kconfig["reciprocal_density"], self.force_gamma
                 )
             if explicit:
-                sga = SpacegroupAnalyzer(structure, symprec=self.symprec)
-                mesh = sga.get_ir_reciprocal_mesh(base_kpoints.kpts[0])
+                mesh = _get_ir_reciprocal_mesh(
+                    _StructureKey(structure), tuple(base_kpoints.kpts[0]), self.symprec
+                )
                 base_kpoints = Kpoints(
                     comment="Uniform grid",
                     style=Kpoints.supported_modes.Reciprocal,
@@ -733,10 +800,8 @@ class VaspInputGenerator(InputGenerator):
         zero_weighted_kpoints = None
         if kconfig.get("zero_weighted_line_density"):
             # zero_weighted k-points along line mode path
-            kpath = HighSymmKpath(structure)
-            frac_k_points, k_points_labels = kpath.get_kpoints(
-                line_density=kconfig["zero_weighted_line_density"],
-                coords_are_cartesian=False,
+            frac_k_points, k_points_labels = _get_line_mode_kpoints(
+                _StructureKey(structure), kconfig["zero_weighted_line_density"], "{}"
             )
             zero_weighted_kpoints = Kpoints(
                 comment="Hybrid run along symmetry lines",
@@ -750,8 +815,11 @@ class VaspInputGenerator(InputGenerator):
             zero_weighted_kpoints = Kpoints.automatic_density_by_vol(
                 structure, kconfig["zero_weighted_reciprocal_density"], self.force_gamma
             )
-            sga = SpacegroupAnalyzer(structure, symprec=self.symprec)
-            mesh = sga.get_ir_reciprocal_mesh(zero_weighted_kpoints.kpts[0])
+            mesh = _get_ir_reciprocal_mesh(
+                _StructureKey(structure),
+                tuple(zero_weighted_kpoints.kpts[0]),
+                self.symprec,
+            )
             zero_weighted_kpoints = Kpoints(
                 comment="Uniform grid",
                 style=Kpoints.supported_modes.Reciprocal,
@@ -810,6 +878,103 @@ class VaspInputGenerator(InputGenerator):
         return None
 
 
+def _get_fingerprint(obj: Any, digest: bool = True) -> str:
+    """Get a deterministic fingerprint of a JSON serializable object."""
+    string = json.dumps(obj, sort_keys=True, default=_json_default)
+    return hashlib.sha1(string.encode()).hexdigest() if digest else string
+
+
+def _json_default(obj: Any):
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if hasattr(obj, "as_dict"):
+        return obj.as_dict()
+    return repr(obj)
+
+
+class _StructureKey:
+    """Hashable wrapper around a structure, used to key the LRU caches."""
+
+    __slots__ = ("structure", "fingerprint")
+
+    def __init__(self, structure: Structure):
+        self.structure = structure
+        self.fingerprint = _get_fingerprint(structure.as_dict())
+
+    def __hash__(self):
+        return hash(self.fingerprint)
+
+    def __eq__(self, other):
+        return (
+            isinstance(other, _StructureKey) and self.fingerprint == other.fingerprint
+        )
+
+
+@lru_cache(maxsize=32)
+def _load_potcar(symbols: tuple[str, ...], functional: str):
+    """Get POTCARs from the registry and find those not matching the functional."""
+    potcar = POTCAR_REGISTRY.get_potcar(symbols, functional)
+    unmatched = []
+    for symbol in symbols:
+        info = POTCAR_REGISTRY.get_info(symbol, functional)
+        if functional not in info.functionals:
+            unmatched.append((info.symbol, info.functionals))
+    return potcar, tuple(unmatched)
+
+
+def _get_line_mode_kpoints(structure_key: _StructureKey, line_density, kpath_kwargs):
+    """Get the fractional k-points and labels along the high-symmetry path."""
+    frac_k_points, labels = _get_line_mode_kpoints_cached(
+        structure_key, line_density, kpath_kwargs
+    )
+    return deepcopy(frac_k_points), list(labels)
+
+
+@lru_cache(maxsize=32)
+def _get_line_mode_kpoints_cached(
+    structure_key: _StructureKey, line_density, kpath_kwargs: str
+):
+    kpath = HighSymmKpath(structure_key.structure, **json.loads(kpath_kwargs))
+    return kpath.get_kpoints(line_density=line_density, coords_are_cartesian=False)
+
+
+def _get_ir_reciprocal_mesh(
+    structure_key: _StructureKey, mesh: tuple[int, ...], symprec: float | None
+):
+    """Get the irreducible k-points and weights for a uniform mesh."""
+    if symprec is None:
+        from atomate2 import SETTINGS
+
+        symprec = SETTINGS.SYMPREC
+
+    return deepcopy(_get_ir_reciprocal_mesh_cached(structure_key, mesh, symprec))
+
+
+@lru_cache(maxsize=32)
+def _get_ir_reciprocal_mesh_cached(
+    structure_key: _StructureKey, mesh: tuple[int, ...], symprec: float
+):
+    sga = SpacegroupAnalyzer(structure_key.structure, symprec=symprec)
+    return sga.get_ir_reciprocal_mesh(mesh)
+
+
+def _copy_input_set(input_set: VaspInputSet) -> VaspInputSet:
+    """Copy an input set, sharing the (read-only) POTCAR data."""
+    if isinstance(input_set.potcar, Potcar):
+        potcar = Potcar(functional=input_set.potcar.functional)
+        potcar.extend(input_set.potcar)
+    else:
+        potcar = list(input_set.potcar)
+
+    return VaspInputSet(
+        incar=deepcopy(input_set.incar),
+        kpoints=deepcopy(input_set.kpoints),
+        poscar=deepcopy(input_set.poscar),
+        potcar=potcar,
+        optional_files=deepcopy(input_set.optional_files),
+    )
+
+
 def _get_kspacing(bandgap: float) -> float:
     """Get KSPACING based on a band gap."""
     if bandgap == 0:
@@ -1041,6 +1206,44 @@ def _combine_kpoints(*kpoints_objects: Kpoints):
     )
 
 
+def _get_bandgap(vasprun: Vasprun) -> float:
+    """Get the band gap from the eigenvalue occupations, zero for metals."""
+    # this avoids constructing a full band structure object, which is slow for
+    # calculations with many k-points
+    bandgap = vasprun.eigenvalue_band_properties[0]
+    return max(bandgap, 0)
+
+
+class _LazyVaspOutputs:
+    """Parse the vasprun.xml and OUTCAR files in a directory on first use."""
+
+    def __init__(self, directory: str | Path):
+        self.directory = directory
+        self._outputs: dict[str, Any] | None = None
+
+    def get(self, name: str):
+        if self._outputs is None:
+            vasprun, outcar = get_vasprun_outcar(self.directory, parse_dos=False)
+            if vasprun.efermi is None:
+                # VASP doesn't output efermi in vasprun if IBRION = 1
+                vasprun.efermi = outcar.efermi
+            self._outputs = {"vasprun": vasprun, "outcar": outcar}
+        return self._outputs[name]
+
+
+class _LazyOutput:
+    """Proxy for a Vasprun or Outcar object that is only parsed when accessed."""
+
+    def __init__(self, outputs: _LazyVaspOutputs, name: str):
+        self._lazy_outputs = outputs
+        self._lazy_name = name
+
+    def __getattr__(self, attr: str):
+        if attr.startswith("_lazy"):
+            raise AttributeError(attr)
+        return getattr(self._lazy_outputs.get(self._lazy_name), attr)
+
+
 def _get_ispin(vasprun: Vasprun | None, outcar: Outcar | None):
     """Get value of ISPIN depending on the magnetisation in the OUTCAR and vasprun."""
     if outcar is not None and outcar.magnetization is not None:
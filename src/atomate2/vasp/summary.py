@@ -0,0 +1,234 @@
+"""Compact summaries of VASP calculations for fast reuse by downstream jobs."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import re
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from monty.io import zopen
+from monty.json import MontyDecoder, jsanitize
+
+if TYPE_CHECKING:
+    from pymatgen.core import Structure
+
+    from atomate2.vasp.schemas.task import TaskDocument
+
+logger = logging.getLogger(__name__)
+
+__all__ = [
+    "SUMMARY_FILENAME",
+    "SUMMARY_VERSION",
+    "write_vasp_summary",
+    "load_vasp_summary",
+    "get_summary_structure",
+    "get_summary_task_document",
+]
+
+SUMMARY_FILENAME = "vasp_summary.json"
+SUMMARY_VERSION = 2
+
+
+def write_vasp_summary(
+    task_doc: TaskDocument,
+    directory: str | Path = ".",
+    include_task_document: bool = False,
+    hash_files: bool = False,
+    max_hash_size: int = 100_000_000,
+) -> dict[str, Any]:
+    """
+    Write a summary of a VASP calculation to a gzipped JSON sidecar file.
+
+    The summary contains the information most often needed by downstream jobs (final
+    structure, INCAR, KPOINTS, energies, band gap, Fermi level, forces, stress, magnetic
+    moments and the number of SCF steps in the first ionic step) along with a manifest
+    of the sizes and modification times of the files in the directory. This means they
+    do not need to re-parse the vasprun.xml and OUTCAR files. The file is already
+    compressed so it is skipped when the directory is gzipped.
+
+    Parameters
+    ----------
+    task_doc
+        The task document of the calculation.
+    directory
+        The directory to write the summary to.
+    include_task_document
+        Whether to include the task document (without the large VASP objects such as
+        the band structure and volumetric data) in the summary. This includes all
+        calculations and ionic steps, so can make the summary much larger.
+    hash_files
+        Whether to include the sha256 hash of each file in the file manifest. Note that
+        this reads every file in the directory.
+    max_hash_size
+        Files larger than this size in bytes are not hashed, if ``hash_files`` is set.
+
+    Returns
+    -------
+    dict
+        The summary.
+    """
+    directory = Path(directory)
+    calc = task_doc.calcs_reversed[0]
+
+    # the final structure in the task document is from the CONTCAR with the magnetic
+    # moments from the OUTCAR added as a site property
+    structure = calc.output.structure.copy()
+    magmoms = structure.site_properties.get("magmom", [])
+    if "magmom" in structure.site_properties:
+        structure.remove_site_property("magmom")
+
+    # the number of SCF steps needed from the initial wavefunctions is used to record
+    # the savings of calculations warm started from this one
+    first_ionic_steps = task_doc.calcs_reversed[-1].output.ionic_steps
+    initial_scf_steps = None
+    if first_ionic_steps and first_ionic_steps[0].electronic_steps is not None:
+        initial_scf_steps = len(first_ionic_steps[0].electronic_steps)
+
+    files = _get_file_manifest(directory, max_hash_size if hash_files else None)
+    relax_extension = _get_relax_extension(files)
+    summary = {
+        "version": SUMMARY_VERSION,
+        "structure": structure,
+        "incar": calc.input.incar,
+        "kpoints": _get_kpoints(directory, files, relax_extension),
+        "energy": task_doc.output.energy,
+        "energy_per_atom": task_doc.output.energy_per_atom,
+        "efermi": calc.output.efermi,
+        "bandgap": calc.output.bandgap,
+        "is_metal": calc.output.is_metal,
+        "forces": task_doc.output.forces,
+        "stress": task_doc.output.stress,
+        "magmoms": magmoms,
+        "initial_scf_steps": initial_scf_steps,
+        "relax_extension": relax_extension,
+        "files": files,
+    }
+
+    if include_task_document:
+        summary["task_document"] = task_doc.copy(update={"vasp_objects": {}})
+
+    # remove any uncompressed summary copied from a previous calculation so it does
+    # not overwrite this one when the directory is gzipped
+    (directory / SUMMARY_FILENAME).unlink(missing_ok=True)
+    with zopen(directory / f"{SUMMARY_FILENAME}.gz", "wt") as f:
+        json.dump(jsanitize(summary, strict=True, enum_values=True), f)
+    return summary
+
+
+def load_vasp_summary(directory: str | Path = ".") -> dict[str, Any] | None:
+    """
+    Load the summary of a VASP calculation written by :obj:`write_vasp_summary`.
+
+    The summary is returned as plain JSON data. Use :obj:`get_summary_structure` and
+    :obj:`get_summary_task_document` to decode the structure and task document.
+
+    Parameters
+    ----------
+    directory
+        The directory containing the (optionally gzipped) summary file.
+
+    Returns
+    -------
+    dict or None
+        The summary or ``None`` if no summary file exists, it cannot be read, or it was
+        written with an unsupported version.
+    """
+    directory = Path(directory)
+    for filename in (SUMMARY_FILENAME, f"{SUMMARY_FILENAME}.gz"):
+        if not (directory / filename).exists():
+            continue
+
+        try:
+            with zopen(directory / filename, "rt") as f:
+                summary = json.load(f)
+        except Exception:
+            logger.warning(f"Could not read VASP summary in {directory}")
+            return None
+
+        if summary.get("version") != SUMMARY_VERSION:
+            logger.info(f"Ignoring VASP summary with version {summary.get('version')}")
+            return None
+        return summary
+    return None
+
+
+def get_summary_structure(summary: dict[str, Any]) -> Structure:
+    """
+    Get the final structure from a VASP summary.
+
+    Parameters
+    ----------
+    summary
+        A summary loaded using :obj:`load_vasp_summary`.
+
+    Returns
+    -------
+    Structure
+        The final structure (from the CONTCAR).
+    """
+    from pymatgen.core import Structure
+
+    return Structure.from_dict(summary["structure"])
+
+
+def get_summary_task_document(summary: dict[str, Any]) -> TaskDocument | None:
+    """
+    Get the task document from a VASP summary.
+
+    Parameters
+    ----------
+    summary
+        A summary loaded using :obj:`load_vasp_summary`.
+
+    Returns
+    -------
+    TaskDocument or None
+        The task document (without VASP objects) or ``None`` if it was not included
+        in the summary.
+    """
+    if summary.get("task_document") is None:
+        return None
+    return MontyDecoder().process_decoded(summary["task_document"])
+
+
+def _get_file_manifest(directory: Path, max_hash_size: int | None) -> dict[str, dict]:
+    """Get the size, modification time and sha256 hash of the files in a directory."""
+    manifest = {}
+    for path in sorted(directory.iterdir()):
+        if not path.is_file() or path.name.startswith(SUMMARY_FILENAME):
+            continue
+
+        stat = path.stat()
+        size = stat.st_size
+        sha256 = None
+        if max_hash_size is not None and size <= max_hash_size:
+            file_hash = hashlib.sha256()
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 20), b""):
+                    file_hash.update(chunk)
+            sha256 = file_hash.hexdigest()
+        manifest[path.name] = {"size": size, "mtime": stat.st_mtime, "sha256": sha256}
+    return manifest
+
+
+def _get_relax_extension(files: dict[str, dict]) -> str:
+    """Get the largest numbered relax extension from a file manifest."""
+    numbers = [m.group(1) for m in map(re.compile(r".relax(\d+)").search, files) if m]
+    if len(numbers) == 0:
+        return ""
+    return f".relax{max(numbers, key=int)}"
+
+
+def _get_kpoints(
+    directory: Path, files: dict[str, dict], relax_extension: str
+) -> dict | None:
+    """Get the KPOINTS file of the final calculation, if any, as a dict."""
+    from pymatgen.io.vasp import Kpoints
+
+    for name in (f"KPOINTS{relax_extension}", f"KPOINTS{relax_extension}.gz"):
+        if name in files:
+            return Kpoints.from_file(directory / name).as_dict()
+    return None
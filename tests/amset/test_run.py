@@ -0,0 +1,45 @@
+def test_get_convergence_error():
+    import pytest
+
+    from atomate2.amset.run import get_convergence_error, get_transport_averages
+
+    old_transport = {"seebeck": [[[[100, 0, 0], [0, 100, 0], [0, 0, 100]]]]}
+    new_transport = {"seebeck": [[[[110, 0, 0], [0, 110, 0], [0, 0, 110]]]]}
+    old_averages = get_transport_averages(old_transport)
+    new_averages = get_transport_averages(new_transport)
+    assert list(new_averages) == ["seebeck"]
+    assert new_averages["seebeck"][0][0] == pytest.approx(110)
+
+    error = get_convergence_error(new_averages, old_averages)
+    assert error == pytest.approx(10 / 110)
+    assert get_convergence_error(new_averages, {}) is None
+
+
+def test_get_next_interpolation_factor():
+    from atomate2.amset.run import get_next_interpolation_factor
+
+    history = [{"interpolation_factor": 10, "error": None}]
+    assert get_next_interpolation_factor(history) == 15
+
+    # error ~ 1/factor: 0.3 at 15 needs a factor of 45, limited to doubling
+    history.append({"interpolation_factor": 15, "error": 0.3})
+    assert get_next_interpolation_factor(history) == 30
+
+    # the order of convergence is fit to the last two errors
+    history.append({"interpolation_factor": 25, "error": 0.15})
+    assert get_next_interpolation_factor(history) == 34
+
+    # increasing errors take the largest step allowed
+    history[-1]["error"] = 0.4
+    assert get_next_interpolation_factor(history) == 50
+
+
+def test_run_amset_sweep_failure(tmp_dir):
+    import pytest
+
+    from atomate2.amset.run import run_amset_sweep
+
+    # the sweep fails without a settings.yaml file, and its errors are reported
+    with pytest.raises(RuntimeError, match="AMSET sweep failed") as exc_info:
+        run_amset_sweep([{"doping": [1e18]}])
+    assert "Traceback" in str(exc_info.value)
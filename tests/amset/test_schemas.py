@@ -0,0 +1,31 @@
+def test_read_vasprun_structure(test_dir):
+    from pymatgen.io.vasp import Vasprun
+
+    from atomate2.amset.schemas import _read_vasprun_structure
+
+    vasprun_file = test_dir / "vasp/Si_band_structure/static/outputs/vasprun.xml.gz"
+    structure = _read_vasprun_structure(vasprun_file)
+    assert structure == Vasprun(vasprun_file).initial_structure
+
+
+def test_mesh_data():
+    import numpy as np
+
+    from atomate2.amset.schemas import MeshData
+    from atomate2.common.schemas.math import ChunkedArray
+
+    rng = np.random.default_rng(0)
+    mesh = {
+        "energies": {"up": rng.random((4, 10))},
+        "scattering_rates": {"up": rng.random((2, 3, 1, 4, 10))},
+        "ir_kpoints": rng.random((10, 3)),
+        "vb_idx": {"up": 1},
+    }
+    mesh_data = MeshData(**MeshData.from_mesh(mesh).dict())
+    assert isinstance(mesh_data.energies["up"], ChunkedArray)
+    assert mesh_data.shapes["scattering_rates.up"] == [2, 3, 1, 4, 10]
+    assert np.array_equal(mesh_data.get_array("energies", "up"), mesh["energies"]["up"])
+    assert np.array_equal(mesh_data.get_array("ir_kpoints"), mesh["ir_kpoints"])
+
+    rates = mesh_data.get_scattering_rates("up", 2, 0)
+    assert np.array_equal(rates, mesh["scattering_rates"]["up"][:, 2, 0])
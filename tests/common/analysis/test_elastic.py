@@ -0,0 +1,151 @@
+def test_symmetry_reduced_deformations(si_structure):
+    import numpy as np
+    from pymatgen.analysis.elasticity import Deformation, Strain, Stress
+    from pymatgen.core import Lattice, Structure
+    from pymatgen.core.tensors import symmetry_reduce
+
+    from atomate2.common.analysis.elastic import (
+        expand_deformations,
+        get_default_strain_states,
+        get_symmetry_reduced_deformations,
+    )
+
+    deformations = []
+    for state in get_default_strain_states(2):
+        for magnitude in (-0.01, -0.005, 0.005, 0.01):
+            strain = Strain.from_voigt(magnitude * np.array(state))
+            deformations.append(strain.get_deformation_matrix())
+
+    # the Si.cif lattice is not in the standard orientation, so the Cartesian
+    # rotations do not map the normal strains onto each other
+    reduced, _ = get_symmetry_reduced_deformations(deformations, si_structure)
+    assert len(reduced) == len(symmetry_reduce(deformations, si_structure))
+
+    structure = Structure.from_spacegroup(
+        "Fd-3m", Lattice.cubic(5.47), ["Si"], [[0, 0, 0]]
+    )
+    reduced, symmetry_map = get_symmetry_reduced_deformations(deformations, structure)
+    assert len(reduced) == 6
+    assert len(reduced) == len(symmetry_reduce(deformations, structure))
+    assert len(symmetry_map["images"]) == len(reduced)
+
+    stresses = [Stress(np.eye(3)) for _ in reduced]
+    uuids = [str(i) for i in range(len(reduced))]
+    full_deformations, full_stresses, full_uuids, _ = expand_deformations(
+        reduced, stresses, uuids, uuids, symmetry_map
+    )
+
+    # all of the original independent deformations should be recovered; only these
+    # are used when fitting the tensor
+    for deformation in deformations:
+        if Deformation(deformation).is_independent():
+            assert any(np.allclose(deformation, d) for d in full_deformations)
+    assert len(full_stresses) == len(full_uuids) == len(full_deformations)
+
+
+def test_is_born_stable():
+    import numpy as np
+
+    from atomate2.common.analysis.elastic import is_born_stable
+
+    tensor = np.zeros((6, 6))
+    tensor[:3, :3] = 54.9
+    tensor[np.diag_indices(3)] = 155.8
+    tensor[3:, 3:] = np.eye(3) * 31.5
+    assert is_born_stable(tensor)
+
+    tensor[3, 3] = -1
+    assert not is_born_stable(tensor)
+
+
+def test_vectorised_strains_and_stresses():
+    import numpy as np
+    from pymatgen.analysis.elasticity import Deformation, Stress
+
+    from atomate2.common.analysis.elastic import (
+        get_green_lagrange_strains,
+        get_pk2_stresses,
+    )
+
+    rng = np.random.default_rng(0)
+    deformations = []
+    stresses = []
+    for _ in range(5):
+        deformations.append(Deformation(np.eye(3) + 0.01 * rng.random((3, 3))))
+        stress = rng.random((3, 3))
+        stresses.append(Stress(stress + stress.T))
+
+    strains = get_green_lagrange_strains(deformations)
+    pk_stresses = get_pk2_stresses(stresses, deformations)
+
+    for i, (stress, deformation) in enumerate(zip(stresses, deformations)):
+        assert np.allclose(strains[i], deformation.green_lagrange_strain)
+        assert np.allclose(pk_stresses[i], stress.piola_kirchoff_2(deformation))
+
+
+def test_fit_elastic_tensor_least_squares():
+    import numpy as np
+    from pymatgen.analysis.elasticity import (
+        ElasticTensor,
+        ElasticTensorExpansion,
+        Strain,
+    )
+    from pymatgen.core import Lattice, Structure
+    from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
+
+    from atomate2.common.analysis.elastic import (
+        fit_elastic_tensor_least_squares,
+        get_default_strain_states,
+        get_symmetry_adapted_basis,
+    )
+
+    # the cubic tensor is only invariant under the rotations of a cell in the standard
+    # orientation
+    structure = Structure.from_spacegroup(
+        "Fd-3m", Lattice.cubic(5.47), ["Si"], [[0, 0, 0]]
+    )
+    sga = SpacegroupAnalyzer(structure)
+    rotations = [op.rotation_matrix for op in sga.get_symmetry_operations(True)]
+
+    voigt = np.zeros((6, 6))
+    voigt[:3, :3] = 54.9
+    voigt[np.diag_indices(3)] = 155.8
+    voigt[3:, 3:] = np.eye(3) * 31.5
+    tensor = ElasticTensor.from_voigt(voigt)
+
+    strains = []
+    for state in get_default_strain_states(2):
+        for magnitude in (-0.01, -0.005, 0.005, 0.01):
+            strains.append(Strain.from_voigt(magnitude * np.array(state)))
+    stresses = [tensor.calculate_stress(strain) for strain in strains]
+
+    assert len(get_symmetry_adapted_basis(2, rotations)) == 3
+    assert len(get_symmetry_adapted_basis(2)) == 21
+
+    result, info = fit_elastic_tensor_least_squares(
+        strains, stresses, rotations=rotations
+    )
+    assert np.allclose(result.voigt, voigt, atol=1e-3)
+    assert info["ncomponents"] == 3
+    assert info["residual"] < 1e-6
+
+    # third order expansion with a cubic third order tensor
+    basis = get_symmetry_adapted_basis(3, rotations)
+    assert len(basis) == 6
+    voigt3 = np.tensordot([-500, -300, 100, -200, 50, -80], basis, axes=1)
+    expansion = ElasticTensorExpansion.from_voigt([voigt, voigt3])
+
+    strains = []
+    for state in get_default_strain_states(3):
+        for magnitude in (-0.01, -0.005, 0.005, 0.01):
+            strains.append(Strain.from_voigt(magnitude * np.array(state)))
+    stresses = [expansion.calculate_stress(strain) for strain in strains]
+
+    result, info = fit_elastic_tensor_least_squares(
+        strains, stresses, order=3, rotations=rotations
+    )
+    assert isinstance(result, ElasticTensorExpansion)
+    assert np.allclose(result[0].voigt, voigt, atol=1e-3)
+    assert np.allclose(result[1].voigt, voigt3, atol=1e-3)
+    assert info["ncomponents"] == 9
+    assert info["residual"] < 1e-6
@@ -8,3 +8,75 @@ def test_elastic_document(test_dir):
     schema_ref = json.loads(schema_path.read_text())
 
     ElasticDocument(**schema_ref)
+
+
+def test_packed_fitting_data():
+    import numpy as np
+
+    from atomate2.common.schemas.elastic import FittingData
+    from atomate2.common.schemas.math import PackedArray
+
+    strains = np.random.default_rng(0).random((10, 3, 3))
+    fitting_data = FittingData(strains=PackedArray.from_array(strains))
+    fitting_data = FittingData(**fitting_data.dict())
+    assert np.array_equal(fitting_data.get_array("strains"), strains)
+
+    # unpacked arrays can be modified in place
+    fitting_data.get_array("strains")[0] = 0
+
+
+def test_third_order_elastic_document():
+    import numpy as np
+    from pymatgen.analysis.elasticity import ElasticTensorExpansion, Strain
+    from pymatgen.core import Lattice, Structure
+
+    from atomate2.common.analysis.elastic import get_default_strain_states
+    from atomate2.common.schemas.elastic import ElasticDocument
+
+    structure = Structure.from_spacegroup(
+        "Fd-3m", Lattice.cubic(5.47), ["Si"], [[0, 0, 0]]
+    )
+    voigt = np.zeros((6, 6))
+    voigt[:3, :3] = 54.9
+    voigt[np.diag_indices(3)] = 155.8
+    voigt[3:, 3:] = np.eye(3) * 31.5
+    voigt3 = np.zeros((6, 6, 6))
+    voigt3[0, 0, 0] = voigt3[1, 1, 1] = voigt3[2, 2, 2] = -500
+    expansion = ElasticTensorExpansion.from_voigt([voigt, voigt3])
+
+    # Cauchy stresses in the VASP convention (kBar, opposite sign); no symmetry is
+    # used so all 77 independent components are fitted
+    deformations = []
+    stresses = []
+    for state in get_default_strain_states(3):
+        for magnitude in (-0.01, -0.005, 0.005, 0.01):
+            strain = Strain.from_voigt(magnitude * np.array(state))
+            deformation = strain.get_deformation_matrix()
+            pk2_stress = expansion.calculate_stress(strain)
+            cauchy = deformation @ pk2_stress @ deformation.T / deformation.det
+            deformations.append(deformation)
+            stresses.append(-10 * cauchy)
+
+    doc = ElasticDocument.from_stresses(
+        structure,
+        stresses,
+        deformations,
+        [str(i) for i in range(len(stresses))],
+        [str(i) for i in range(len(stresses))],
+        fitting_method="least_squares",
+        order=3,
+        symprec=None,
+    )
+    assert doc.order == 3
+    assert doc.fitting_residual < 1e-6
+    assert np.allclose(doc.elastic_tensor.raw, voigt, atol=1e-2)
+    assert np.shape(doc.elastic_tensor.ieee_format) == (6, 6)
+    assert len(doc.elastic_tensor.higher_order_raw) == 1
+    raw3 = doc.elastic_tensor.higher_order_raw[0].to_array()
+    assert np.allclose(raw3, voigt3, atol=1e-1)
+    assert doc.elastic_tensor.higher_order_ieee_format[0].to_array().shape == (6, 6, 6)
+    assert doc.derived_properties.k_vrh > 0
+
+    # the document can be serialized and restored
+    doc = ElasticDocument(**doc.dict())
+    assert np.allclose(doc.elastic_tensor.higher_order_raw[0].to_array(), raw3)
@@ -0,0 +1,12 @@
+def test_chunked_array():
+    import numpy as np
+
+    from atomate2.common.schemas.math import ChunkedArray
+
+    array = np.random.default_rng(0).random((2, 3, 4, 5))
+    chunked = ChunkedArray.from_array(array, chunk_ndim=2)
+    assert len(chunked.chunks) == 6
+
+    chunked = ChunkedArray(**chunked.dict())
+    assert np.array_equal(chunked.to_array(), array)
+    assert np.array_equal(chunked.get_chunk(1, 2), array[1, 2])
@@ -70,3 +70,25 @@ def test_retrieve_structure_from_materials_project():
     output = responses[job.uuid][1].output
 
     assert "magmom" not in output.site_properties
+
+
+def test_get_output_collector(si_structure):
+    from jobflow import Flow, run_locally
+
+    from atomate2.common.jobs import (
+        get_output_collector,
+        structure_to_conventional,
+        structure_to_primitive,
+    )
+
+    jobs = [
+        structure_to_primitive(si_structure),
+        structure_to_conventional(si_structure),
+    ]
+    collector = get_output_collector({"lattices": [j.output.lattice for j in jobs]})
+
+    responses = run_locally(Flow([*jobs, collector]), ensure_success=True)
+    lattices = responses[collector.uuid][1].output["lattices"]
+
+    assert lattices[0].alpha == approx(60)
+    assert lattices[1].alpha == approx(90)
@@ -0,0 +1,90 @@
+import subprocess
+import sys
+
+import pytest
+
+# maximum fraction of the time taken to import a module that may be spent executing
+# atomate2's own modules (the rest is spent importing dependencies). Measuring relative
+# to the dependencies makes the check independent of the speed of the machine.
+IMPORT_TIME_FRACTION = 0.25
+
+# job and flow modules that should not pull in optional dependencies or the settings
+JOB_MODULES = (
+    "atomate2.vasp.jobs.core",
+    "atomate2.vasp.jobs.amset",
+    "atomate2.vasp.jobs.elastic",
+    "atomate2.vasp.jobs.phonons",
+    "atomate2.vasp.flows.core",
+    "atomate2.vasp.flows.amset",
+    "atomate2.vasp.flows.elastic",
+    "atomate2.vasp.flows.phonons",
+)
+
+
+def _get_import_times(statement: str) -> dict:
+    """Get self and cumulative import times (in seconds) using python -X importtime."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+
+        self_time, cumulative, name = line[len("import time:") :].split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = (int(self_time) / 1e6, int(cumulative) / 1e6)
+    return times
+
+
+def _run(statement: str) -> str:
+    """Run a statement in a new interpreter and return the standard output."""
+    result = subprocess.run(
+        [sys.executable, "-c", statement], capture_output=True, text=True, check=True
+    )
+    return result.stdout
+
+
+def _get_imported_modules(statement: str) -> set:
+    """Get the top-level modules imported by a statement."""
+    stdout = _run(f"{statement}; import sys; print(' '.join(sys.modules))")
+    return {module.split(".")[0] for module in stdout.split()}
+
+
+@pytest.mark.parametrize("module", ["atomate2", "atomate2.vasp.jobs.core"])
+def test_import_time(module):
+    times = _get_import_times(f"import {module}")
+
+    own_time = sum(t for name, (t, _) in times.items() if name.startswith("atomate2"))
+    assert own_time < IMPORT_TIME_FRACTION * times[module][1]
+
+
+def test_lazy_imports():
+    modules = _get_imported_modules("import atomate2")
+    assert "pydantic" not in modules
+    assert "pymatgen" not in modules
+
+    modules = _get_imported_modules("import atomate2.vasp.run")
+    assert "custodian" not in modules
+
+    for module in JOB_MODULES:
+        modules = _get_imported_modules(f"import {module}")
+        assert "custodian" not in modules, module
+        assert "phonopy" not in modules, module
+
+
+def test_lazy_settings():
+    import atomate2
+    from atomate2.settings import Atomate2Settings
+
+    assert isinstance(atomate2.SETTINGS, Atomate2Settings)
+    assert atomate2.SETTINGS is atomate2.SETTINGS
+
+    # importing jobs and flows should not load the settings
+    for module in JOB_MODULES:
+        stdout = _run(f"import atomate2, {module}; print('SETTINGS' in vars(atomate2))")
+        assert stdout.strip() == "False", module
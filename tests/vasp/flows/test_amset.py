@@ -0,0 +1,36 @@
+def test_amset_sweep_flow(si_structure):
+    from atomate2.vasp.flows.amset import VaspAmsetMaker
+
+    variants = [{"doping": [1e18]}, {"doping": [1e19], "scissor": 0.5}]
+    flow = VaspAmsetMaker(amset_variants=variants, use_hse_gap=False).make(si_structure)
+
+    amset, sweep = flow.jobs[-2:]
+    assert amset.name == "amset"
+    assert sweep.name == "amset sweep"
+    assert sweep.function_args[1] == variants
+    assert sweep.function_kwargs["prev_amset_dir"].uuid == amset.uuid
+    assert flow.output.uuid == sweep.uuid
+
+
+def test_deformation_potential_flow(si_structure):
+    from jobflow import OutputReference
+
+    from atomate2.vasp.flows.amset import DeformationPotentialMaker
+
+    maker = DeformationPotentialMaker()
+    flow = maker.make(si_structure)
+
+    bulk, deformations, potentials = flow.jobs
+    assert bulk.name == "bulk static deformation"
+    assert potentials.function_args[1].uuid == deformations.uuid
+
+    # the deformations are calculated on the k-point mesh of the bulk calculation
+    deformation_maker = deformations.function_kwargs["static_deformation_maker"]
+    kpoints = deformation_maker.input_set_generator.user_kpoints_settings
+    assert isinstance(kpoints, OutputReference)
+    assert kpoints.uuid == bulk.uuid
+    assert kpoints.attributes == (("a", "orig_inputs"), ("i", "kpoints"))
+
+    # the maker itself is not modified
+    generator = maker.static_deformation_maker.input_set_generator
+    assert not isinstance(generator.user_kpoints_settings, OutputReference)
@@ -63,3 +63,164 @@ def test_elastic(mock_vasp, clean_dir, si_structure):
         ],
         atol=1e-3,
     )
+
+
+def test_elastic_adaptive(vasp_test_dir, si_structure):
+    import pytest
+    from jobflow import Flow, Response
+    from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
+
+    from atomate2.common.schemas.elastic import ElasticDocument
+    from atomate2.vasp.flows.elastic import ElasticMaker
+    from atomate2.vasp.jobs.elastic import (
+        fit_elastic_tensor_adaptive,
+        generate_elastic_deformations,
+        generate_elastic_symmetry_map,
+    )
+    from atomate2.vasp.schemas.task import TaskDocument
+
+    si_prim = SpacegroupAnalyzer(si_structure).get_primitive_standard_structure()
+
+    flow = ElasticMaker(adaptive=True, bulk_relax_maker=None).make(si_prim)
+    assert flow.jobs[0].function_kwargs["strain_magnitudes"] == [-0.01, 0.01]
+    assert flow.jobs[-1].name == "fit_elastic_tensor_adaptive"
+    assert flow.jobs[1].name == "generate_elastic_symmetry_map"
+
+    # the symmetry map is only generated when reducing the deformations
+    flow = ElasticMaker(bulk_relax_maker=None, sym_reduce=False).make(si_prim)
+    assert "generate_elastic_symmetry_map" not in [j.name for j in flow.jobs]
+
+    # a single pair of strain magnitudes cannot determine a 3rd order tensor
+    with pytest.raises(ValueError, match="non-zero strain magnitudes"):
+        ElasticMaker(adaptive=True, order=3).make(si_prim)
+
+    # use the outputs of the standard elastic workflow as the first batch
+    deformations = generate_elastic_deformations.original(si_prim)
+    symmetry_map = generate_elastic_symmetry_map.original(si_prim)
+    assert len(symmetry_map["images"]) == len(deformations)
+    deformation_data = []
+    for i, deformation in enumerate(deformations):
+        job_dir = vasp_test_dir / "Si_elastic" / f"elastic_relax_{i + 1}_6" / "outputs"
+        task_doc = TaskDocument.from_directory(job_dir)
+        deformation_data.append(
+            {
+                "stress": task_doc.output.stress,
+                "deformation": deformation,
+                "uuid": str(i),
+                "job_dir": str(job_dir),
+            }
+        )
+
+    # the fit is converged so no further deformations are calculated
+    response = fit_elastic_tensor_adaptive.original(
+        si_prim,
+        deformation_data,
+        [[-0.005, 0.005]],
+        symmetry_map=symmetry_map,
+    )
+    assert isinstance(response, ElasticDocument)
+    assert response.elastic_tensor.ieee_format[0][0] == pytest.approx(155.79, abs=0.1)
+
+    # an unreachable tolerance requires the next batch of strain magnitudes
+    response = fit_elastic_tensor_adaptive.original(
+        si_prim,
+        deformation_data,
+        [[-0.005, 0.005], [-0.0075, 0.0075]],
+        symmetry_map=symmetry_map,
+        residual_tol=-1,
+    )
+    assert isinstance(response, Response)
+    assert isinstance(response.replace, Flow)
+    generate_job, symmetry_map_job, _, fit_job = response.replace.jobs
+    assert generate_job.function_kwargs["strain_magnitudes"] == [-0.005, 0.005]
+    assert symmetry_map_job.function_kwargs["strain_magnitudes"] == [-0.005, 0.005]
+    assert fit_job.function_kwargs["symmetry_map"] == symmetry_map_job.output
+    assert fit_job.function_args[2] == [[-0.0075, 0.0075]]
+    assert fit_job.function_kwargs["previous_deformation_data"] == deformation_data
+
+    # once the strain magnitudes are exhausted, the current fit is returned
+    response = fit_elastic_tensor_adaptive.original(
+        si_prim,
+        deformation_data,
+        [],
+        symmetry_map=symmetry_map,
+        residual_tol=-1,
+    )
+    assert isinstance(response, ElasticDocument)
+
+
+def test_elastic_adaptive_third_order():
+    import numpy as np
+    from jobflow import Flow, Response
+    from pymatgen.analysis.elasticity import ElasticTensorExpansion, Strain
+    from pymatgen.core import Lattice, Structure
+    from pymatgen.symmetry.analyzer import SpacegroupAnalyzer
+
+    from atomate2.common.analysis.elastic import get_symmetry_adapted_basis
+    from atomate2.common.schemas.elastic import ElasticDocument
+    from atomate2.vasp.jobs.elastic import (
+        fit_elastic_tensor_adaptive,
+        generate_elastic_deformations,
+        generate_elastic_symmetry_map,
+    )
+
+    # a cubic 3rd order expansion, in the standard orientation of the structure
+    structure = Structure.from_spacegroup(
+        "Fd-3m", Lattice.cubic(5.47), ["Si"], [[0, 0, 0]]
+    )
+    sga = SpacegroupAnalyzer(structure)
+    rotations = [op.rotation_matrix for op in sga.get_symmetry_operations(True)]
+    voigt = np.zeros((6, 6))
+    voigt[:3, :3] = 54.9
+    voigt[np.diag_indices(3)] = 155.8
+    voigt[3:, 3:] = np.eye(3) * 31.5
+    basis = get_symmetry_adapted_basis(3, rotations)
+    voigt3 = np.tensordot([-500, -300, 100, -200, 50, -80], basis, axes=1)
+    expansion = ElasticTensorExpansion.from_voigt([voigt, voigt3])
+
+    magnitudes = [-0.01, -0.005, 0.005, 0.01]
+    deformations = generate_elastic_deformations.original(
+        structure, order=3, strain_magnitudes=magnitudes
+    )
+    symmetry_map = generate_elastic_symmetry_map.original(
+        structure, order=3, strain_magnitudes=magnitudes
+    )
+    deformation_data = []
+    for i, deformation in enumerate(deformations):
+        # Cauchy stresses in the VASP convention (kBar, opposite sign)
+        strain = Strain.from_deformation(deformation)
+        pk2_stress = expansion.calculate_stress(strain)
+        cauchy = deformation @ pk2_stress @ deformation.T / deformation.det
+        deformation_data.append(
+            {
+                "stress": (-10 * cauchy).tolist(),
+                "deformation": deformation,
+                "uuid": str(i),
+                "job_dir": str(i),
+            }
+        )
+
+    kwargs = {
+        "order": 3,
+        "fitting_method": "least_squares",
+        "symmetry_map": symmetry_map,
+    }
+    response = fit_elastic_tensor_adaptive.original(
+        structure, deformation_data, [[-0.02, 0.02]], **kwargs
+    )
+    assert isinstance(response, ElasticDocument)
+    assert response.order == 3
+    assert np.allclose(response.elastic_tensor.raw, voigt, atol=1e-2)
+    raw3 = response.elastic_tensor.higher_order_raw[0].to_array()
+    assert np.allclose(raw3, voigt3, atol=1e-1)
+
+    # the next batch is also generated for a 3rd order expansion
+    response = fit_elastic_tensor_adaptive.original(
+        structure, deformation_data, [[-0.02, 0.02]], residual_tol=-1, **kwargs
+    )
+    assert isinstance(response, Response)
+    assert isinstance(response.replace, Flow)
+    generate_job, symmetry_map_job, _, fit_job = response.replace.jobs
+    assert generate_job.function_kwargs["order"] == 3
+    assert symmetry_map_job.function_kwargs["order"] == 3
+    assert fit_job.function_kwargs["order"] == 3
@@ -69,3 +69,29 @@ def test_elph_renormalisation(mock_vasp, clean_dir, si_structure):
         -0.488900000000001,
         -0.48850000000000104,
     }
+
+
+def test_elph_warm_start(si_structure):
+    from atomate2.vasp.flows.elph import ElectronPhononMaker
+    from atomate2.vasp.jobs.elph import run_elph_displacements
+    from atomate2.vasp.sets.core import StaticSetGenerator
+
+    flow = ElectronPhononMaker(relax_maker=None, warm_start=True).make(si_structure)
+    bulk_static = flow.jobs[2].jobs[0]
+    displacements = flow.jobs[3]
+    assert displacements.function_kwargs["warm_start_dir"].uuid == bulk_static.uuid
+
+    response = run_elph_displacements.original(
+        [0, 100],
+        [si_structure, si_structure],
+        ElectronPhononMaker().uniform_maker,
+        original_structure=si_structure,
+        supercell_structure=si_structure,
+        warm_start_dir="bulk",
+    )
+    static, non_scf = response.replace.jobs[0].jobs
+    assert static.function.__self__.warm_start
+    assert isinstance(static.function.__self__.input_set_generator, StaticSetGenerator)
+    assert static.function_kwargs["prev_vasp_dir"] == "bulk"
+    assert not non_scf.function.__self__.warm_start
+    assert len(response.replace.output["elapsed_times"][0]) == 2
@@ -0,0 +1,40 @@
+def test_uncompressed_file(tmp_dir):
+    import gzip
+    from pathlib import Path
+
+    from atomate2.vasp.jobs.amset import _uncompressed_file
+
+    Path("source").mkdir()
+    Path("source/WAVECAR").write_bytes(b"wavefunction")
+    with gzip.open("source/WAVECAR.gz", "wb") as f:
+        f.write(b"compressed wavefunction")
+
+    # uncompressed files are used in place
+    with _uncompressed_file(Path("source/WAVECAR")) as filename:
+        assert filename == Path("source/WAVECAR")
+    assert Path("source/WAVECAR").exists()
+
+    # compressed files are decompressed to the current directory and removed
+    with _uncompressed_file(Path("source/WAVECAR.gz")) as filename:
+        assert filename == Path("WAVECAR")
+        assert filename.read_bytes() == b"compressed wavefunction"
+    assert not Path("WAVECAR").exists()
+    assert Path("source/WAVECAR.gz").exists()
+
+
+def test_ibands_conversion():
+    import numpy as np
+    from pymatgen.electronic_structure.core import Spin
+
+    from atomate2.vasp.jobs.amset import _get_bands_string, _get_ibands_tuple
+
+    ibands = _get_ibands_tuple({Spin.up: np.array([3, 4, 5])})
+    assert ibands == ([3, 4, 5],)
+    assert isinstance(ibands[0][0], int)
+
+    ibands = _get_ibands_tuple({Spin.down: np.array([2, 3]), Spin.up: np.array([4])})
+    assert ibands == ([4], [2, 3])
+
+    # amset expects 1 indexed bands with spin channels separated by a full stop
+    assert _get_bands_string(([3, 4, 5],)) == "4,5,6"
+    assert _get_bands_string(ibands) == "5.3,4"
@@ -19,12 +19,40 @@ def test_sort_pos_dist():
     assert r == [(2, 2), (1, 1), (0, 0), (-1, -1), (-2, -2)]
 
 
-def test_CCDDocument(vasp_test_dir):
+def test_get_dQ(si_structure):
+    import numpy as np
+    import pytest
+
+    from atomate2.common.analysis.defects.schemas import get_dQ, get_dQs
+
+    def naive_dQ(ref, distorted):
+        sites = zip(ref, distorted)
+        return np.sqrt(sum(s.distance(d) ** 2 * s.specie.atomic_mass for s, d in sites))
+
+    distorted = si_structure.copy()
+    distorted.translate_sites([0], [-0.02, 0.01, 0.03], to_unit_cell=True)
+    shifted = distorted.copy()
+    shifted.translate_sites([1], [0.01, 0, 0], to_unit_cell=True)
+
+    assert get_dQ(si_structure, distorted) == pytest.approx(
+        naive_dQ(si_structure, distorted)
+    )
+
+    structures = [si_structure, distorted, shifted]
+    dQs = get_dQs(structures, structures[:2])
+    assert dQs.shape == (3, 2)
+    for i, j in np.ndindex(dQs.shape):
+        assert dQs[i, j] == pytest.approx(naive_dQ(structures[i], structures[j]))
+
+
+def test_CCDDocument(vasp_test_dir, memory_jobstore):
     """
     Test the CCDDocument schema
     """
     from collections import defaultdict
 
+    from monty.json import jsanitize
+
     from atomate2.common.analysis.defects.schemas import CCDDocument
     from atomate2.vasp.schemas.task import TaskDocument
 
@@ -83,3 +111,23 @@ def test_CCDDocument(vasp_test_dir):
     tasks = ccd_doc.get_taskdocs()
     assert len(tasks[0]) == 5
     assert len(tasks[1]) == 5
+    assert ccd_doc.static_uuids1 == ccd_doc.static_dirs1
+
+    # task documents obtained from the directories are cached on the document
+    assert ccd_doc.get_taskdocs()[0][0] is tasks[0][0]
+    assert "_taskdocs" not in ccd_doc.dict()
+
+    # directories without a summary can be parsed in parallel
+    parsed_tasks = ccd_doc.get_taskdocs(nworkers=2, use_cache=False)
+    assert parsed_tasks[1][-1].output.energy == ccd_doc.energies2[-1]
+
+    # task documents are fetched from the job store by uuid; outputs are sanitized
+    # in the same way as when a job is run
+    for task, uuid in zip(static_tasks1 + static_tasks2, static_dirs1 + static_dirs2):
+        task_doc = task.copy(update={"task_label": "stored"})
+        output = jsanitize(task_doc, strict=True, enum_values=True)
+        memory_jobstore.update({"uuid": uuid, "index": 1, "output": output})
+    stored_tasks = ccd_doc.get_taskdocs(store=memory_jobstore)
+    assert all(t.task_label == "stored" for t in stored_tasks[0] + stored_tasks[1])
+    assert stored_tasks[0][0].output.energy == ccd_doc.energies1[0]
+    assert stored_tasks[1][-1].output.energy == ccd_doc.energies2[-1]
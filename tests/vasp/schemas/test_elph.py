@@ -0,0 +1,62 @@
+def _get_band_structure(nkpoints, shift=0.0):
+    import numpy as np
+    from pymatgen.core import Lattice
+    from pymatgen.electronic_structure.bandstructure import BandStructure
+    from pymatgen.electronic_structure.core import Spin
+
+    lattice = Lattice.cubic(5).reciprocal_lattice
+    kpoints = np.linspace(0, 0.5, nkpoints)[:, None] * [1, 0, 0]
+    k = np.linspace(0, 1, nkpoints)
+
+    # 20 bands with a doubly degenerate VBM at 0 eV and CBM at 1 eV
+    bands = np.array(
+        [-10 + i - k for i in range(8)]
+        + [-k - shift, -k - shift]
+        + [1 + k + shift, 2 + k]
+        + [3 + i + k for i in range(8)]
+    )
+    return BandStructure(kpoints, {Spin.up: bands}, lattice, efermi=0.5)
+
+
+def test_band_edge_summary():
+    from atomate2.vasp.schemas.calculation import BandEdgeSummary
+
+    band_edges = BandEdgeSummary.from_band_structure(_get_band_structure(5), nbands=4)
+    assert band_edges.band_indices["up"] == list(range(6, 14))
+    assert len(band_edges.eigenvalues["up"]) == 8
+    assert band_edges.vbm == 0
+    assert band_edges.cbm == 1
+    assert not band_edges.is_metal
+
+
+def test_renormalisation_from_band_edges(si_structure):
+    import pytest
+
+    from atomate2.vasp.schemas.calculation import BandEdgeSummary
+    from atomate2.vasp.schemas.elph import ElectronPhononRenormalisationDoc
+
+    bulk = BandEdgeSummary.from_band_structure(_get_band_structure(5))
+
+    # displaced structures have lower symmetry and therefore more k-points
+    displaced = [
+        BandEdgeSummary.from_band_structure(_get_band_structure(nk, shift))
+        for nk, shift in ((5, 0.1), (9, 0.2))
+    ]
+    doc = ElectronPhononRenormalisationDoc.from_band_edges(
+        [100, 200],
+        displaced,
+        [si_structure] * 2,
+        ["a", "b"],
+        ["a", "b"],
+        bulk,
+        si_structure,
+        "c",
+        "c",
+        "d",
+        "d",
+        si_structure,
+    )
+    assert doc.bulk_band_gap == 1
+    assert doc.raw_data.bulk_vbm_band_indices == {"up": [8, 9]}
+    assert doc.raw_data.bulk_cbm_band_indices == {"up": [10]}
+    assert doc.delta_band_gaps == pytest.approx([0.2, 0.4])
@@ -51,3 +51,89 @@ def test_get_largest_relax_extension(vasp_test_dir):
     path = vasp_test_dir / "Si_band_structure" / "static" / "outputs"
     extension = get_largest_relax_extension(directory=path)
     assert extension == ""
+
+
+def test_apply_warm_start(vasp_test_dir, tmp_dir):
+    import gzip
+    import shutil
+    from pathlib import Path
+
+    from monty.serialization import loadfn
+    from pymatgen.io.vasp import Incar, Kpoints, Poscar
+
+    from atomate2.vasp.files import WARM_START_FILENAME, apply_warm_start
+    from atomate2.vasp.schemas.task import TaskDocument
+    from atomate2.vasp.summary import write_vasp_summary
+
+    path = vasp_test_dir / "Si_band_structure" / "static" / "outputs"
+    shutil.copytree(path, "parent")
+    with gzip.open("parent/CHGCAR.gz", "wt") as f:
+        f.write("charge density")
+    with gzip.open("parent/WAVECAR.gz", "wb") as f:
+        f.write(b"")
+
+    Path("new").mkdir()
+    incar = Incar.from_file(path / "INCAR.gz")
+    incar.write_file("new/INCAR")
+    Poscar.from_file(path / "CONTCAR.gz").write_file("new/POSCAR")
+
+    # the empty WAVECAR written when LWAVE = False is skipped
+    warm_start = apply_warm_start("parent", directory="new")
+    assert warm_start.files == ["CHGCAR"]
+    assert warm_start.reasons == []
+    assert Incar.from_file("new/INCAR")["ICHARG"] == 1
+    assert Path("new/CHGCAR").read_text() == "charge density"
+    assert not Path("new/WAVECAR").exists()
+    assert loadfn(f"new/{WARM_START_FILENAME}")["icharg"] == 1
+
+    # incompatible calculations are not warm started
+    incar.update({"ENCUT": incar.get("ENCUT", 520) + 100})
+    incar.write_file("new/INCAR")
+    warm_start = apply_warm_start("parent", directory="new")
+    assert warm_start.files == []
+    assert warm_start.reasons == ["different ENCUT"]
+    assert "ICHARG" not in Incar.from_file("new/INCAR")
+
+    # the k-points and symmetry must also match
+    incar = Incar.from_file(path / "INCAR.gz")
+    incar.update({"ISYM": 0, "KSPACING": 0.3})
+    incar.write_file("new/INCAR")
+    warm_start = apply_warm_start("parent", directory="new")
+    assert warm_start.reasons == ["different ISYM", "different KSPACING"]
+
+    # a KPOINTS file takes precedence over KSPACING
+    Kpoints.gamma_automatic((4, 4, 4)).write_file("new/KPOINTS")
+    warm_start = apply_warm_start("parent", directory="new")
+    assert warm_start.reasons == ["different ISYM", "different KPOINTS"]
+
+    # the parent k-points are read from the summary if available
+    Incar.from_file(path / "INCAR.gz").write_file("new/INCAR")
+    Kpoints.gamma_automatic((4, 4, 4)).write_file("parent/KPOINTS")
+    write_vasp_summary(TaskDocument.from_directory(path), directory="parent")
+    Path("parent/KPOINTS").unlink()
+    warm_start = apply_warm_start("parent", directory="new")
+    assert warm_start.reasons == []
+
+    Incar.from_file(path / "INCAR.gz").write_file("new/INCAR")
+    Kpoints.gamma_automatic((2, 2, 2)).write_file("new/KPOINTS")
+    warm_start = apply_warm_start("parent", directory="new")
+    assert warm_start.reasons == ["different KPOINTS"]
+
+
+def test_write_vasp_input_set_auto_parallel(si_structure, tmp_dir):
+    from monty.serialization import loadfn
+
+    from atomate2.vasp.files import write_vasp_input_set
+    from atomate2.vasp.resources import RESOURCE_ESTIMATE_FILENAME
+    from atomate2.vasp.sets.core import StaticSetGenerator
+
+    # the resources are planned for the cores available to the given command; NELECT
+    # is set as the POTCARs are not available
+    write_vasp_input_set(
+        si_structure,
+        StaticSetGenerator(user_incar_settings={"NELECT": 8}),
+        potcar_spec=True,
+        auto_parallel=True,
+        vasp_cmd="mpirun -np 24 vasp_std",
+    )
+    assert loadfn(RESOURCE_ESTIMATE_FILENAME)["cores"] == 24
@@ -0,0 +1,60 @@
+def _check_oszicar(scf_de, ionic_energies=()):
+    from pathlib import Path
+
+    from atomate2.vasp.handlers import ConvergenceTrendHandler
+
+    lines = []
+    for i, energy in enumerate(ionic_energies):
+        lines.append(f"DAV:   1    {energy:.10E}   {energy:.5E}   -0.1E+00  100")
+        lines.append(f"{i + 1:4d} F= {energy:.8E} E0= {energy:.8E}  d E =0.0")
+    for i, de in enumerate(scf_de):
+        lines.append(f"RMM: {i + 1:3d}   -0.1000000000E+02   {de:.5E}   -0.1E+00  100")
+    Path("OSZICAR").write_text("\n".join(lines) + "\n")
+
+    handler = ConvergenceTrendHandler()
+    return handler.errors if handler.check() else set()
+
+
+def test_convergence_trend_handler(tmp_dir):
+    from pymatgen.io.vasp import Incar
+
+    from atomate2.vasp.handlers import (
+        ConvergenceTrendHandler,
+        _get_ionic_fixes,
+        _get_scf_fixes,
+    )
+
+    Incar({"EDIFF": 1e-5, "IBRION": 2, "ALGO": "Fast"}).write_file("INCAR")
+    assert not ConvergenceTrendHandler().check()
+
+    assert _check_oszicar([10 ** (-0.1 * i) for i in range(60)]) == set()
+    assert _check_oszicar([(-1) ** i * 0.1 for i in range(60)]) == {"scf_oscillation"}
+    assert _check_oszicar([-0.1] * 60) == {"scf_stalled"}
+
+    # SCF trend is not checked until enough steps have been taken
+    assert _check_oszicar([-0.1] * 10) == set()
+
+    energies = [-10 + 0.01 * (-1) ** i for i in range(10)]
+    assert _check_oszicar([], energies) == {"ionic_oscillation"}
+    assert _check_oszicar([], [-10 - 0.01 * i for i in range(10)]) == set()
+
+    # oscillations within the relaxation convergence criterion are ignored
+    energies = [-10 + 1e-5 * (-1) ** i for i in range(10)]
+    assert _check_oszicar([], energies) == set()
+
+    incar = Incar({"ALGO": "Fast", "AMIX": 0.4, "BMIX": 1.0, "POTIM": 0.5})
+    assert _get_scf_fixes(incar, sloshing=True)[0] == {"AMIX": 0.1, "BMIX": 0.01}
+    assert _get_scf_fixes(incar, sloshing=False)[0] == {"ALGO": "All"}
+    assert _get_ionic_fixes(incar)[0] == {"POTIM": 0.25}
+    assert _get_ionic_fixes(incar)[-1]["IBRION"] == 1
+
+
+def test_default_handlers():
+    from atomate2.vasp.handlers import ConvergenceTrendHandler
+    from atomate2.vasp.run import _get_default_handlers
+
+    def has_trend_handler(handlers):
+        return any(isinstance(h, ConvergenceTrendHandler) for h in handlers)
+
+    assert not has_trend_handler(_get_default_handlers())
+    assert has_trend_handler(_get_default_handlers(convergence_trend=True))
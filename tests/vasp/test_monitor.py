@@ -0,0 +1,81 @@
+def test_file_tail(tmp_dir):
+    from pathlib import Path
+
+    from atomate2.vasp.monitor import FileTail
+
+    tail = FileTail("OSZICAR")
+    assert tail.read_lines() == []
+
+    Path("OSZICAR").write_text("line 1\nline")
+    assert tail.read_lines() == ["line 1"]
+
+    with open("OSZICAR", "a") as f:
+        f.write(" 2\nline 3\n")
+    assert tail.read_lines() == ["line 2", "line 3"]
+    assert tail.read_lines() == []
+
+    # file truncated by a restarted calculation
+    Path("OSZICAR").write_text("new\n")
+    assert tail.read_lines() == ["new"]
+    assert tail.nresets == 1
+
+
+def test_vasp_monitor(tmp_dir):
+    from pathlib import Path
+
+    from atomate2.vasp.monitor import VaspMonitor
+
+    oszicar = """       N       E                     dE             d eps       ncg
+DAV:   1     0.425437171870E+03    0.42544E+03   -0.13448E+04  1104   0.119E+03
+RMM:   2    -0.108384050000E+02   -0.43627E+03   -0.12345E+02  1104   0.119E+01
+   1 F= -.10838405E+02 E0= -.10838405E+02  d E =-.108384E+02  mag=     0.0000
+"""
+    outcar = """ total amount of memory used by VASP MPI-rank0    52852. kBytes
+      LOOP:  cpu time    3.5400: real time    3.6095
+      LOOP:  cpu time    3.5331: real time    3.5691
+     LOOP+:  cpu time    7.2000: real time    7.3000
+"""
+    records = []
+    with VaspMonitor(
+        interval=0.01, prometheus_file="vasp.prom", callback=records.append
+    ) as monitor:
+        Path("OSZICAR").write_text(oszicar)
+        Path("OUTCAR").write_text(outcar)
+
+    assert monitor._thread is None
+    types = [r["type"] for r in records]
+    assert types.count("scf") == 2
+    assert types.count("ionic") == 1
+    assert types.count("scf_timing") == 2
+    assert types.count("ionic_timing") == 1
+    assert types.count("memory") == 1
+
+    ionic = [r for r in records if r["type"] == "ionic"][0]
+    assert ionic["energy"] == -10.838405
+    assert ionic["scf_steps"] == 2
+
+    with open("vasp_monitor.jsonl") as f:
+        assert len(f.readlines()) == len(records)
+
+    prometheus = Path("vasp.prom").read_text()
+    assert "vasp_ionic_steps 1" in prometheus
+    assert "vasp_memory_kb 52852.0" in prometheus
+
+
+def test_vasp_monitor_restart(tmp_dir):
+    from pathlib import Path
+
+    from atomate2.vasp.monitor import VaspMonitor
+
+    records = []
+    monitor = VaspMonitor(interval=0.01, callback=records.append)
+    with monitor:
+        pass
+
+    with monitor:
+        Path("OSZICAR").write_text("   1 F= -.10838405E+02 E0= -.10838405E+02\n")
+        # a monitor that was not restarted would have exited immediately
+        monitor._thread.join(0.1)
+        assert monitor._thread.is_alive()
+
+    assert [r["type"] for r in records] == ["ionic"]
@@ -0,0 +1,19 @@
+def test_potcar_registry_from_file(vasp_test_dir):
+    from pymatgen.io.vasp import Potcar
+
+    from atomate2.vasp.potcar import PotcarRegistry
+
+    path = vasp_test_dir / "Si_old_double_relax" / "inputs" / "POTCAR"
+    registry = PotcarRegistry()
+    potcar1 = registry.from_file(path)
+    potcar2 = registry.from_file(path)
+    ref_potcar = Potcar.from_file(path)
+
+    assert potcar1 is not potcar2
+    assert potcar1[0] is potcar2[0]
+    assert potcar1.symbols == ref_potcar.symbols
+    assert potcar1.functional == ref_potcar.functional
+    assert registry.get_hash(potcar1[0]) == ref_potcar[0].get_potcar_hash()
+
+    registry.clear()
+    assert registry.from_file(path)[0] is not potcar1[0]
@@ -63,3 +63,29 @@ def test_update_user_settings(powerup, attribute, settings):
         getattr(flow.jobs[1].function.__self__.input_set_generator, attribute)
         != settings
     )
+
+
+def test_add_resource_hints(si_structure, monkeypatch):
+    import numpy as np
+
+    from atomate2.vasp.flows.core import DoubleRelaxMaker
+    from atomate2.vasp.powerups import add_resource_hints
+    from atomate2.vasp.resources import ResourceModel
+    from atomate2.vasp.sets.base import VaspInputGenerator
+
+    monkeypatch.setattr(VaspInputGenerator, "get_nelect", lambda *_, **__: 8)
+    model = ResourceModel(
+        run_types=["PBE"],
+        time_coefficients=[1, 0, 0, 0, 0, 0, 0, 0, 0],
+        memory_coefficients=[2, 0, 0, 0, 0, 0, 0, 0, 0],
+    )
+
+    flow = DoubleRelaxMaker().make(si_structure)
+    flow = add_resource_hints(flow, model, cores=8)
+
+    # only the first job has a known structure
+    hints = flow.jobs[0].metadata["resource_hints"]
+    assert hints["cores"] == 8
+    assert hints["elapsed_time"] == pytest.approx(np.exp(1))
+    assert hints["max_memory"] == pytest.approx(np.exp(2))
+    assert "resource_hints" not in flow.jobs[1].metadata
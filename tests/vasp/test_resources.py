@@ -0,0 +1,102 @@
+def test_estimate_resources(si_structure, tmp_dir):
+    from pathlib import Path
+
+    from monty.serialization import loadfn
+
+    from atomate2.vasp.resources import (
+        RESOURCE_ESTIMATE_FILENAME,
+        apply_resource_estimate,
+        estimate_resources,
+    )
+    from atomate2.vasp.sets.core import StaticSetGenerator
+
+    vis = StaticSetGenerator().get_input_set(si_structure, potcar_spec=True)
+    estimate = estimate_resources(vis, cores=16, nelect=8)
+
+    assert estimate.cores == 16
+    assert 16 % estimate.kpar == 0
+    assert estimate.kpar <= estimate.nkpoints
+    assert (16 // estimate.kpar) % estimate.ncore == 0
+    assert estimate.nbands >= 4
+    assert all(n > 0 for n in estimate.fft_grid)
+    assert estimate.max_memory > 0
+    assert estimate.elapsed_time > 0
+
+    # more cores should give a faster calculation
+    assert estimate_resources(vis, cores=64, nelect=8).elapsed_time < (
+        estimate.elapsed_time
+    )
+
+    apply_resource_estimate(vis, estimate)
+    assert vis.incar["KPAR"] == estimate.kpar
+    assert vis.incar["NCORE"] == estimate.ncore
+    assert Path(RESOURCE_ESTIMATE_FILENAME).exists()
+    assert loadfn(RESOURCE_ESTIMATE_FILENAME)["kpar"] == estimate.kpar
+
+    # user specified parallelisation settings are not overridden
+    vis.incar.pop("KPAR")
+    vis.incar["NCORE"] = 3
+    apply_resource_estimate(vis, estimate)
+    assert vis.incar["NCORE"] == 3
+    assert "KPAR" not in vis.incar
+
+
+def test_get_available_cores(monkeypatch):
+    from atomate2.vasp.resources import get_available_cores
+
+    assert get_available_cores("mpirun -np 24 vasp_std") == 24
+    assert get_available_cores("srun --ntasks=48 vasp_std") == 48
+
+    monkeypatch.setenv("SLURM_NTASKS", "12")
+    assert get_available_cores("vasp_std") == 12
+
+
+def _get_fake_task_doc(natoms, nkpoints, cores, run_type="PBE"):
+    elapsed_time = 10 * natoms**2 * nkpoints / cores
+    return {
+        "nsites": natoms,
+        "run_stats": {
+            "overall": {
+                "elapsed_time": elapsed_time,
+                "max_memory": 1e5 * natoms,
+                "cores": cores,
+            }
+        },
+        "calcs_reversed": [
+            {
+                "run_type": run_type,
+                "input": {
+                    "nkpoints": nkpoints,
+                    "parameters": {"ENCUT": 520, "NBANDS": 4 * natoms, "ISPIN": 1},
+                },
+            }
+        ],
+    }
+
+
+def test_resource_model(si_structure):
+    import pytest
+
+    from atomate2.vasp.resources import ResourceModel
+    from atomate2.vasp.sets.core import StaticSetGenerator
+
+    docs = [
+        _get_fake_task_doc(natoms, nkpoints, cores)
+        for natoms in (2, 8, 32)
+        for nkpoints in (1, 10, 100)
+        for cores in (4, 16, 64)
+    ]
+    docs.append({"nsites": 2, "run_stats": None, "calcs_reversed": []})
+    model = ResourceModel.from_task_documents(docs)
+    assert model.nsamples == 27
+    assert model.run_types == ["PBE"]
+
+    vis = StaticSetGenerator().get_input_set(si_structure, potcar_spec=True)
+    fast = model.predict(vis, cores=16, nelect=8, nstd=0)
+    slow = model.predict(vis, cores=4, nelect=8, nstd=0)
+    assert fast["cores"] == 16
+    assert slow["elapsed_time"] > fast["elapsed_time"]
+    assert fast["max_memory"] == pytest.approx(slow["max_memory"], rel=0.2)
+
+    with pytest.raises(ValueError):
+        ResourceModel.from_task_documents([])
@@ -0,0 +1,26 @@
+def test_get_input_set_cache(si_structure):
+    from atomate2.vasp.sets.base import _input_set_cache, clear_input_set_cache
+    from atomate2.vasp.sets.core import StaticSetGenerator
+
+    clear_input_set_cache()
+    generator = StaticSetGenerator()
+    vis1 = generator.get_input_set(si_structure, potcar_spec=True)
+    assert len(_input_set_cache) == 1
+
+    # modifying the returned input set must not change the cached version
+    vis1.incar["NSW"] = 100
+    vis2 = generator.get_input_set(si_structure, potcar_spec=True)
+    assert len(_input_set_cache) == 1
+    assert vis2.incar.get("NSW") != 100
+
+    # changing the generator settings or structure must give a new input set
+    generator = StaticSetGenerator(user_incar_settings={"ENCUT": 600})
+    vis3 = generator.get_input_set(si_structure, potcar_spec=True)
+    assert vis3.incar["ENCUT"] == 600
+
+    si_structure.perturb(0.01)
+    generator.get_input_set(si_structure, potcar_spec=True)
+    assert len(_input_set_cache) == 3
+
+    clear_input_set_cache()
+    assert len(_input_set_cache) == 0
@@ -0,0 +1,50 @@
+def test_vasp_summary(vasp_test_dir, tmp_dir):
+    from pathlib import Path
+
+    from pymatgen.io.vasp import Kpoints, Poscar
+
+    from atomate2.vasp.schemas.task import TaskDocument
+    from atomate2.vasp.summary import (
+        SUMMARY_FILENAME,
+        get_summary_structure,
+        get_summary_task_document,
+        load_vasp_summary,
+        write_vasp_summary,
+    )
+
+    assert load_vasp_summary() is None
+
+    dir_name = vasp_test_dir / "Si_band_structure" / "static" / "outputs"
+    task_doc = TaskDocument.from_directory(dir_name)
+    Path("OUTCAR").write_text("test")
+    write_vasp_summary(task_doc)
+    assert Path(f"{SUMMARY_FILENAME}.gz").exists()
+
+    summary = load_vasp_summary()
+    assert summary["version"] == 2
+    assert summary["bandgap"] == task_doc.output.bandgap
+    assert summary["energy"] == task_doc.output.energy
+    assert summary["incar"]["ISPIN"] == task_doc.calcs_reversed[0].input.incar["ISPIN"]
+    assert summary["relax_extension"] == ""
+    assert summary["initial_scf_steps"] > 0
+    assert summary["files"]["OUTCAR"]["size"] == 4
+    assert summary["files"]["OUTCAR"]["mtime"] > 0
+    assert summary["files"]["OUTCAR"]["sha256"] is None
+    assert summary["kpoints"] is None
+
+    structure = get_summary_structure(summary)
+    assert structure == Poscar.from_file(dir_name / "CONTCAR.gz").structure
+    assert "magmom" not in structure.site_properties
+
+    # the task document and file hashes are only included if requested
+    assert get_summary_task_document(summary) is None
+
+    Kpoints.gamma_automatic((4, 4, 4)).write_file("KPOINTS")
+    write_vasp_summary(task_doc, include_task_document=True, hash_files=True)
+    summary = load_vasp_summary()
+    assert summary["kpoints"]["kpoints"] == [[4, 4, 4]]
+    assert len(summary["files"]["OUTCAR"]["sha256"]) == 64
+
+    summary_doc = get_summary_task_document(summary)
+    assert isinstance(summary_doc, TaskDocument)
+    assert summary_doc.output.energy == task_doc.output.energy